@@ -1,15 +1,19 @@
 from .app_config import AppConfig as AppConfig, Config as Config
 from .keepalive_executor import (
     KeepaliveMessage as KeepaliveMessage,
+    KeepaliveScheduler as KeepaliveScheduler,
     TResponseType as TResponseType,
     execute_with_keepalive as execute_with_keepalive,
+    get_keepalive_scheduler as get_keepalive_scheduler,
 )
+from .metrics import UNMATCHED_ROUTE as UNMATCHED_ROUTE, Metrics as Metrics
 from .module_loader import ModuleLoader as ModuleLoader
 from .redis_streams_event_handler import (
     MaxWaitExceededError as MaxWaitExceededError,
     RedisStreamsEventHandler as RedisStreamsEventHandler,
 )
 from .redis_streams_event_publisher import (
+    AsyncRedisStreamsEventPublisher as AsyncRedisStreamsEventPublisher,
     RedisStreamsEventPublisher as RedisStreamsEventPublisher,
 )
 from .singleton import Singleton as Singleton
@@ -19,6 +23,7 @@ from .telemetry import (
     TA_OTEL_ENDPOINT as TA_OTEL_ENDPOINT,
     TA_TELEMETRY_ENABLED as TA_TELEMETRY_ENABLED,
     Telemetry as Telemetry,
+    get_metrics as get_metrics,
     get_telemetry as get_telemetry,
     initialize_telemetry as initialize_telemetry,
 )
@@ -1,5 +1,8 @@
 import asyncio
+import heapq
 import logging
+import math
+import weakref
 from collections.abc import AsyncGenerator, Coroutine
 from typing import Any, TypeVar
 
@@ -13,61 +16,114 @@ class KeepaliveMessage(BaseModel):
 TResponseType = TypeVar("TResponseType")  # Return type of the main task
 
 
+class KeepaliveScheduler:
+    """A timer shared by all keepalive streams of an event loop.
+
+    Deadlines are rounded up to ``resolution`` seconds so streams due at about
+    the same time share a slot, and only the earliest slot has a timer handle
+    scheduled on the loop at any time.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, resolution: float = 0.1):
+        self._loop = loop
+        self._resolution = resolution
+        self._slots: dict[float, list[asyncio.Future[None]]] = {}
+        self._deadlines: list[float] = []
+        self._handle: asyncio.TimerHandle | None = None
+        self._next_deadline: float | None = None
+
+    def wait_until(self, deadline: float) -> asyncio.Future[None]:
+        """Returns a future completed at (or shortly after) ``deadline``.
+
+        Cancel the future once it is no longer needed.
+        """
+        slot = math.ceil(deadline / self._resolution) * self._resolution
+        waiter: asyncio.Future[None] = self._loop.create_future()
+        if slot not in self._slots:
+            self._slots[slot] = []
+            heapq.heappush(self._deadlines, slot)
+        self._slots[slot].append(waiter)
+        if self._next_deadline is None or slot < self._next_deadline:
+            self._schedule(slot)
+        return waiter
+
+    def _schedule(self, deadline: float) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._next_deadline = deadline
+        self._handle = self._loop.call_at(deadline, self._fire)
+
+    def _fire(self) -> None:
+        self._handle = None
+        self._next_deadline = None
+        now = self._loop.time()
+        while self._deadlines and self._deadlines[0] <= now:
+            for waiter in self._slots.pop(heapq.heappop(self._deadlines)):
+                if not waiter.done():
+                    waiter.set_result(None)
+        if self._deadlines:
+            self._schedule(self._deadlines[0])
+
+
+_schedulers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, KeepaliveScheduler] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_keepalive_scheduler() -> KeepaliveScheduler:
+    """Returns the keepalive scheduler of the running event loop."""
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = KeepaliveScheduler(loop)
+        _schedulers[loop] = scheduler
+    return scheduler
+
+
 async def execute_with_keepalive(
     task_coro: Coroutine[Any, Any, TResponseType],
     keepalive_interval_seconds: float = 30.0,
-    keepalive_poll_interval_seconds: float = 1.0,
+    keepalive_poll_interval_seconds: float | None = None,
     logger: logging.Logger | None = None,
 ) -> AsyncGenerator[KeepaliveMessage | TResponseType, None]:
     """
     Executes a long-running coroutine while periodically yielding keepalive messages.
 
+    Nothing is polled: the task is awaited together with the next keepalive
+    deadline of the loop's shared ``KeepaliveScheduler``, so the result is
+    yielded as soon as the task completes. If the generator is closed before
+    then, the task is cancelled.
+
     Args:
         task_coro: The coroutine to execute
         keepalive_interval_seconds: Seconds between keepalive messages
-        keepalive_poll_interval_seconds: How frequently to check the queue
+        keepalive_poll_interval_seconds: Deprecated and ignored
         logger: Optional logger for error reporting
 
     Yields:
         Keepalive messages while the task is running and the final task result when complete
     """
-    keepalive_queue: asyncio.Queue[KeepaliveMessage] = asyncio.Queue()
-
-    async def run_keepalive() -> None:
-        try:
-            while True:
-                await asyncio.sleep(keepalive_interval_seconds)
-                keepalive_queue.put_nowait(KeepaliveMessage())
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            if logger:
-                logger.error(f"Keepalive exception: {e}")
-
-    keepalive_task: asyncio.Task[None] | None = asyncio.create_task(run_keepalive())
+    loop = asyncio.get_running_loop()
+    scheduler = get_keepalive_scheduler()
+    main_task: asyncio.Task[TResponseType] = asyncio.create_task(task_coro)
     try:
-        main_task: asyncio.Task[TResponseType] = asyncio.create_task(task_coro)
-        while not main_task.done():
+        while True:
+            keepalive = scheduler.wait_until(loop.time() + keepalive_interval_seconds)
             try:
-                message: KeepaliveMessage = await asyncio.wait_for(
-                    keepalive_queue.get(), keepalive_poll_interval_seconds
-                )
-                yield message
-            except TimeoutError:
-                pass
+                await asyncio.wait((main_task, keepalive), return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                keepalive.cancel()
+            if main_task.done():
+                break
+            yield KeepaliveMessage()
 
         # Get and yield the final result
-        result: TResponseType = await main_task
+        result: TResponseType = main_task.result()
         yield result
     except Exception as e:
         if logger:
             logger.error(f"Task exception: {e}")
         raise
     finally:
-        # Always ensure keepalive task is cancelled
-        if keepalive_task and not keepalive_task.done():
-            keepalive_task.cancel()
-            try:
-                await asyncio.wait_for(keepalive_task, 1.0)
-            except (asyncio.CancelledError, TimeoutError):
-                pass
+        if not main_task.done():
+            main_task.cancel()
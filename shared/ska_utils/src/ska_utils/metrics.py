@@ -0,0 +1,149 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from opentelemetry.metrics import Histogram, Meter
+
+METRIC_PREFIX = "ta."
+# Route recorded for requests that matched none of the app's routes
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Metrics:
+    """Instruments for the hot paths shared by all services.
+
+    Durations are recorded in milliseconds. Every instrument name starts with
+    ``METRIC_PREFIX`` so the meter provider's views can keep them while
+    dropping other libraries' instruments. When telemetry is disabled the
+    meter is a no-op and recording costs next to nothing.
+    """
+
+    def __init__(self, meter: Meter):
+        self.llm_call_duration = meter.create_histogram(
+            f"{METRIC_PREFIX}llm.call.duration",
+            unit="ms",
+            description="Duration of chat completion calls to the model",
+        )
+        self.llm_time_to_first_token = meter.create_histogram(
+            f"{METRIC_PREFIX}llm.time_to_first_token",
+            unit="ms",
+            description="Time until the first token of a response is received",
+        )
+        self.llm_tokens = meter.create_counter(
+            f"{METRIC_PREFIX}llm.tokens",
+            unit="{token}",
+            description="Tokens sent to (input) and received from (output) the model",
+        )
+        self.tool_call_duration = meter.create_histogram(
+            f"{METRIC_PREFIX}tool.call.duration",
+            unit="ms",
+            description="Duration of tool (kernel function) calls",
+        )
+        self.state_store_duration = meter.create_histogram(
+            f"{METRIC_PREFIX}state_store.duration",
+            unit="ms",
+            description="Duration of state store operations",
+        )
+        self.agent_gateway_duration = meter.create_histogram(
+            f"{METRIC_PREFIX}agent_gateway.duration",
+            unit="ms",
+            description="Duration of agent calls made through the agent gateway",
+        )
+        self.http_time_to_first_byte = meter.create_histogram(
+            f"{METRIC_PREFIX}http.server.time_to_first_byte",
+            unit="ms",
+            description="Time until the response headers of a request are sent",
+        )
+        self.http_response_duration = meter.create_histogram(
+            f"{METRIC_PREFIX}http.server.duration",
+            unit="ms",
+            description="Time until the last chunk of a response body is sent",
+        )
+        self.task_cache_lookups = meter.create_counter(
+            f"{METRIC_PREFIX}task_cache.lookups",
+            unit="{lookup}",
+            description="Task result cache lookups, by whether a result was found",
+        )
+        self.in_flight_requests = meter.create_up_down_counter(
+            f"{METRIC_PREFIX}http.server.active_requests",
+            unit="{request}",
+            description="Requests currently being served",
+        )
+
+    @staticmethod
+    @contextmanager
+    def _timed(histogram: Histogram, attributes: dict[str, str]) -> Iterator[None]:
+        start = time.perf_counter()
+        error = False
+        try:
+            yield
+        except Exception:
+            error = True
+            raise
+        finally:
+            histogram.record((time.perf_counter() - start) * 1000, {**attributes, "error": error})
+
+    def record_llm_call(
+        self,
+        model: str,
+        duration_ms: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+    ) -> None:
+        self.llm_call_duration.record(duration_ms, {"model": model})
+        self.record_tokens(model, prompt_tokens, completion_tokens)
+
+    def record_time_to_first_token(self, model: str, duration_ms: float) -> None:
+        self.llm_time_to_first_token.record(duration_ms, {"model": model})
+
+    def record_tokens(self, model: str, prompt_tokens: int, completion_tokens: int) -> None:
+        if prompt_tokens:
+            self.llm_tokens.add(prompt_tokens, {"model": model, "direction": "input"})
+        if completion_tokens:
+            self.llm_tokens.add(completion_tokens, {"model": model, "direction": "output"})
+
+    def record_task_cache_lookup(self, hit: bool) -> None:
+        self.task_cache_lookups.add(1, {"hit": hit})
+
+    def time_llm_call(self, model: str):
+        return self._timed(self.llm_call_duration, {"model": model})
+
+    def time_tool_call(self, plugin: str, function: str):
+        return self._timed(self.tool_call_duration, {"plugin": plugin, "function": function})
+
+    def time_state_store(self, store: str, operation: str):
+        return self._timed(self.state_store_duration, {"store": store, "operation": operation})
+
+    def time_agent_gateway(self, agent: str):
+        return self._timed(self.agent_gateway_duration, {"agent": agent})
+
+    def record_http_response(
+        self,
+        route: str,
+        status_code: int | None,
+        time_to_first_byte_ms: float | None,
+        duration_ms: float,
+    ) -> None:
+        """Records the timings of a served request.
+
+        ``route`` must be the route template, e.g. ``/{instance_id}``, and
+        never the raw request path: every distinct value is a new time series.
+        Requests that matched no route are recorded as ``UNMATCHED_ROUTE``.
+        """
+        attributes = {"route": route, "status_code": status_code or 0}
+        if time_to_first_byte_ms is not None:
+            self.http_time_to_first_byte.record(time_to_first_byte_ms, attributes)
+        self.http_response_duration.record(duration_ms, attributes)
+
+    @contextmanager
+    def track_in_flight(self) -> Iterator[None]:
+        """Counts a request as in flight while it's served.
+
+        The route isn't known before the request is routed, so requests are
+        counted without one.
+        """
+        self.in_flight_requests.add(1)
+        try:
+            yield
+        finally:
+            self.in_flight_requests.add(-1)
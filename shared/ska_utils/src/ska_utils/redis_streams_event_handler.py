@@ -1,16 +1,25 @@
 import asyncio
+import inspect
 import logging
 import threading
+import time
 import typing
 import uuid
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
+import redis.asyncio as aredis
 from pydantic import BaseModel, TypeAdapter
 from redis import Redis
-from redis.exceptions import ResponseError
+from redis.connection import SSLConnection, UnixDomainSocketConnection
+from redis.exceptions import (
+    ConnectionError as RedisConnectionError,
+    ResponseError,
+    TimeoutError as RedisTimeoutError,
+)
 
 StreamsType = list[tuple[bytes, list[tuple[bytes, dict[bytes, bytes]]]]]
+EntryType = tuple[bytes | str, dict]
 
 TEventType = TypeVar("TEventType")
 
@@ -19,21 +28,50 @@ class MaxWaitExceededError(Exception):
     pass
 
 
+def _as_str(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
 class RedisStreamsEventHandler(ABC, Generic[TEventType]):
+    """Consumes events from a Redis Stream as a member of a consumer group.
+
+    Events are read in batches and up to ``max_concurrency`` of them are
+    processed at once on the handler's own thread and event loop. An event is
+    acknowledged only once ``process_event`` returns; events left pending for
+    longer than ``claim_idle_ms`` (by this or a dead consumer) are reclaimed
+    with XAUTOCLAIM and retried. Events that cannot be decoded, or that have
+    been delivered ``max_deliveries`` times without success, are moved to a
+    dead-letter stream.
+    """
+
     def __init__(
         self,
         topic_name: str,
-        r: Redis,
+        r: Redis | aredis.Redis,
         event_types: type[TEventType],
         max_message_wait: int = -1,
+        batch_size: int = 10,
+        max_concurrency: int = 10,
+        claim_idle_ms: int = 60000,
+        max_deliveries: int = 5,
+        dead_letter_topic: str | None = None,
     ):
         self._topic_name = topic_name
         self._group_name = f"{self._topic_name}/consumers"
         self._consumer_name = str(uuid.uuid4().hex)
+        self._dead_letter_topic = dead_letter_topic or f"{self._topic_name}/dead-letter"
         self._r = r
+        self._ar: aredis.Redis | None = None
         self._shutdown = True
         self._t: threading.Thread | None = None
         self._max_message_wait = max_message_wait
+        self._batch_size = batch_size
+        self._max_concurrency = max_concurrency
+        self._claim_idle_ms = claim_idle_ms
+        self._max_deliveries = max_deliveries
+        self._claim_cursor = "0-0"
+        self._last_claim = 0.0
+        self._in_flight: set[asyncio.Task] = set()
         self._logger = logging.getLogger(__name__)
         self._event_types = RedisStreamsEventHandler._validate_event_types(event_types)
         self._type_adapter = RedisStreamsEventHandler._get_type_adapter_for_event_types(event_types)
@@ -95,9 +133,40 @@ class RedisStreamsEventHandler(ABC, Generic[TEventType]):
     async def process_event(self, event: TEventType) -> None:
         pass  # pragma: no cover
 
-    def _create_consumer_group(self):
+    def _create_async_client(self) -> aredis.Redis:
+        """Creates a client for the handler's event loop with the settings of ``r``.
+
+        Async connections are bound to the loop that opened them, so the
+        handler never shares its client with the caller's loop.
+        """
+        pool = self._r.connection_pool
+        if isinstance(self._r, aredis.Redis):
+            connection_class = pool.connection_class
+            kwargs = dict(pool.connection_kwargs)
+        else:
+            if issubclass(pool.connection_class, SSLConnection):
+                connection_class = aredis.SSLConnection
+            elif issubclass(pool.connection_class, UnixDomainSocketConnection):
+                connection_class = aredis.UnixDomainSocketConnection
+            else:
+                connection_class = aredis.Connection
+            accepted = set()
+            for cls in connection_class.__mro__:
+                if "__init__" in cls.__dict__:
+                    accepted.update(inspect.signature(cls.__init__).parameters)
+            # Retry policies and connect callbacks of the sync client can't be reused
+            kwargs = {
+                key: value
+                for key, value in pool.connection_kwargs.items()
+                if key in accepted and key not in ("retry", "redis_connect_func")
+            }
+        return aredis.Redis(
+            connection_pool=aredis.ConnectionPool(connection_class=connection_class, **kwargs)
+        )
+
+    async def _create_consumer_group(self):
         try:
-            result = self._r.xgroup_create(self._topic_name, self._group_name, 0, True)
+            result = await self._ar.xgroup_create(self._topic_name, self._group_name, 0, True)
             if result:
                 self._logger.info(f"Consumer group {self._group_name} created successfully")
             else:
@@ -108,61 +177,132 @@ class RedisStreamsEventHandler(ABC, Generic[TEventType]):
             else:
                 raise e
 
-    # noinspection PyTypeChecker
-    def _decode_event(self, event: StreamsType) -> tuple[str, TEventType]:
+    def _decode_event(self, fields: dict) -> TEventType:
         try:
-            event_id = event[0][1][0][0].decode()
-            event_data_str = event[0][1][0][1][b"event_data"].decode()
-            invoke_event = self._type_adapter.validate_json(event_data_str)
-            return event_id, invoke_event
+            event_data = fields.get(b"event_data", fields.get("event_data"))
+            return self._type_adapter.validate_json(_as_str(event_data))
         except Exception as e:
             self._logger.error(f"Error decoding event: {e}")
             raise e
 
-    def _get_next_message(self) -> TEventType | None:
+    async def _read_new(self, count: int) -> list[EntryType]:
         block = (self._max_message_wait * 1000) if self._max_message_wait > -1 else 1000
 
-        result: StreamsType = self._r.xreadgroup(
+        result: StreamsType = await self._ar.xreadgroup(
             streams={self._topic_name: ">"},
             groupname=self._group_name,
             consumername=self._consumer_name,
-            count=1,
+            count=count,
             block=block,
         )
 
         if not result:
             if self._max_message_wait > -1:
                 raise MaxWaitExceededError()
+            return []
+        return result[0][1]
+
+    async def _claim_stale(self, count: int) -> list[EntryType]:
+        """Takes over events another consumer (or a failed attempt) left pending."""
+        now = time.monotonic()
+        if now - self._last_claim < self._claim_idle_ms / 1000:
+            return []
+        self._last_claim = now
+
+        next_cursor, entries, *_ = await self._ar.xautoclaim(
+            self._topic_name,
+            self._group_name,
+            self._consumer_name,
+            min_idle_time=self._claim_idle_ms,
+            start_id=self._claim_cursor,
+            count=count,
+        )
+        self._claim_cursor = _as_str(next_cursor)
+
+        claimed = []
+        for event_id, fields in entries:
+            if await self._delivery_count(event_id) > self._max_deliveries:
+                await self._dead_letter(event_id, fields, "Maximum deliveries exceeded")
             else:
-                return None
+                claimed.append((event_id, fields))
+        if claimed:
+            self._logger.info(f"Reclaimed {len(claimed)} stale event(s)")
+        return claimed
+
+    async def _delivery_count(self, event_id: bytes | str) -> int:
+        pending = await self._ar.xpending_range(
+            self._topic_name, self._group_name, min=event_id, max=event_id, count=1
+        )
+        return pending[0]["times_delivered"] if pending else 0
+
+    async def _dead_letter(self, event_id: bytes | str, fields: dict, reason: str) -> None:
+        self._logger.error(f"Moving event {_as_str(event_id)} to dead-letter stream: {reason}")
+        async with self._ar.pipeline(transaction=True) as pipe:
+            pipe.xadd(
+                self._dead_letter_topic,
+                {**fields, "original_id": event_id, "error": reason},
+            )
+            pipe.xack(self._topic_name, self._group_name, event_id)
+            await pipe.execute()
+
+    async def _handle_entry(self, event_id: bytes | str, fields: dict) -> None:
+        try:
+            event = self._decode_event(fields)
+        except Exception as e:
+            await self._dead_letter(event_id, fields, f"Error decoding event: {e}")
+            return
 
         try:
-            event_id, invoke_event = self._decode_event(result)
-            self._r.xack(self._topic_name, self._group_name, event_id)
-            return invoke_event
+            await self.process_event(event)
         except Exception as e:
-            self._logger.error(f"Error decoding event {e} - Possible abandoned message")
-            return None
+            self._logger.error(f"Error processing event {_as_str(event_id)}: {e}")
+            # Left pending, the event is retried once it is reclaimed
+            if await self._delivery_count(event_id) >= self._max_deliveries:
+                await self._dead_letter(event_id, fields, f"Error processing event: {e}")
+            return
+
+        await self._ar.xack(self._topic_name, self._group_name, event_id)
+
+    def _dispatch(self, event_id: bytes | str, fields: dict) -> None:
+        task = asyncio.create_task(self._handle_entry(event_id, fields))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
 
     def _listen_and_process(self):
         asyncio.run(self._a_listen_and_process())
 
     async def _a_listen_and_process(self):
         self._shutdown = False
+        self._ar = self._create_async_client()
         try:
-            self._create_consumer_group()
+            await self._create_consumer_group()
         except Exception as e:
             self._shutdown = True
+            await self._ar.aclose()
             raise e
 
-        while not self._shutdown:
-            try:
-                event = self._get_next_message()
-            except MaxWaitExceededError:
-                self._logger.info("Max wait time exceeded, no message received")
-                self._shutdown = True
-                break
-            if not event:
-                continue  # pragma: no cover
-            await self.process_event(event)
+        try:
+            while not self._shutdown:
+                available = self._max_concurrency - len(self._in_flight)
+                if available <= 0:
+                    await asyncio.wait(self._in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+                count = min(self._batch_size, available)
+                try:
+                    entries = await self._claim_stale(count) or await self._read_new(count)
+                except MaxWaitExceededError:
+                    # Events already dispatched are drained before shutting down
+                    self._logger.info("Max wait time exceeded, no message received")
+                    self._shutdown = True
+                    break
+                except (RedisConnectionError, RedisTimeoutError) as e:
+                    self._logger.error(f"Error reading events, retrying: {e}")
+                    await asyncio.sleep(1)
+                    continue
+                for event_id, fields in entries:
+                    self._dispatch(event_id, fields)
+        finally:
+            if self._in_flight:
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
+            await self._ar.aclose()
         self._logger.info("Event handler shutdown completed")
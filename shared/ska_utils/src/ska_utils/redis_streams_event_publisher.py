@@ -1,9 +1,128 @@
+import asyncio
+import contextlib
+import logging
+
+import redis.asyncio as aredis
 from redis import Redis
 
 
 class RedisStreamsEventPublisher:
-    def __init__(self, r: Redis):
+    def __init__(self, r: Redis, max_len: int | None = None):
         self._r = r
+        self._max_len = max_len
 
     def publish_event(self, topic_name: str, event_data: str):
-        self._r.xadd(name=topic_name, fields={"event_data": event_data})
+        if self._max_len is None:
+            self._r.xadd(name=topic_name, fields={"event_data": event_data})
+        else:
+            self._r.xadd(
+                name=topic_name,
+                fields={"event_data": event_data},
+                maxlen=self._max_len,
+                approximate=True,
+            )
+
+
+class AsyncRedisStreamsEventPublisher:
+    """Buffers events and publishes them to Redis Streams in pipelined batches.
+
+    Buffered events are flushed in one round trip once ``max_batch_size`` are
+    waiting or ``flush_interval`` seconds after the first of them was
+    published, whichever comes first. Streams are trimmed to roughly
+    ``max_len`` entries (``MAXLEN ~``), overridable per topic with
+    ``topic_max_len``. Call ``close`` (or use the publisher as an async
+    context manager) to flush what is left before shutting down.
+
+    Events of a batch that fails to be sent are put back in the buffer and
+    sent again with the next flush, so an event may be published more than
+    once. While Redis is unavailable at most ``max_buffer_size`` events are
+    kept, dropping the oldest.
+    """
+
+    def __init__(
+        self,
+        r: aredis.Redis,
+        max_batch_size: int = 100,
+        flush_interval: float = 0.05,
+        max_len: int | None = None,
+        topic_max_len: dict[str, int] | None = None,
+        max_buffer_size: int = 10000,
+    ):
+        self._r = r
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._max_len = max_len
+        self._topic_max_len = topic_max_len or {}
+        self._max_buffer_size = max(max_buffer_size, max_batch_size)
+        self._buffer: list[tuple[str, str]] = []
+        self._flush_lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+        self._closed = False
+        self._logger = logging.getLogger(__name__)
+
+    async def __aenter__(self) -> "AsyncRedisStreamsEventPublisher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def publish_event(self, topic_name: str, event_data: str) -> None:
+        if self._closed:
+            raise RuntimeError("Publisher is closed.")
+        self._buffer.append((topic_name, event_data))
+        if len(self._buffer) >= self._max_batch_size:
+            await self.flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        self._timer = None
+        try:
+            await self.flush()
+        except Exception as e:
+            self._logger.error(f"Error flushing events: {e}")
+            if not self._closed:
+                self._schedule_flush()
+
+    def _requeue(self, events: list[tuple[str, str]]) -> None:
+        self._buffer = events + self._buffer
+        dropped = len(self._buffer) - self._max_buffer_size
+        if dropped > 0:
+            self._logger.warning(f"Event buffer full, dropping {dropped} oldest events")
+            del self._buffer[:dropped]
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            events, self._buffer = self._buffer, []
+            if not events:
+                return
+            try:
+                async with self._r.pipeline(transaction=False) as pipe:
+                    for topic_name, event_data in events:
+                        max_len = self._topic_max_len.get(topic_name, self._max_len)
+                        pipe.xadd(
+                            name=topic_name,
+                            fields={"event_data": event_data},
+                            maxlen=max_len,
+                            approximate=max_len is not None,
+                        )
+                    await pipe.execute()
+            except Exception:
+                self._requeue(events)
+                raise
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._timer
+            self._timer = None
+        await self.flush()
@@ -1,6 +1,6 @@
 import logging
 
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from opentelemetry._logs import set_logger_provider
 from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
 from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
@@ -20,7 +20,7 @@ from opentelemetry.sdk.metrics.export import (
 )
 from opentelemetry.sdk.metrics.view import DropAggregation, View
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace import SpanLimits, SpanProcessor, TracerProvider
 from opentelemetry.sdk.trace.export import (
     BatchSpanProcessor,
     ConsoleSpanExporter,
@@ -29,19 +29,71 @@ from opentelemetry.sdk.trace.export import (
 from opentelemetry.semconv.resource import ResourceAttributes
 
 from ska_utils.app_config import AppConfig, Config
+from ska_utils.metrics import METRIC_PREFIX, Metrics
 from ska_utils.strtobool import strtobool
+from ska_utils.trace_sampling import TailSamplingSpanProcessor, create_sampler
 
 TA_TELEMETRY_ENABLED = Config(
     env_name="TA_TELEMETRY_ENABLED", is_required=True, default_value="true"
 )
 TA_OTEL_ENDPOINT = Config(env_name="TA_OTEL_ENDPOINT", is_required=False, default_value=None)
 TA_LOG_LEVEL = Config(env_name="TA_LOG_LEVEL", is_required=False, default_value="info")
+TA_OTEL_TRACE_SAMPLE_RATIO = Config(
+    env_name="TA_OTEL_TRACE_SAMPLE_RATIO", is_required=False, default_value="1.0"
+)
+TA_OTEL_TRACE_KEEP_ERRORS = Config(
+    env_name="TA_OTEL_TRACE_KEEP_ERRORS", is_required=False, default_value="true"
+)
+TA_OTEL_TRACE_SLOW_THRESHOLD_MS = Config(
+    env_name="TA_OTEL_TRACE_SLOW_THRESHOLD_MS", is_required=False, default_value=None
+)
+TA_OTEL_SPAN_ATTRIBUTE_LIMIT = Config(
+    env_name="TA_OTEL_SPAN_ATTRIBUTE_LIMIT", is_required=False, default_value="128"
+)
+TA_OTEL_SPAN_ATTRIBUTE_LENGTH_LIMIT = Config(
+    env_name="TA_OTEL_SPAN_ATTRIBUTE_LENGTH_LIMIT", is_required=False, default_value=None
+)
+TA_OTEL_SPAN_EVENT_LIMIT = Config(
+    env_name="TA_OTEL_SPAN_EVENT_LIMIT", is_required=False, default_value="128"
+)
+TA_OTEL_BSP_MAX_QUEUE_SIZE = Config(
+    env_name="TA_OTEL_BSP_MAX_QUEUE_SIZE", is_required=False, default_value="2048"
+)
+TA_OTEL_BSP_MAX_EXPORT_BATCH_SIZE = Config(
+    env_name="TA_OTEL_BSP_MAX_EXPORT_BATCH_SIZE", is_required=False, default_value="512"
+)
+TA_OTEL_BSP_SCHEDULE_DELAY_MS = Config(
+    env_name="TA_OTEL_BSP_SCHEDULE_DELAY_MS", is_required=False, default_value="5000"
+)
 
-TELEMETRY_CONFIGS: list[Config] = [TA_TELEMETRY_ENABLED, TA_OTEL_ENDPOINT, TA_LOG_LEVEL]
+TELEMETRY_CONFIGS: list[Config] = [
+    TA_TELEMETRY_ENABLED,
+    TA_OTEL_ENDPOINT,
+    TA_LOG_LEVEL,
+    TA_OTEL_TRACE_SAMPLE_RATIO,
+    TA_OTEL_TRACE_KEEP_ERRORS,
+    TA_OTEL_TRACE_SLOW_THRESHOLD_MS,
+    TA_OTEL_SPAN_ATTRIBUTE_LIMIT,
+    TA_OTEL_SPAN_ATTRIBUTE_LENGTH_LIMIT,
+    TA_OTEL_SPAN_EVENT_LIMIT,
+    TA_OTEL_BSP_MAX_QUEUE_SIZE,
+    TA_OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
+    TA_OTEL_BSP_SCHEDULE_DELAY_MS,
+]
 
 AppConfig.add_configs(TELEMETRY_CONFIGS)
 
 
+def _get_config(app_config: AppConfig, config: Config) -> str | None:
+    value = app_config.get(config.env_name)
+    return config.default_value if value is None else value
+
+
+def _get_int_config(app_config: AppConfig, config: Config) -> int | None:
+    value = _get_config(app_config, config)
+    return None if value is None else int(value)
+
+
 class Telemetry:
     def __init__(self, service_name: str, app_config: AppConfig):
         self.service_name = service_name
@@ -49,8 +101,23 @@ class Telemetry:
         self.resource = Resource.create({ResourceAttributes.SERVICE_NAME: self.service_name})
         self._telemetry_enabled = strtobool(str(app_config.get(TA_TELEMETRY_ENABLED.env_name)))
         self.endpoint = app_config.get(TA_OTEL_ENDPOINT.env_name)
+        self._sample_ratio = float(_get_config(app_config, TA_OTEL_TRACE_SAMPLE_RATIO))
+        self._keep_errors = strtobool(str(_get_config(app_config, TA_OTEL_TRACE_KEEP_ERRORS)))
+        slow_threshold_ms = _get_config(app_config, TA_OTEL_TRACE_SLOW_THRESHOLD_MS)
+        self._slow_threshold_ms = None if slow_threshold_ms is None else float(slow_threshold_ms)
+        self._span_limits = SpanLimits(
+            max_span_attributes=_get_int_config(app_config, TA_OTEL_SPAN_ATTRIBUTE_LIMIT),
+            max_span_attribute_length=_get_int_config(
+                app_config, TA_OTEL_SPAN_ATTRIBUTE_LENGTH_LIMIT
+            ),
+            max_events=_get_int_config(app_config, TA_OTEL_SPAN_EVENT_LIMIT),
+        )
+        self._max_queue_size = _get_int_config(app_config, TA_OTEL_BSP_MAX_QUEUE_SIZE)
+        self._max_export_batch_size = _get_int_config(app_config, TA_OTEL_BSP_MAX_EXPORT_BATCH_SIZE)
+        self._schedule_delay_millis = _get_int_config(app_config, TA_OTEL_BSP_SCHEDULE_DELAY_MS)
         self._check_enable_telemetry()
         self.tracer: trace.Tracer | None = self._get_tracer()
+        self.metrics = Metrics(metrics.get_meter(f"{self.service_name}-meter"))
 
         match app_config.get(TA_LOG_LEVEL.env_name):
             case "debug":
@@ -88,8 +155,28 @@ class Telemetry:
         else:
             exporter = ConsoleSpanExporter()
 
-        provider = TracerProvider(resource=self.resource)
-        processor = BatchSpanProcessor(exporter)
+        # Traces that lose the sampling draw are still recorded when they may be
+        # kept afterwards for having failed or been slow
+        tail_sampling = self._sample_ratio < 1.0 and (
+            self._keep_errors or self._slow_threshold_ms is not None
+        )
+        provider = TracerProvider(
+            resource=self.resource,
+            sampler=create_sampler(self._sample_ratio, record_unsampled=tail_sampling),
+            span_limits=self._span_limits,
+        )
+        processor: SpanProcessor = BatchSpanProcessor(
+            exporter,
+            max_queue_size=self._max_queue_size,
+            schedule_delay_millis=self._schedule_delay_millis,
+            max_export_batch_size=self._max_export_batch_size,
+        )
+        if tail_sampling:
+            processor = TailSamplingSpanProcessor(
+                processor,
+                keep_errors=self._keep_errors,
+                slow_threshold_ms=self._slow_threshold_ms,
+            )
         provider.add_span_processor(processor)
 
         trace.set_tracer_provider(provider)
@@ -138,14 +225,17 @@ class Telemetry:
             resource=self.resource,
             views=[
                 # Dropping all instrument names except for those starting with "semantic_kernel"
+                # and the services' own instruments
                 View(instrument_name="*", aggregation=DropAggregation()),
                 View(instrument_name="semantic_kernel*"),
+                View(instrument_name=f"{METRIC_PREFIX}*"),
             ],
         )
         set_meter_provider(meter_provider)
 
 
 _services_telemetry: Telemetry | None = None
+_default_metrics: Metrics | None = None
 
 
 def initialize_telemetry(service_name: str, app_config: AppConfig) -> None:
@@ -157,3 +247,17 @@ def get_telemetry() -> Telemetry:
     if _services_telemetry is None:
         raise ValueError("Telemetry not initialized")
     return _services_telemetry
+
+
+def get_metrics() -> Metrics:
+    """Returns the services' metric instruments.
+
+    Unlike ``get_telemetry`` this never raises; before telemetry is initialized
+    the instruments record to the global (no-op by default) meter provider.
+    """
+    global _default_metrics
+    if _services_telemetry is not None:
+        return _services_telemetry.metrics
+    if _default_metrics is None:
+        _default_metrics = Metrics(metrics.get_meter("ska_utils"))
+    return _default_metrics
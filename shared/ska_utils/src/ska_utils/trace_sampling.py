@@ -0,0 +1,161 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.sampling import (
+    ALWAYS_OFF,
+    Decision,
+    ParentBased,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import Link, SpanContext, SpanKind, StatusCode, TraceFlags
+from opentelemetry.trace.span import TraceState
+from opentelemetry.util.types import Attributes
+
+
+class RecordUnsampledSampler(Sampler):
+    """Records the spans its delegate drops, without marking them sampled.
+
+    Recorded but unsampled spans are never exported by the regular span
+    processors; they only give ``TailSamplingSpanProcessor`` the chance to
+    keep the traces that turn out to be interesting.
+    """
+
+    def __init__(self, delegate: Sampler):
+        self._delegate = delegate
+
+    def should_sample(
+        self,
+        parent_context: Context | None,
+        trace_id: int,
+        name: str,
+        kind: SpanKind | None = None,
+        attributes: Attributes = None,
+        links: Sequence[Link] | None = None,
+        trace_state: TraceState | None = None,
+    ) -> SamplingResult:
+        result = self._delegate.should_sample(
+            parent_context, trace_id, name, kind, attributes, links, trace_state
+        )
+        if result.decision == Decision.DROP:
+            return SamplingResult(Decision.RECORD_ONLY, result.attributes, result.trace_state)
+        return result
+
+    def get_description(self) -> str:
+        return f"RecordUnsampled{{{self._delegate.get_description()}}}"
+
+
+def create_sampler(ratio: float, record_unsampled: bool = False) -> Sampler:
+    """Creates a parent-based sampler sampling ``ratio`` of the new traces.
+
+    With ``record_unsampled`` the spans of traces that were not sampled are
+    still recorded so they can be tail sampled.
+    """
+    root: Sampler = TraceIdRatioBased(ratio)
+    if not record_unsampled:
+        return ParentBased(root)
+    not_sampled = RecordUnsampledSampler(ALWAYS_OFF)
+    return ParentBased(
+        RecordUnsampledSampler(root),
+        remote_parent_not_sampled=not_sampled,
+        local_parent_not_sampled=not_sampled,
+    )
+
+
+def _as_sampled(span: ReadableSpan) -> ReadableSpan:
+    context = SpanContext(
+        trace_id=span.context.trace_id,
+        span_id=span.context.span_id,
+        is_remote=span.context.is_remote,
+        trace_flags=TraceFlags(TraceFlags.SAMPLED),
+        trace_state=span.context.trace_state,
+    )
+    return ReadableSpan(
+        name=span.name,
+        context=context,
+        parent=span.parent,
+        resource=span.resource,
+        attributes=span.attributes,
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """Forwards sampled spans, plus unsampled traces that failed or were slow.
+
+    Spans of unsampled traces are buffered until the trace's local root span
+    ends. The trace is then forwarded to ``processor`` if any of its spans
+    ended with an error (when ``keep_errors`` is set) or the root took at
+    least ``slow_threshold_ms``, and dropped otherwise. At most
+    ``max_buffered_traces`` traces are buffered; the oldest are dropped first.
+    """
+
+    def __init__(
+        self,
+        processor: SpanProcessor,
+        keep_errors: bool = True,
+        slow_threshold_ms: float | None = None,
+        max_buffered_traces: int = 1000,
+    ):
+        self._processor = processor
+        self._keep_errors = keep_errors
+        self._slow_threshold_ns = (
+            None if slow_threshold_ms is None else int(slow_threshold_ms * 1_000_000)
+        )
+        self._max_buffered_traces = max_buffered_traces
+        self._traces: OrderedDict[int, list[ReadableSpan]] = OrderedDict()
+        self._errored: set[int] = set()
+        self._lock = threading.Lock()
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        self._processor.on_start(span, parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if span.context.trace_flags.sampled:
+            self._processor.on_end(span)
+            return
+
+        trace_id = span.context.trace_id
+        is_local_root = span.parent is None or span.parent.is_remote
+        with self._lock:
+            self._traces.setdefault(trace_id, []).append(span)
+            if span.status.status_code == StatusCode.ERROR:
+                self._errored.add(trace_id)
+            if not is_local_root:
+                while len(self._traces) > self._max_buffered_traces:
+                    dropped, _ = self._traces.popitem(last=False)
+                    self._errored.discard(dropped)
+                return
+            spans = self._traces.pop(trace_id)
+            errored = trace_id in self._errored
+            self._errored.discard(trace_id)
+
+        if self._should_keep(span, errored):
+            for buffered in spans:
+                self._processor.on_end(_as_sampled(buffered))
+
+    def _should_keep(self, root: ReadableSpan, errored: bool) -> bool:
+        if self._keep_errors and errored:
+            return True
+        return (
+            self._slow_threshold_ns is not None
+            and root.end_time is not None
+            and root.start_time is not None
+            and root.end_time - root.start_time >= self._slow_threshold_ns
+        )
+
+    def shutdown(self) -> None:
+        self._processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._processor.force_flush(timeout_millis)
@@ -5,20 +5,22 @@ import pytest
 
 from ska_utils.keepalive_executor import (
     KeepaliveMessage,
+    KeepaliveScheduler,
     execute_with_keepalive,
+    get_keepalive_scheduler,
 )
 
 
 @pytest.mark.asyncio
 async def test_execute_with_keepalive_yields_keepalive_and_result():
     async def long_task():
-        await asyncio.sleep(0.01)
+        # Longer than the shared scheduler's resolution
+        await asyncio.sleep(0.25)
         return "done"
 
     gen = execute_with_keepalive(
         long_task(),
         keepalive_interval_seconds=0.005,
-        keepalive_poll_interval_seconds=0.002,
     )
     results = []
     async for value in gen:
@@ -37,7 +39,6 @@ async def test_execute_with_keepalive_task_exception():
     gen = execute_with_keepalive(
         failing_task(),
         keepalive_interval_seconds=0.01,
-        keepalive_poll_interval_seconds=0.005,
         logger=logger,
     )
     with pytest.raises(ValueError):
@@ -48,55 +49,61 @@ async def test_execute_with_keepalive_task_exception():
 
 
 @pytest.mark.asyncio
-async def test_execute_with_keepalive_keepalive_exception():
-    logger = MagicMock()
-
-    # Make the main task run long enough for keepalive to run twice
+async def test_execute_with_keepalive_yields_result_without_waiting_for_keepalive():
     async def task():
-        await asyncio.sleep(0.02)
         return "done"
 
-    with patch("asyncio.Queue.put_nowait", side_effect=RuntimeError("keepalive fail")):
-        gen = execute_with_keepalive(
-            task(),
-            keepalive_interval_seconds=0.005,  # keepalive fires quickly
-            keepalive_poll_interval_seconds=0.001,
-            logger=logger,
-        )
-        results = []
-        try:
-            async for value in gen:
-                results.append(value)
-        except Exception:
-            pass
-
-    assert logger.error.called
-    assert "Keepalive exception" in logger.error.call_args[0][0]
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    results = [value async for value in execute_with_keepalive(task())]
+    assert results == ["done"]
+    assert loop.time() - start < 1.0
 
 
 @pytest.mark.asyncio
-async def test_execute_with_keepalive_cancel_keepalive():
+async def test_execute_with_keepalive_close_cancels_task():
+    started = asyncio.Event()
+
     async def task():
-        await asyncio.sleep(0.01)
-        return "done"
+        started.set()
+        await asyncio.sleep(10)
+
+    gen = execute_with_keepalive(task(), keepalive_interval_seconds=0.01)
+    assert isinstance(await anext(gen), KeepaliveMessage)
+    assert started.is_set()
+    main_task = next(t for t in asyncio.all_tasks() if t.get_coro().__name__ == "task")
+    await gen.aclose()
+    await asyncio.sleep(0)
+    assert main_task.cancelled()
 
-    real_wait_for = asyncio.wait_for
-
-    async def wait_for_side_effect(awaitable, timeout):
-        if (
-            isinstance(awaitable, asyncio.Task)
-            and getattr(awaitable._coro, "__name__", "") == "run_keepalive"
-        ):
-            raise asyncio.CancelledError()
-        return await real_wait_for(awaitable, timeout)
-
-    with patch("asyncio.wait_for", side_effect=wait_for_side_effect):
-        gen = execute_with_keepalive(
-            task(),
-            keepalive_interval_seconds=0.001,
-            keepalive_poll_interval_seconds=0.001,
-        )
-        results = []
-        async for value in gen:
-            results.append(value)
-        assert results[-1] == "done"
+
+@pytest.mark.asyncio
+async def test_keepalive_scheduler_is_shared_per_loop():
+    assert get_keepalive_scheduler() is get_keepalive_scheduler()
+
+
+@pytest.mark.asyncio
+async def test_keepalive_scheduler_coalesces_deadlines():
+    loop = asyncio.get_running_loop()
+    scheduler = KeepaliveScheduler(loop, resolution=0.05)
+    with patch.object(loop, "call_at", wraps=loop.call_at) as call_at:
+        now = loop.time()
+        waiters = [scheduler.wait_until(now + 0.01 + i * 0.001) for i in range(10)]
+        cancelled = scheduler.wait_until(now + 0.01)
+        cancelled.cancel()
+        await asyncio.wait(waiters)
+    assert all(w.done() and not w.cancelled() for w in waiters)
+    assert call_at.call_count == 1
+    assert scheduler._deadlines == []
+    assert scheduler._slots == {}
+
+
+@pytest.mark.asyncio
+async def test_keepalive_scheduler_reschedules_for_earlier_deadline():
+    loop = asyncio.get_running_loop()
+    scheduler = KeepaliveScheduler(loop, resolution=0.01)
+    later = scheduler.wait_until(loop.time() + 0.05)
+    earlier = scheduler.wait_until(loop.time() + 0.01)
+    await earlier
+    assert not later.done()
+    await later
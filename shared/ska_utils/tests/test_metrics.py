@@ -0,0 +1,76 @@
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from ska_utils import Metrics
+
+
+@pytest.fixture
+def reader():
+    return InMemoryMetricReader()
+
+
+@pytest.fixture
+def metrics(reader):
+    provider = MeterProvider(metric_readers=[reader])
+    return Metrics(provider.get_meter("test"))
+
+
+def _points(reader, name):
+    data = reader.get_metrics_data()
+    for resource_metrics in data.resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                if metric.name == name:
+                    return list(metric.data.data_points)
+    return []
+
+
+def test_record_llm_call_records_duration_and_tokens(metrics, reader):
+    metrics.record_llm_call("gpt-4o", 120.0, prompt_tokens=10, completion_tokens=4)
+
+    (duration,) = _points(reader, "ta.llm.call.duration")
+    assert duration.sum == 120.0
+    assert dict(duration.attributes) == {"model": "gpt-4o"}
+    tokens = {p.attributes["direction"]: p.value for p in _points(reader, "ta.llm.tokens")}
+    assert tokens == {"input": 10, "output": 4}
+
+
+def test_timed_records_errors(metrics, reader):
+    with metrics.time_tool_call("Weather", "get_forecast"):
+        pass
+    with pytest.raises(ValueError), metrics.time_tool_call("Weather", "get_forecast"):
+        raise ValueError()
+
+    points = _points(reader, "ta.tool.call.duration")
+    assert sorted((p.attributes["error"], p.count) for p in points) == [(False, 1), (True, 1)]
+
+
+def test_track_in_flight(metrics, reader):
+    with metrics.track_in_flight():
+        (point,) = _points(reader, "ta.http.server.active_requests")
+        assert point.value == 1
+    (point,) = _points(reader, "ta.http.server.active_requests")
+    assert point.value == 0
+    assert not point.attributes
+
+
+def test_record_http_response(metrics, reader):
+    metrics.record_http_response("/agent/sse", 200, 15.0, 900.0)
+    metrics.record_http_response("/agent/sse", None, None, 3.0)
+
+    (ttfb,) = _points(reader, "ta.http.server.time_to_first_byte")
+    assert ttfb.sum == 15.0
+    durations = {
+        p.attributes["status_code"]: p.sum for p in _points(reader, "ta.http.server.duration")
+    }
+    assert durations == {200: 900.0, 0: 3.0}
+
+
+def test_record_task_cache_lookup(metrics, reader):
+    metrics.record_task_cache_lookup(True)
+    metrics.record_task_cache_lookup(True)
+    metrics.record_task_cache_lookup(False)
+
+    points = _points(reader, "ta.task_cache.lookups")
+    assert {p.attributes["hit"]: p.value for p in points} == {True: 2, False: 1}
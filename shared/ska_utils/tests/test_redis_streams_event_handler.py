@@ -1,7 +1,9 @@
+import asyncio
 from typing import Union
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import redis.asyncio as aredis
 from pydantic import BaseModel, TypeAdapter
 from redis import Redis
 from redis.exceptions import ResponseError
@@ -44,6 +46,7 @@ def event_handler(mock_redis):
 def test_initialization(event_handler):
     assert event_handler._topic_name == "test_topic"
     assert event_handler._group_name == "test_topic/consumers"
+    assert event_handler._dead_letter_topic == "test_topic/dead-letter"
     assert isinstance(event_handler._consumer_name, str)
     assert event_handler._max_message_wait == 5
 
@@ -97,75 +100,159 @@ def test_shutdown_already_shutdown(event_handler):
         event_handler.shutdown()
 
 
-def test_create_consumer_group_success(event_handler):
-    event_handler._r.xgroup_create.return_value = True
-    event_handler._create_consumer_group()
-    event_handler._r.xgroup_create.assert_called_once_with(
+@pytest.fixture
+def async_redis(event_handler):
+    event_handler._ar = AsyncMock()
+    event_handler._ar.xpending_range.return_value = [{"times_delivered": 1}]
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    event_handler._ar.pipeline = MagicMock(return_value=AsyncMock())
+    event_handler._ar.pipeline.return_value.__aenter__.return_value = pipe
+    return event_handler._ar
+
+
+@pytest.mark.asyncio
+async def test_create_consumer_group_success(event_handler, async_redis):
+    async_redis.xgroup_create.return_value = True
+    await event_handler._create_consumer_group()
+    async_redis.xgroup_create.assert_called_once_with(
         event_handler._topic_name, event_handler._group_name, 0, True
     )
 
 
-def test_create_consumer_group_busy_group(event_handler):
-    event_handler._r.xgroup_create.side_effect = ResponseError(
+@pytest.mark.asyncio
+async def test_create_consumer_group_busy_group(event_handler, async_redis):
+    async_redis.xgroup_create.side_effect = ResponseError(
         "BUSYGROUP Consumer Group name already exists"
     )
-    event_handler._create_consumer_group()  # Should not raise an error
+    await event_handler._create_consumer_group()  # Should not raise an error
 
 
-def test_create_consumer_group_failure(event_handler):
-    event_handler._r.xgroup_create.side_effect = ResponseError("Some other error")
+@pytest.mark.asyncio
+async def test_create_consumer_group_failure(event_handler, async_redis):
+    async_redis.xgroup_create.side_effect = ResponseError("Some other error")
     with pytest.raises(ResponseError):
-        event_handler._create_consumer_group()
+        await event_handler._create_consumer_group()
 
 
-def test_create_consumer_group_runtime_error(event_handler):
-    event_handler._r.xgroup_create.return_value = False
+@pytest.mark.asyncio
+async def test_create_consumer_group_runtime_error(event_handler, async_redis):
+    async_redis.xgroup_create.return_value = False
     with pytest.raises(RuntimeError):
-        event_handler._create_consumer_group()
+        await event_handler._create_consumer_group()
+
+
+def test_create_async_client_from_sync_client(event_handler):
+    event_handler._r = Redis(host="redis.local", port=6380, db=2, password="secret")
+    client = event_handler._create_async_client()
+    kwargs = client.connection_pool.connection_kwargs
+    assert isinstance(client, aredis.Redis)
+    assert (kwargs["host"], kwargs["port"], kwargs["db"], kwargs["password"]) == (
+        "redis.local",
+        6380,
+        2,
+        "secret",
+    )
 
 
 def test_decode_event(event_handler):
-    event = [(b"1", [(b"0", {b"event_data": b'{"event_data": "test"}'})])]
-    event_id, decoded_event = event_handler._decode_event(event)
-    assert event_id == "0"
+    decoded_event = event_handler._decode_event({b"event_data": b'{"event_data": "test"}'})
+    assert decoded_event.event_data == "test"
+
+
+def test_decode_event_with_decoded_responses(event_handler):
+    decoded_event = event_handler._decode_event({"event_data": '{"event_data": "test"}'})
     assert decoded_event.event_data == "test"
 
 
 def test_decode_event_error(event_handler):
-    event = [(b"1", [(b"0", {b"event_data": b'{"event_data": "test"}'})])]
     event_handler._type_adapter.validate_json = MagicMock(side_effect=Exception("Decode error"))
     with pytest.raises(Exception, match="Decode error"):
-        event_handler._decode_event(event)
+        event_handler._decode_event({b"event_data": b'{"event_data": "test"}'})
 
 
-def test_get_next_message_no_message(event_handler):
+@pytest.mark.asyncio
+async def test_read_new_no_message(event_handler, async_redis):
     event_handler._max_message_wait = -1
-    event_handler._r.xreadgroup.return_value = []
-    result = event_handler._get_next_message()
-    assert result is None
+    async_redis.xreadgroup.return_value = []
+    assert await event_handler._read_new(5) == []
 
 
-def test_get_next_message_with_message(event_handler):
-    event = [(b"1", [(b"1", {b"event_data": b'{"event_data": "test"}'})])]
-    event_handler._r.xreadgroup.return_value = event
-    event_handler._r.xack = MagicMock()
-    result = event_handler._get_next_message()
-    assert result.event_data == "test"
-    event_handler._r.xack.assert_called_once()
+@pytest.mark.asyncio
+async def test_read_new_reads_batch(event_handler, async_redis):
+    entries = [
+        (b"1", {b"event_data": b'{"event_data": "a"}'}),
+        (b"2", {b"event_data": b'{"event_data": "b"}'}),
+    ]
+    async_redis.xreadgroup.return_value = [(b"test_topic", entries)]
+    assert await event_handler._read_new(5) == entries
+    assert async_redis.xreadgroup.call_args.kwargs["count"] == 5
+    async_redis.xack.assert_not_called()
 
 
-def test_get_next_message_max_wait_exceeded(event_handler):
-    event_handler._r.xreadgroup.side_effect = MaxWaitExceededError()
+@pytest.mark.asyncio
+async def test_read_new_max_wait_exceeded(event_handler, async_redis):
+    async_redis.xreadgroup.return_value = []
     with pytest.raises(MaxWaitExceededError):
-        event_handler._get_next_message()
+        await event_handler._read_new(1)
 
 
-def test_get_next_message_decoding_error(event_handler):
-    mock_result = {("test_topic", "1"): ("1", "test_event")}
-    event_handler._r.xreadgroup.return_value = mock_result
-    with patch.object(event_handler, "_decode_event", side_effect=Exception("Decoding error")):
-        invoke_event = event_handler._get_next_message()
-        assert invoke_event is None
+@pytest.mark.asyncio
+async def test_handle_entry_acks_after_processing(event_handler, async_redis):
+    event_handler.process_event = AsyncMock()
+    await event_handler._handle_entry(b"1", {b"event_data": b'{"event_data": "test"}'})
+    event_handler.process_event.assert_awaited_once()
+    async_redis.xack.assert_awaited_once_with("test_topic", "test_topic/consumers", b"1")
+
+
+@pytest.mark.asyncio
+async def test_handle_entry_leaves_failed_event_pending(event_handler, async_redis):
+    event_handler.process_event = AsyncMock(side_effect=Exception("boom"))
+    await event_handler._handle_entry(b"1", {b"event_data": b'{"event_data": "test"}'})
+    async_redis.xack.assert_not_called()
+    async_redis.pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_handle_entry_dead_letters_after_max_deliveries(event_handler, async_redis):
+    event_handler.process_event = AsyncMock(side_effect=Exception("boom"))
+    async_redis.xpending_range.return_value = [{"times_delivered": 5}]
+    await event_handler._handle_entry(b"1", {b"event_data": b'{"event_data": "test"}'})
+    pipe = async_redis.pipeline.return_value.__aenter__.return_value
+    topic, fields = pipe.xadd.call_args.args
+    assert topic == "test_topic/dead-letter"
+    assert fields["original_id"] == b"1"
+    pipe.xack.assert_called_once_with("test_topic", "test_topic/consumers", b"1")
+
+
+@pytest.mark.asyncio
+async def test_handle_entry_dead_letters_undecodable_event(event_handler, async_redis):
+    event_handler.process_event = AsyncMock()
+    await event_handler._handle_entry(b"1", {b"event_data": b"not json"})
+    event_handler.process_event.assert_not_called()
+    pipe = async_redis.pipeline.return_value.__aenter__.return_value
+    assert pipe.xadd.call_args.args[0] == "test_topic/dead-letter"
+
+
+@pytest.mark.asyncio
+async def test_claim_stale_reclaims_idle_events(event_handler, async_redis):
+    entries = [
+        (b"1", {b"event_data": b'{"event_data": "a"}'}),
+        (b"2", {b"event_data": b'{"event_data": "b"}'}),
+    ]
+    async_redis.xautoclaim.return_value = [b"3-0", entries, []]
+    async_redis.xpending_range.side_effect = [
+        [{"times_delivered": 2}],
+        [{"times_delivered": 6}],
+    ]
+    claimed = await event_handler._claim_stale(10)
+    assert claimed == entries[:1]
+    assert event_handler._claim_cursor == "3-0"
+    pipe = async_redis.pipeline.return_value.__aenter__.return_value
+    assert pipe.xadd.call_args.args[1]["original_id"] == b"2"
+    # Not reclaimed again until the idle interval passes
+    assert await event_handler._claim_stale(10) == []
+    async_redis.xautoclaim.assert_awaited_once()
 
 
 def test_listen_and_process(event_handler):
@@ -177,24 +264,59 @@ def test_listen_and_process(event_handler):
 
 
 @pytest.mark.asyncio
-async def test_a_listen_and_process(event_handler):
-    event = [(b"1", [(b"1", {b"event_data": b'{"event_data": "test"}'})])]
-    event_handler._r.xreadgroup.return_value = event
-    event_handler.initialize()
+async def test_a_listen_and_process(event_handler, async_redis):
+    entries = [
+        (b"1", {b"event_data": b'{"event_data": "a"}'}),
+        (b"2", {b"event_data": b'{"event_data": "b"}'}),
+    ]
+    async_redis.xautoclaim.return_value = [b"0-0", [], []]
+    reads = iter([[(b"test_topic", entries)]])
+    async_redis.xreadgroup.side_effect = lambda **kwargs: next(reads, [])
+    processed = []
 
     async def mock_process_event(event):
-        assert event.event_data == "test"
-        event_handler._shutdown = True
+        processed.append(event.event_data)
 
-    event_handler.process_event = AsyncMock(mock_process_event)
-    event_handler._r.xreadgroup.side_effect = [event, []]
-    await event_handler._a_listen_and_process()
+    event_handler.process_event = mock_process_event
+    with patch.object(event_handler, "_create_async_client", return_value=async_redis):
+        await event_handler._a_listen_and_process()
     assert event_handler._shutdown
+    assert sorted(processed) == ["a", "b"]
+    assert async_redis.xack.await_count == 2
+    async_redis.aclose.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_a_listen_and_process_consumer_group_creating_failure(event_handler):
-    event_handler._create_consumer_group = Mock(side_effect=Exception("Creation failed"))
-    with pytest.raises(Exception, match="Creation failed"):
+async def test_a_listen_and_process_limits_concurrency(event_handler, async_redis):
+    event_handler._max_concurrency = 2
+    entries = [(str(i).encode(), {b"event_data": b'{"event_data": "x"}'}) for i in range(2)]
+    async_redis.xautoclaim.return_value = [b"0-0", [], []]
+    reads = iter([[(b"test_topic", entries)], [(b"test_topic", entries)]])
+
+    async def xreadgroup(**kwargs):
+        assert kwargs["count"] <= 2 - len(event_handler._in_flight)
+        return next(reads, [])
+
+    async_redis.xreadgroup.side_effect = xreadgroup
+    running = {"now": 0, "max": 0}
+
+    async def mock_process_event(event):
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+        await asyncio.sleep(0.01)
+        running["now"] -= 1
+
+    event_handler.process_event = mock_process_event
+    with patch.object(event_handler, "_create_async_client", return_value=async_redis):
         await event_handler._a_listen_and_process()
+    assert running["max"] == 2
+    assert async_redis.xack.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_a_listen_and_process_consumer_group_creating_failure(event_handler, async_redis):
+    event_handler._create_consumer_group = AsyncMock(side_effect=Exception("Creation failed"))
+    with patch.object(event_handler, "_create_async_client", return_value=async_redis):
+        with pytest.raises(Exception, match="Creation failed"):
+            await event_handler._a_listen_and_process()
     assert event_handler._shutdown is True
@@ -1,8 +1,10 @@
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, call
 
+import pytest
 from redis import Redis
 
-from ska_utils import RedisStreamsEventPublisher
+from ska_utils import AsyncRedisStreamsEventPublisher, RedisStreamsEventPublisher
 
 
 def test_redis_streams_event_publisher_init():
@@ -18,3 +20,109 @@ def test_publish_event():
     event_data = "test_event_data"
     publisher.publish_event(topic_name, event_data)
     mock_redis.xadd.assert_called_once_with(name=topic_name, fields={"event_data": event_data})
+
+
+def test_publish_event_trims_stream():
+    mock_redis = MagicMock(spec=Redis)
+    publisher = RedisStreamsEventPublisher(mock_redis, max_len=1000)
+    publisher.publish_event("test_topic", "test_event_data")
+    mock_redis.xadd.assert_called_once_with(
+        name="test_topic",
+        fields={"event_data": "test_event_data"},
+        maxlen=1000,
+        approximate=True,
+    )
+
+
+@pytest.fixture
+def async_redis():
+    r = MagicMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    r.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    r.pipeline.return_value.__aexit__ = AsyncMock(return_value=None)
+    return r, pipe
+
+
+@pytest.mark.asyncio
+async def test_async_publisher_flushes_full_batch(async_redis):
+    r, pipe = async_redis
+    publisher = AsyncRedisStreamsEventPublisher(
+        r, max_batch_size=2, flush_interval=60, max_len=100, topic_max_len={"other": 5}
+    )
+    await publisher.publish_event("topic", "one")
+    pipe.execute.assert_not_called()
+    await publisher.publish_event("other", "two")
+
+    pipe.execute.assert_awaited_once()
+    assert pipe.xadd.call_args_list == [
+        call(name="topic", fields={"event_data": "one"}, maxlen=100, approximate=True),
+        call(name="other", fields={"event_data": "two"}, maxlen=5, approximate=True),
+    ]
+    await publisher.close()
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_publisher_flushes_after_interval(async_redis):
+    r, pipe = async_redis
+    publisher = AsyncRedisStreamsEventPublisher(r, max_batch_size=10, flush_interval=0.01)
+    await publisher.publish_event("topic", "one")
+    await asyncio.sleep(0.05)
+
+    pipe.execute.assert_awaited_once()
+    pipe.xadd.assert_called_once_with(
+        name="topic", fields={"event_data": "one"}, maxlen=None, approximate=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_publisher_close_flushes_and_rejects_new_events(async_redis):
+    r, pipe = async_redis
+    async with AsyncRedisStreamsEventPublisher(r, flush_interval=60) as publisher:
+        await publisher.publish_event("topic", "one")
+
+    pipe.execute.assert_awaited_once()
+    with pytest.raises(RuntimeError, match="Publisher is closed."):
+        await publisher.publish_event("topic", "two")
+
+
+def _sent(pipe):
+    return [c.kwargs["fields"]["event_data"] for c in pipe.xadd.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_async_publisher_retries_failed_batch(async_redis):
+    r, pipe = async_redis
+    pipe.execute.side_effect = [ConnectionError("down"), None]
+    publisher = AsyncRedisStreamsEventPublisher(r, max_batch_size=10, flush_interval=0.01)
+    await publisher.publish_event("topic", "one")
+    await asyncio.sleep(0.015)
+    await publisher.publish_event("topic", "two")
+    await asyncio.sleep(0.05)
+
+    assert pipe.execute.await_count == 2
+    assert _sent(pipe) == ["one", "one", "two"]
+    await publisher.close()
+    assert pipe.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_publisher_bounds_buffer_of_failed_batches(async_redis):
+    r, pipe = async_redis
+    pipe.execute.side_effect = ConnectionError("down")
+    publisher = AsyncRedisStreamsEventPublisher(
+        r, max_batch_size=2, flush_interval=60, max_buffer_size=3
+    )
+    await publisher.publish_event("topic", "one")
+    with pytest.raises(ConnectionError):
+        await publisher.publish_event("topic", "two")
+    with pytest.raises(ConnectionError):
+        await publisher.publish_event("topic", "three")
+    with pytest.raises(ConnectionError):
+        await publisher.publish_event("topic", "four")
+
+    pipe.execute.side_effect = None
+    pipe.xadd.reset_mock()
+    await publisher.close()
+    assert _sent(pipe) == ["two", "three", "four"]
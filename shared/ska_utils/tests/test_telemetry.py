@@ -4,7 +4,15 @@ from unittest.mock import MagicMock, patch
 import pytest
 from opentelemetry.trace import Tracer
 
-from ska_utils import AppConfig, Telemetry, get_telemetry, initialize_telemetry
+from ska_utils import (
+    AppConfig,
+    Metrics,
+    Telemetry,
+    get_metrics,
+    get_telemetry,
+    initialize_telemetry,
+)
+from ska_utils.trace_sampling import TailSamplingSpanProcessor
 
 
 @pytest.fixture
@@ -105,8 +113,17 @@ def test_enable_tracing(app_config):
     ):
         telemetry._enable_tracing()
         mock_otlp_exporter.assert_called_once_with(endpoint=telemetry.endpoint)
-        mock_tracer_provider.assert_called_once_with(resource=telemetry.resource)
-        mock_batch_processor.assert_called_once()
+        mock_tracer_provider.assert_called_once()
+        assert mock_tracer_provider.call_args.kwargs["resource"] == telemetry.resource
+        mock_batch_processor.assert_called_once_with(
+            mock_otlp_exporter.return_value,
+            max_queue_size=2048,
+            schedule_delay_millis=5000,
+            max_export_batch_size=512,
+        )
+        mock_tracer_provider.return_value.add_span_processor.assert_called_once_with(
+            mock_batch_processor.return_value
+        )
         mock_set_tracer_provider.assert_called_once()
 
 
@@ -125,11 +142,45 @@ def test_enable_tracing_without_endpoint(app_config):
     ):
         telemetry._enable_tracing()
         mock_console_span_exporter.assert_called_once()
-        mock_tracer_provider.assert_called_once_with(resource=telemetry.resource)
+        mock_tracer_provider.assert_called_once()
+        assert mock_tracer_provider.call_args.kwargs["resource"] == telemetry.resource
         mock_batch_processor.assert_called_once()
         mock_set_tracer_provider.assert_called_once()
 
 
+def test_tracing_defaults_sample_everything(app_config):
+    telemetry = Telemetry("test_service", app_config)
+    assert telemetry._sample_ratio == 1.0
+    assert telemetry._span_limits.max_span_attributes == 128
+    assert telemetry._span_limits.max_events == 128
+
+
+def test_enable_tracing_with_tail_sampling(app_config):
+    app_config.get.side_effect = {
+        "TA_TELEMETRY_ENABLED": "true",
+        "TA_OTEL_ENDPOINT": None,
+        "TA_LOG_LEVEL": "info",
+        "TA_OTEL_TRACE_SAMPLE_RATIO": "0.1",
+        "TA_OTEL_TRACE_SLOW_THRESHOLD_MS": "2000",
+        "TA_OTEL_SPAN_EVENT_LIMIT": "16",
+    }.get
+    telemetry = Telemetry("test_service", app_config)
+    with (
+        patch("ska_utils.telemetry.ConsoleSpanExporter"),
+        patch("ska_utils.telemetry.TracerProvider") as mock_tracer_provider,
+        patch("ska_utils.telemetry.BatchSpanProcessor") as mock_batch_processor,
+        patch("opentelemetry.trace.set_tracer_provider"),
+    ):
+        telemetry._enable_tracing()
+        kwargs = mock_tracer_provider.call_args.kwargs
+        assert "TraceIdRatioBased{0.1}" in kwargs["sampler"].get_description()
+        assert kwargs["span_limits"].max_events == 16
+        (processor,) = mock_tracer_provider.return_value.add_span_processor.call_args.args
+        assert isinstance(processor, TailSamplingSpanProcessor)
+        assert processor._processor is mock_batch_processor.return_value
+        assert processor._slow_threshold_ns == 2_000_000_000
+
+
 def test_get_logger(app_config):
     telemetry = Telemetry("test_service", app_config)
     logger = telemetry.get_logger("test-logger")
@@ -171,3 +222,16 @@ def test_initialize_telemetry(app_config):
     initialize_telemetry("test_service", app_config)
     telemetry = get_telemetry()
     assert telemetry.service_name == "test_service"
+
+
+def test_get_metrics_before_initialization():
+    with patch("ska_utils.telemetry._services_telemetry", None):
+        metrics = get_metrics()
+        assert isinstance(metrics, Metrics)
+        assert get_metrics() is metrics
+        metrics.record_llm_call("model", 1.0, prompt_tokens=1, completion_tokens=1)
+
+
+def test_get_metrics_uses_telemetry_metrics(app_config):
+    initialize_telemetry("test_service", app_config)
+    assert get_metrics() is get_telemetry().metrics
@@ -0,0 +1,93 @@
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF, ALWAYS_ON, Decision
+from opentelemetry.trace import Status, StatusCode, set_span_in_context
+
+from ska_utils.trace_sampling import (
+    RecordUnsampledSampler,
+    TailSamplingSpanProcessor,
+    create_sampler,
+)
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+def _tracer(exporter, ratio, **processor_kwargs):
+    return _tracer_and_processor(exporter, ratio, **processor_kwargs)[0]
+
+
+def _tracer_and_processor(exporter, ratio, **processor_kwargs):
+    provider = TracerProvider(sampler=create_sampler(ratio, record_unsampled=True))
+    processor = TailSamplingSpanProcessor(SimpleSpanProcessor(exporter), **processor_kwargs)
+    provider.add_span_processor(processor)
+    return provider.get_tracer("test"), processor
+
+
+def test_record_unsampled_sampler_records_dropped_spans():
+    sampler = RecordUnsampledSampler(ALWAYS_OFF)
+    assert sampler.should_sample(None, 1, "span").decision == Decision.RECORD_ONLY
+
+
+def test_record_unsampled_sampler_keeps_sampled_spans():
+    sampler = RecordUnsampledSampler(ALWAYS_ON)
+    assert sampler.should_sample(None, 1, "span").decision == Decision.RECORD_AND_SAMPLE
+
+
+def test_create_sampler_without_recording_drops_unsampled():
+    sampler = create_sampler(0.0)
+    assert sampler.should_sample(None, 1, "span").decision == Decision.DROP
+
+
+def test_sampled_traces_are_exported(exporter):
+    tracer = _tracer(exporter, 1.0)
+    with tracer.start_as_current_span("root"), tracer.start_as_current_span("child"):
+        pass
+    assert [span.name for span in exporter.get_finished_spans()] == ["child", "root"]
+
+
+def test_unsampled_traces_are_dropped(exporter):
+    tracer = _tracer(exporter, 0.0)
+    with tracer.start_as_current_span("root"), tracer.start_as_current_span("child"):
+        pass
+    assert exporter.get_finished_spans() == ()
+
+
+def test_unsampled_traces_with_errors_are_exported(exporter):
+    tracer = _tracer(exporter, 0.0)
+    with tracer.start_as_current_span("root"):
+        with tracer.start_as_current_span("child") as child:
+            child.set_status(Status(StatusCode.ERROR))
+    spans = exporter.get_finished_spans()
+    assert [span.name for span in spans] == ["child", "root"]
+    assert all(span.context.trace_flags.sampled for span in spans)
+
+
+def test_errors_are_dropped_when_not_kept(exporter):
+    tracer = _tracer(exporter, 0.0, keep_errors=False)
+    with tracer.start_as_current_span("root") as root:
+        root.set_status(Status(StatusCode.ERROR))
+    assert exporter.get_finished_spans() == ()
+
+
+def test_slow_unsampled_traces_are_exported(exporter):
+    tracer = _tracer(exporter, 0.0, slow_threshold_ms=0)
+    with tracer.start_as_current_span("root"):
+        pass
+    assert [span.name for span in exporter.get_finished_spans()] == ["root"]
+
+
+def test_buffered_traces_are_bounded(exporter):
+    tracer, processor = _tracer_and_processor(exporter, 0.0, max_buffered_traces=2)
+    roots = [tracer.start_span(f"root-{i}") for i in range(3)]
+    for i, root in enumerate(roots):
+        with tracer.start_as_current_span(f"child-{i}", context=set_span_in_context(root)):
+            pass
+    assert len(processor._traces) == 2
+    for root in roots:
+        root.end()
+    assert processor._traces == {}
@@ -28,6 +28,7 @@ class Action(Enum):
     PROVIDE_RESULT = "provide_result"
     ABORT = "abort"
     ASSIGN_NEW_TASK = "assign_new_task"
+    ASSIGN_NEW_TASKS = "assign_new_tasks"
 
 
 class ResultOutput(BaseModel):
@@ -45,6 +46,10 @@ class AssignTaskOutput(BaseModel):
     instructions: str
 
 
+class AssignTasksOutput(BaseModel):
+    tasks: list[AssignTaskOutput]
+
+
 class ManagerOutput(KernelBaseModel):
     next_action: Action
-    action_detail: ResultOutput | AbortOutput | AssignTaskOutput
+    action_detail: ResultOutput | AbortOutput | AssignTaskOutput | AssignTasksOutput
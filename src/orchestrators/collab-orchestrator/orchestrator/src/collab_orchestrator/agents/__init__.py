@@ -3,3 +3,9 @@ from .agent_types import BaseAgent as BaseAgent
 from .base_agent_builder import BaseAgentBuilder as BaseAgentBuilder
 from .invokable_agent import InvokableAgent as InvokableAgent
 from .task_agent import PreRequisite as PreRequisite, TaskAgent as TaskAgent
+from .task_result_cache import (
+    InMemoryTaskResultCache as InMemoryTaskResultCache,
+    RedisTaskResultCache as RedisTaskResultCache,
+    ResultCacheSpec as ResultCacheSpec,
+    TaskResultCache as TaskResultCache,
+)
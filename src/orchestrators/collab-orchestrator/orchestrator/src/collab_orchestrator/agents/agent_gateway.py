@@ -6,7 +6,7 @@ import httpx
 from httpx_sse import ServerSentEvent, aconnect_sse
 from opentelemetry.propagate import inject
 from pydantic import BaseModel
-from ska_utils import KeepaliveMessage, get_telemetry
+from ska_utils import KeepaliveMessage, get_keepalive_scheduler, get_metrics, get_telemetry
 
 from collab_orchestrator.co_types import (
     InvokeResponse,
@@ -51,6 +51,18 @@ class AgentGateway(BaseModel):
         }
         inject(headers)
 
+        with get_metrics().time_agent_gateway(f"{agent_name}:{agent_version}"):
+            return await self._invoke_agent_with_retries(
+                agent_name, agent_version, payload, headers
+            )
+
+    async def _invoke_agent_with_retries(
+        self,
+        agent_name: str,
+        agent_version: str,
+        payload: str,
+        headers: dict[str, str],
+    ) -> Any:
         max_retries = 3
         attempt = 0
         last_exception = None
@@ -101,11 +113,21 @@ class AgentGateway(BaseModel):
         elif sse_event.event == "final-response":
             self._logger.debug("Sent final response")
             return InvokeResponse.model_validate_json(sse_event.data)
+        elif sse_event.event == "extra-data":
+            # Also carried by the final response
+            return None
         else:
             return sse_event
 
     async def invoke_agent_sse(
         self, agent_name: str, agent_version: str, agent_input: BaseModel
+    ) -> AsyncIterable[PartialResponse | InvokeResponse | KeepaliveMessage | ServerSentEvent]:
+        with get_metrics().time_agent_gateway(f"{agent_name}:{agent_version}"):
+            async for response in self._invoke_agent_sse(agent_name, agent_version, agent_input):
+                yield response
+
+    async def _invoke_agent_sse(
+        self, agent_name: str, agent_version: str, agent_input: BaseModel
     ) -> AsyncIterable[PartialResponse | InvokeResponse | KeepaliveMessage | ServerSentEvent]:
         json_input = agent_input.model_dump(mode="json")
         headers = {
@@ -114,8 +136,10 @@ class AgentGateway(BaseModel):
         inject(headers)
         endpoint = self._get_sse_endpoint_for_agent(agent_name, agent_version)
 
-        # Create the keepalive task
-        keepalive_task = asyncio.create_task(asyncio.sleep(30))
+        # Create the keepalive timer
+        loop = asyncio.get_running_loop()
+        keepalive_scheduler = get_keepalive_scheduler()
+        keepalive_task = keepalive_scheduler.wait_until(loop.time() + 30)
         first_event_received = False
 
         self._logger.debug(f"Invoking agent {agent_name}:{agent_version} SSE endpoint")
@@ -143,7 +167,7 @@ class AgentGateway(BaseModel):
                             # Send a keepalive and create a new timer
                             self._logger.debug("Sending keepalive response")
                             yield KeepaliveMessage()
-                            keepalive_task = asyncio.create_task(asyncio.sleep(30))
+                            keepalive_task = keepalive_scheduler.wait_until(loop.time() + 30)
                             continue
 
                         # We got an SSE event
@@ -1,3 +1,4 @@
+import uuid
 from collections.abc import AsyncIterable
 
 from httpx_sse import ServerSentEvent
@@ -7,6 +8,7 @@ from ska_utils import get_telemetry
 from collab_orchestrator.agents.agent_gateway import AgentGateway
 from collab_orchestrator.agents.agent_types import BaseAgent
 from collab_orchestrator.agents.invokable_agent import InvokableAgent
+from collab_orchestrator.agents.task_result_cache import TaskResultCache
 from collab_orchestrator.co_types import (
     BaseMultiModalInput,
     ContentType,
@@ -14,6 +16,7 @@ from collab_orchestrator.co_types import (
     InvokeResponse,
     MultiModalItem,
     PartialResponse,
+    TokenUsage,
 )
 
 
@@ -26,6 +29,8 @@ class TaskAgent(InvokableAgent):
     def __init__(self, agent: BaseAgent, gateway: AgentGateway):
         super().__init__(agent, gateway)
         self._logger = get_telemetry().get_logger(self.__class__.__name__)
+        # Only set for agents configured as deterministic (see ResultCacheSpec)
+        self.result_cache: TaskResultCache | None = None
 
     @staticmethod
     def _pre_requisite_to_item(
@@ -56,6 +61,18 @@ class TaskAgent(InvokableAgent):
         )
         return BaseMultiModalInput(session_id=session_id, chat_history=chat_history_messages)
 
+    def _from_cache(self, cached: InvokeResponse, session_id: str) -> InvokeResponse:
+        """Returns a cached result as this request's response, which cost no tokens."""
+        self._logger.debug("Returning cached task result")
+        return cached.model_copy(
+            update={
+                "session_id": session_id,
+                "source": f"{self.agent.name}:{self.agent.version}",
+                "request_id": uuid.uuid4().hex,
+                "token_usage": TokenUsage(completion_tokens=0, prompt_tokens=0, total_tokens=0),
+            }
+        )
+
     async def perform_task_sse(
         self,
         session_id: str,
@@ -63,9 +80,18 @@ class TaskAgent(InvokableAgent):
         pre_requisites: list[PreRequisite] | None = None,
     ) -> AsyncIterable[PartialResponse | InvokeResponse | ServerSentEvent]:
         self._logger.debug(f"Performing task with goal: {goal}")
+        cache_key: str | None = None
+        if self.result_cache is not None:
+            cache_key = TaskResultCache.key_for(self.agent, goal, pre_requisites)
+            cached = await self.result_cache.get(cache_key)
+            if cached is not None:
+                yield self._from_cache(cached, session_id)
+                return
         chat_history = TaskAgent._build_chat_history(session_id, goal, pre_requisites)
         self._logger.debug(f"Chat history: {chat_history}")
         async for response in self.invoke_sse(chat_history):
+            if cache_key is not None and isinstance(response, InvokeResponse):
+                await self.result_cache.set(cache_key, response)
             yield response
 
     async def perform_task(
@@ -75,7 +101,15 @@ class TaskAgent(InvokableAgent):
         pre_requisites: list[PreRequisite] | None = None,
     ) -> InvokeResponse:
         self._logger.debug(f"Performing task with goal: {goal}")
+        cache_key: str | None = None
+        if self.result_cache is not None:
+            cache_key = TaskResultCache.key_for(self.agent, goal, pre_requisites)
+            cached = await self.result_cache.get(cache_key)
+            if cached is not None:
+                return self._from_cache(cached, session_id)
         chat_history = TaskAgent._build_chat_history(session_id, goal, pre_requisites)
         self._logger.debug(f"Chat history: {chat_history}")
-        response = await self.invoke(chat_history)
-        return InvokeResponse(**response)
+        response = InvokeResponse(**await self.invoke(chat_history))
+        if cache_key is not None:
+            await self.result_cache.set(cache_key, response)
+        return response
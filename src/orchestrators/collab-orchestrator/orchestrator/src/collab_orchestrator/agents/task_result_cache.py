@@ -0,0 +1,101 @@
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Literal
+
+import redis.asyncio as redis
+from opentelemetry import trace
+from pydantic import BaseModel
+from ska_utils import get_metrics
+
+from collab_orchestrator.agents.agent_types import BaseAgent
+from collab_orchestrator.co_types import InvokeResponse
+
+
+class ResultCacheSpec(BaseModel):
+    agents: list[str]
+    backend: Literal["memory", "redis"] = "memory"
+    ttl: int = 3600
+    max_entries: int = 1000
+
+
+class TaskResultCache(ABC):
+    """Caches task results of deterministic agents.
+
+    Keys are derived from the agent's name and version, the task goal and the
+    prerequisite results, so re-issuing an identical task costs a lookup
+    instead of another agent call.
+    """
+
+    @staticmethod
+    def key_for(agent: BaseAgent, goal: str, pre_requisites: list | None) -> str:
+        payload = json.dumps(
+            {
+                "agent": f"{agent.name}:{agent.version}",
+                "goal": goal,
+                "pre_requisites": [
+                    [pre_req.goal, pre_req.result] for pre_req in pre_requisites or []
+                ],
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> InvokeResponse | None:
+        response = await self._get(key)
+        trace.get_current_span().set_attribute("task_cache.hit", response is not None)
+        get_metrics().record_task_cache_lookup(response is not None)
+        return response
+
+    @abstractmethod
+    async def _get(self, key: str) -> InvokeResponse | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, response: InvokeResponse) -> None:
+        pass
+
+
+class InMemoryTaskResultCache(TaskResultCache):
+    def __init__(self, ttl: int = 3600, max_entries: int = 1000):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, InvokeResponse]] = OrderedDict()
+
+    async def _get(self, key: str) -> InvokeResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    async def set(self, key: str, response: InvokeResponse) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class RedisTaskResultCache(TaskResultCache):
+    def __init__(self, r: redis.Redis, ttl: int = 3600):
+        self._r = r
+        self._ttl = ttl
+
+    @staticmethod
+    def _redis_key(key: str) -> str:
+        return f"task-result:{key}"
+
+    async def _get(self, key: str) -> InvokeResponse | None:
+        data = await self._r.get(self._redis_key(key))
+        if data is None:
+            return None
+        return InvokeResponse.model_validate_json(data)
+
+    async def set(self, key: str, response: InvokeResponse) -> None:
+        await self._r.set(self._redis_key(key), response.model_dump_json(), ex=self._ttl)
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import uuid
 from collections.abc import AsyncIterable
 from contextlib import nullcontext
@@ -8,13 +10,23 @@ from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from opentelemetry.propagate import Context, extract
 from pydantic_yaml import parse_yaml_file_as
-from ska_utils import AppConfig, get_telemetry, initialize_telemetry, strtobool
+from redis import Redis
+from ska_utils import (
+    AppConfig,
+    get_telemetry,
+    initialize_telemetry,
+    strtobool,
+)
 
 from collab_orchestrator.agents import (
     AgentGateway,
     BaseAgent,
     BaseAgentBuilder,
+    InMemoryTaskResultCache,
+    RedisTaskResultCache,
+    ResultCacheSpec,
     TaskAgent,
+    TaskResultCache,
 )
 from collab_orchestrator.co_types import BaseConfig, BaseMultiModalInput, KindHandler
 from collab_orchestrator.configs import (
@@ -22,14 +34,23 @@ from collab_orchestrator.configs import (
     TA_AGW_HOST,
     TA_AGW_KEY,
     TA_AGW_SECURE,
+    TA_DISTRIBUTED_TASKS_ENABLED,
+    TA_DISTRIBUTED_TASKS_MAX_LEN,
+    TA_DISTRIBUTED_TASKS_TIMEOUT,
+    TA_DISTRIBUTED_TASKS_TOPIC,
+    TA_DISTRIBUTED_TASKS_WORKERS,
+    TA_EVENT_LOG_ENABLED,
     TA_REDIS_DB,  # ➋ NEW
     TA_REDIS_HOST,  # ➋
     TA_REDIS_PORT,  # ➋
     TA_SERVICE_CONFIG,
 )
+from collab_orchestrator.distributed_tasks import DistributedTaskClient, TaskWorker
 from collab_orchestrator.handler_factory import HandlerFactory
 from collab_orchestrator.planning_handler.pending_plans import PendingPlanStore  # ➌
 from collab_orchestrator.planning_handler.plan import Plan  # ➌
+from collab_orchestrator.planning_handler.planning_handler import PlanningHandler
+from collab_orchestrator.session_event_log import SessionEventLog
 
 
 # ----------------------------------------------------------------- helpers
@@ -58,6 +79,7 @@ else:
 
 initialize_telemetry(config.service_name, app_config)
 t = get_telemetry()
+logger = t.get_logger(__name__)
 
 # ----------------------------------------------------------------- globals
 agent_gateway: AgentGateway
@@ -70,9 +92,25 @@ handler: KindHandler
 hitl_enabled = bool(getattr(config.spec, "human_in_the_loop", False))
 plan_store: PendingPlanStore | None = PendingPlanStore() if hitl_enabled else None
 
-# Browser session cache (unchanged)
+# Task result cache for deterministic agents (opt-in via spec.result_cache)
+result_cache_config = getattr(config.spec, "result_cache", None)
+result_cache_spec: ResultCacheSpec | None = (
+    ResultCacheSpec.model_validate(result_cache_config) if result_cache_config else None
+)
+
+# Browser session cache (used when the event log is disabled)
 session_cache: dict[str, BaseMultiModalInput] = {}
 
+# Redis event log - runs outlive their HTTP connection and can be replayed/resumed
+event_log_enabled = strtobool(app_config.get(TA_EVENT_LOG_ENABLED.env_name))
+event_log: SessionEventLog | None = SessionEventLog() if event_log_enabled else None
+background_runs: set[asyncio.Task] = set()
+
+# Distributed plan tasks - published to a Redis Stream and consumed by all replicas
+distributed_tasks_enabled = strtobool(app_config.get(TA_DISTRIBUTED_TASKS_ENABLED.env_name))
+task_client: DistributedTaskClient | None = None
+task_workers: list[TaskWorker] = []
+
 
 # ----------------------------------------------------------------- startup
 async def initialize():
@@ -81,8 +119,9 @@ async def initialize():
     with (
         t.tracer.start_as_current_span("initialization") if t.telemetry_enabled() else nullcontext()
     ):
-        # --- fail fast if HITL requested but Redis unreachable
-        if hitl_enabled:
+        # --- fail fast if a Redis-backed feature is requested but Redis unreachable
+        redis_cache = result_cache_spec is not None and result_cache_spec.backend == "redis"
+        if hitl_enabled or event_log_enabled or distributed_tasks_enabled or redis_cache:
             try:
                 r = redis.Redis(
                     host=app_config.get(TA_REDIS_HOST.env_name) or "localhost",
@@ -92,7 +131,7 @@ async def initialize():
                 )
                 await r.ping()
             except Exception as e:
-                raise RuntimeError(f"HITL enabled but Redis unreachable: {e}") from e
+                raise RuntimeError(f"Redis required but unreachable: {e}") from e
 
         agent_gateway = AgentGateway(
             host=app_config.get(TA_AGW_HOST.env_name),
@@ -101,11 +140,14 @@ async def initialize():
         )
         base_agent_builder = BaseAgentBuilder(gateway=agent_gateway)
 
+        result_cache = build_result_cache()
         for task_agent_name in config.spec.agents:
             task_agent_base = await base_agent_builder.build_agent(task_agent_name)
             task_agents_bases.append(task_agent_base)
 
             task_agent = TaskAgent(agent=task_agent_base, gateway=agent_gateway)
+            if result_cache is not None and task_agent_name in result_cache_spec.agents:
+                task_agent.result_cache = result_cache
             task_agents.append(task_agent)
 
         handler_factory = HandlerFactory(
@@ -120,9 +162,66 @@ async def initialize():
             raise ValueError(f"Unknown kind: {config.kind}")
 
         handler = handler_factory.get_handler(config.kind)
+        if event_log is not None and isinstance(handler, PlanningHandler):
+            handler.event_log = event_log
+        if distributed_tasks_enabled and isinstance(handler, PlanningHandler):
+            handler.task_client = start_distributed_tasks()
         await handler.initialize()
 
 
+def build_result_cache() -> TaskResultCache | None:
+    if result_cache_spec is None:
+        return None
+    if result_cache_spec.backend == "redis":
+        return RedisTaskResultCache(
+            redis.Redis(
+                host=app_config.get(TA_REDIS_HOST.env_name) or "localhost",
+                port=int(app_config.get(TA_REDIS_PORT.env_name) or 6379),
+                db=int(app_config.get(TA_REDIS_DB.env_name) or 0),
+                decode_responses=True,
+            ),
+            ttl=result_cache_spec.ttl,
+        )
+    return InMemoryTaskResultCache(
+        ttl=result_cache_spec.ttl, max_entries=result_cache_spec.max_entries
+    )
+
+
+def start_distributed_tasks() -> DistributedTaskClient:
+    global task_client
+
+    r = Redis(
+        host=app_config.get(TA_REDIS_HOST.env_name) or "localhost",
+        port=int(app_config.get(TA_REDIS_PORT.env_name) or 6379),
+        db=int(app_config.get(TA_REDIS_DB.env_name) or 0),
+    )
+    topic_name = (
+        app_config.get(TA_DISTRIBUTED_TASKS_TOPIC.env_name)
+        or f"{config.service_name}:{config.version}:tasks"
+    )
+    loop = asyncio.get_running_loop()
+    for _ in range(int(app_config.get(TA_DISTRIBUTED_TASKS_WORKERS.env_name))):
+        worker = TaskWorker(topic_name, r, task_agents, loop)
+        worker.initialize()
+        task_workers.append(worker)
+
+    task_client = DistributedTaskClient(
+        topic_name,
+        r,
+        timeout=float(app_config.get(TA_DISTRIBUTED_TASKS_TIMEOUT.env_name)),
+        max_len=int(app_config.get(TA_DISTRIBUTED_TASKS_MAX_LEN.env_name)),
+    )
+    task_client.initialize(loop)
+    return task_client
+
+
+async def shutdown():
+    for worker in task_workers:
+        worker.shutdown()
+    if task_client is not None:
+        task_client.shutdown()
+
+
 # ----------------------------------------------------------------- FastAPI app
 app = FastAPI(
     openapi_url=f"/{config.service_name}/{config.version}/openapi.json",
@@ -130,6 +229,7 @@ app = FastAPI(
     redoc_url=f"/{config.service_name}/{config.version}/redoc",
 )
 app.add_event_handler("startup", initialize)
+app.add_event_handler("shutdown", shutdown)
 
 
 # ----------------------------------------------------------------- helper to run handler in a span
@@ -145,6 +245,49 @@ async def invoke_with_span(
             yield event
 
 
+# ----------------------------------------------------------------- event log runs
+def _run_in_background(session_id: str, events: AsyncIterable[str]) -> None:
+    task = asyncio.create_task(event_log.record(session_id, events))
+    background_runs.add(task)
+    task.add_done_callback(background_runs.discard)
+    task.add_done_callback(functools.partial(_log_run_failure, session_id))
+
+
+def _log_run_failure(session_id: str, task: asyncio.Task) -> None:
+    # Nothing awaits background runs, so their failures are only reported here
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Run of session {session_id} failed", exc_info=task.exception())
+
+
+async def _resume_run(session_id: str) -> bool:
+    """Resumes a run whose worker went away; returns False if it cannot be resumed."""
+    if not isinstance(handler, PlanningHandler):
+        return False
+    if await event_log.get_checkpoint(session_id, Plan) is None:
+        return False
+    if await event_log.acquire(session_id):
+        _run_in_background(session_id, handler.resume(session_id))
+    return True
+
+
+async def start_logged_run(
+    context: Context, chat_history: BaseMultiModalInput, request: str
+) -> StreamingResponse:
+    session_id = chat_history.session_id
+    if not await event_log.acquire(session_id):
+        raise HTTPException(status_code=409, detail="Session already has a run in progress")
+    await event_log.reset(session_id)
+    _run_in_background(session_id, invoke_with_span(context, chat_history, request))
+    return follow_logged_run(session_id)
+
+
+def follow_logged_run(session_id: str, last_event_id: str | None = None) -> StreamingResponse:
+    return StreamingResponse(
+        event_log.follow(session_id, last_event_id, lambda: _resume_run(session_id)),
+        media_type="text/event-stream",
+    )
+
+
 # ----------------------------------------------------------------- endpoints
 @app.post(f"/{config.service_name}/{config.version}")
 @docstring_parameter(description)
@@ -175,12 +318,28 @@ async def invoke_sse(chat_history: BaseMultiModalInput, request: Request):
 
     request = chat_history.chat_history.pop()
 
+    if event_log is not None:
+        return await start_logged_run(context, chat_history, request.items[-1].content)
     return StreamingResponse(
         invoke_with_span(context, chat_history, request.items[-1].content),
         media_type="text/event-stream",
     )
 
 
+if event_log_enabled:
+
+    @app.get(f"/{config.service_name}/{config.version}/sse/{{session_id}}")
+    async def reconnect_sse(session_id: str, request: Request):
+        """
+        Reconnect to a session's event stream - Replays the events after the
+        `Last-Event-ID` header (or all events if absent) and then follows the
+        run until it completes, resuming it if its worker went away.
+        """
+        if not await event_log.exists(session_id):
+            raise HTTPException(status_code=404, detail="Session ID not found")
+        return follow_logged_run(session_id, request.headers.get("last-event-id"))
+
+
 # ----------- Browser helper pair --------------------------------------------
 @app.post(f"/{config.service_name}/{config.version}/browser")
 @docstring_parameter(description)
@@ -204,7 +363,10 @@ async def invoke_browser(chat_history: BaseMultiModalInput):
     else:
         session_id = str(uuid.uuid4().hex)
         chat_history.session_id = session_id
-    session_cache[session_id] = chat_history
+    if event_log is not None:
+        await event_log.save_input(session_id, chat_history)
+    else:
+        session_cache[session_id] = chat_history
 
     return {"session_id": session_id}
 
@@ -228,6 +390,18 @@ async def get_browser_response(session_id: str, request: Request):
     ):
         if not session_id:
             raise HTTPException(status_code=400, detail="Session ID is required")
+
+        if event_log is not None:
+            # EventSource sends Last-Event-ID automatically when it reconnects
+            last_event_id = request.headers.get("last-event-id")
+            if last_event_id and await event_log.exists(session_id):
+                return follow_logged_run(session_id, last_event_id)
+            chat_history = await event_log.get_input(session_id)
+            if chat_history is None:
+                raise HTTPException(status_code=400, detail="Session ID not found")
+            request = chat_history.chat_history.pop()
+            return await start_logged_run(context, chat_history, request.items[-1].content)
+
         if session_id not in session_cache:
             raise HTTPException(status_code=400, detail="Session ID not found")
 
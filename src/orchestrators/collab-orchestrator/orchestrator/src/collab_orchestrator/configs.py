@@ -8,6 +8,27 @@ TA_REDIS_HOST = Config(env_name="TA_REDIS_HOST", is_required=False, default_valu
 TA_REDIS_PORT = Config(env_name="TA_REDIS_PORT", is_required=False, default_value=None)
 TA_REDIS_DB = Config(env_name="TA_REDIS_DB", is_required=False, default_value=None)
 TA_REDIS_TTL = Config(env_name="TA_REDIS_TTL", is_required=False, default_value=None)
+TA_HITL_POLL_INTERVAL = Config(
+    env_name="TA_HITL_POLL_INTERVAL", is_required=False, default_value="30"
+)
+TA_EVENT_LOG_ENABLED = Config(
+    env_name="TA_EVENT_LOG_ENABLED", is_required=False, default_value="false"
+)
+TA_DISTRIBUTED_TASKS_ENABLED = Config(
+    env_name="TA_DISTRIBUTED_TASKS_ENABLED", is_required=False, default_value="false"
+)
+TA_DISTRIBUTED_TASKS_TOPIC = Config(
+    env_name="TA_DISTRIBUTED_TASKS_TOPIC", is_required=False, default_value=None
+)
+TA_DISTRIBUTED_TASKS_WORKERS = Config(
+    env_name="TA_DISTRIBUTED_TASKS_WORKERS", is_required=False, default_value="4"
+)
+TA_DISTRIBUTED_TASKS_TIMEOUT = Config(
+    env_name="TA_DISTRIBUTED_TASKS_TIMEOUT", is_required=False, default_value="600"
+)
+TA_DISTRIBUTED_TASKS_MAX_LEN = Config(
+    env_name="TA_DISTRIBUTED_TASKS_MAX_LEN", is_required=False, default_value="10000"
+)
 
 CONFIGS = [
     TA_AGW_KEY,
@@ -18,4 +39,11 @@ CONFIGS = [
     TA_REDIS_PORT,
     TA_REDIS_DB,
     TA_REDIS_TTL,
+    TA_HITL_POLL_INTERVAL,
+    TA_EVENT_LOG_ENABLED,
+    TA_DISTRIBUTED_TASKS_ENABLED,
+    TA_DISTRIBUTED_TASKS_TOPIC,
+    TA_DISTRIBUTED_TASKS_WORKERS,
+    TA_DISTRIBUTED_TASKS_TIMEOUT,
+    TA_DISTRIBUTED_TASKS_MAX_LEN,
 ]
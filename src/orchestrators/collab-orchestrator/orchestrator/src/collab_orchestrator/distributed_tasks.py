@@ -0,0 +1,194 @@
+import asyncio
+import uuid
+from collections.abc import Callable
+
+from pydantic import BaseModel
+from redis import Redis
+from ska_utils import RedisStreamsEventHandler, RedisStreamsEventPublisher, get_telemetry
+
+from collab_orchestrator.agents import PreRequisite, TaskAgent
+from collab_orchestrator.co_types import InvokeResponse
+
+
+class RemoteTaskRequest(BaseModel):
+    request_id: str
+    reply_topic: str
+    session_id: str | None = None
+    task_agent: str
+    task_goal: str
+    pre_requisites: list[PreRequisite]
+
+
+class RemoteTaskResult(BaseModel):
+    request_id: str
+    response: InvokeResponse | None = None
+    error: str | None = None
+
+
+# Replies are read as soon as they arrive, so their streams are kept short
+_REPLY_MAX_LEN = 1000
+# Reply streams of processes which went away without cleaning up expire after this
+_REPLY_TTL_SECONDS = 300
+
+
+class TaskWorker(RedisStreamsEventHandler[RemoteTaskRequest]):
+    """Consumes plan tasks from the shared task stream and publishes their results.
+
+    Every orchestrator running in distributed mode joins the same consumer
+    group, so the tasks of a plan are spread across all replicas. Events are
+    received on the worker's own thread, but tasks are performed on ``loop``,
+    the application's event loop, which the task agents and their HTTP
+    sessions and caches belong to.
+
+    A task whose worker crashes is left pending and retried by another worker
+    once it is reclaimed. If it fails to complete too many times, it is moved
+    to the dead-letter stream and an error is sent back, so that the plan
+    doesn't wait for the full timeout.
+    """
+
+    def __init__(
+        self,
+        topic_name: str,
+        r: Redis,
+        task_agents: list[TaskAgent],
+        loop: asyncio.AbstractEventLoop,
+    ):
+        super().__init__(topic_name, r, RemoteTaskRequest)
+        self._task_agents = {
+            f"{task_agent.agent.name}:{task_agent.agent.version}": task_agent
+            for task_agent in task_agents
+        }
+        self._loop = loop
+
+    async def _perform_task(self, event: RemoteTaskRequest) -> InvokeResponse:
+        task_agent = self._task_agents.get(event.task_agent)
+        if not task_agent:
+            raise ValueError(f"Task agent {event.task_agent} not found.")
+        return await task_agent.perform_task(
+            event.session_id, event.task_goal, event.pre_requisites
+        )
+
+    def _publish_result(self, reply_topic: str, result: RemoteTaskResult) -> None:
+        with self._r.pipeline(transaction=False) as pipe:
+            pipe.xadd(
+                reply_topic,
+                {"event_data": result.model_dump_json()},
+                maxlen=_REPLY_MAX_LEN,
+                approximate=True,
+            )
+            pipe.expire(reply_topic, _REPLY_TTL_SECONDS)
+            pipe.execute()
+
+    async def process_event(self, event: RemoteTaskRequest) -> None:
+        result: RemoteTaskResult
+        try:
+            response = await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(self._perform_task(event), self._loop)
+            )
+            result = RemoteTaskResult(request_id=event.request_id, response=response)
+        except Exception as e:
+            self._logger.error(f"Remote task {event.request_id} failed: {e}")
+            result = RemoteTaskResult(request_id=event.request_id, error=str(e))
+        self._publish_result(event.reply_topic, result)
+
+    async def _dead_letter(self, event_id: bytes | str, fields: dict, reason: str) -> None:
+        await super()._dead_letter(event_id, fields, reason)
+        try:
+            event = self._decode_event(fields)
+        except Exception:
+            return
+        self._publish_result(
+            event.reply_topic, RemoteTaskResult(request_id=event.request_id, error=reason)
+        )
+
+
+class _TaskResultListener(RedisStreamsEventHandler[RemoteTaskResult]):
+    def __init__(self, topic_name: str, r: Redis, on_result: Callable[[RemoteTaskResult], None]):
+        super().__init__(topic_name, r, RemoteTaskResult)
+        self._on_result = on_result
+
+    async def process_event(self, event: RemoteTaskResult) -> None:
+        self._on_result(event)
+
+
+class DistributedTaskClient:
+    """Hands plan tasks to the worker pool and waits for their results.
+
+    Results come back on a reply stream owned by this process and are matched
+    to the waiting coroutine by request id. The reply stream's expiry is
+    refreshed while the process is alive, so the stream and its consumer group
+    are removed after a crash. The task stream is trimmed to about ``max_len``
+    entries, which must exceed the number of tasks waiting to be performed.
+    """
+
+    def __init__(
+        self, topic_name: str, r: Redis, timeout: float = 600.0, max_len: int | None = 10000
+    ):
+        self._logger = get_telemetry().get_logger(self.__class__.__name__)
+        self._topic_name = topic_name
+        self._reply_topic = f"{topic_name}:results:{uuid.uuid4().hex}"
+        self._r = r
+        self._timeout = timeout
+        self._publisher = RedisStreamsEventPublisher(r, max_len=max_len)
+        self._listener = _TaskResultListener(self._reply_topic, r, self._on_result)
+        self._pending: dict[str, asyncio.Future[RemoteTaskResult]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._keepalive: asyncio.Task[None] | None = None
+
+    def initialize(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._listener.initialize()
+        self._keepalive = loop.create_task(self._keep_reply_topic())
+
+    def shutdown(self) -> None:
+        if self._keepalive is not None:
+            self._keepalive.cancel()
+        self._listener.shutdown()
+        self._r.delete(self._reply_topic)
+
+    async def _keep_reply_topic(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self._r.expire, self._reply_topic, _REPLY_TTL_SECONDS)
+            except Exception as e:
+                self._logger.warning(f"Could not refresh expiry of {self._reply_topic}: {e}")
+            await asyncio.sleep(_REPLY_TTL_SECONDS / 3)
+
+    def _on_result(self, result: RemoteTaskResult) -> None:
+        # Called from the listener thread; hand the result over to the request's loop
+        self._loop.call_soon_threadsafe(self._resolve, result)
+
+    def _resolve(self, result: RemoteTaskResult) -> None:
+        future = self._pending.get(result.request_id)
+        if future is None or future.done():
+            self._logger.warning(f"Discarding result for unknown task {result.request_id}")
+            return
+        future.set_result(result)
+
+    async def perform_task(
+        self,
+        task_agent: str,
+        session_id: str | None,
+        goal: str,
+        pre_requisites: list[PreRequisite],
+    ) -> InvokeResponse:
+        request = RemoteTaskRequest(
+            request_id=uuid.uuid4().hex,
+            reply_topic=self._reply_topic,
+            session_id=session_id,
+            task_agent=task_agent,
+            task_goal=goal,
+            pre_requisites=pre_requisites,
+        )
+        future: asyncio.Future[RemoteTaskResult] = asyncio.get_running_loop().create_future()
+        self._pending[request.request_id] = future
+        try:
+            await asyncio.to_thread(
+                self._publisher.publish_event, self._topic_name, request.model_dump_json()
+            )
+            result = await asyncio.wait_for(future, self._timeout)
+        finally:
+            self._pending.pop(request.request_id, None)
+        if result.error is not None:
+            raise RuntimeError(result.error)
+        return result.response
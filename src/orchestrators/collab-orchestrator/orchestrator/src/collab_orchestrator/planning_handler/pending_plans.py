@@ -5,9 +5,99 @@ import json
 from enum import Enum
 
 import redis.asyncio as redis
-from ska_utils import AppConfig
-
-from collab_orchestrator.configs import TA_REDIS_DB, TA_REDIS_HOST, TA_REDIS_PORT, TA_REDIS_TTL
+from ska_utils import AppConfig, Singleton, get_telemetry
+
+from collab_orchestrator.configs import (
+    TA_HITL_POLL_INTERVAL,
+    TA_REDIS_DB,
+    TA_REDIS_HOST,
+    TA_REDIS_PORT,
+    TA_REDIS_TTL,
+)
+
+KEY_PREFIX = "pending-plan:"
+
+
+class PendingPlanListener(metaclass=Singleton):
+    """Per-process pattern subscriber for pending plan decisions.
+
+    A single ``pending-plan:*`` subscription wakes every waiting plan, so a
+    paused plan costs a future in a dict rather than its own Redis connection.
+    Decisions published while the subscription was reconnecting, as well as
+    plans whose key expired, are picked up by a periodic poll of the waiters.
+    """
+
+    def __init__(
+        self,
+        r: redis.Redis,
+        poll_interval: float = 30.0,
+        reconnect_delay: float = 1.0,
+    ) -> None:
+        self._logger = get_telemetry().get_logger(self.__class__.__name__)
+        self._r = r
+        self._poll_interval = poll_interval
+        self._reconnect_delay = reconnect_delay
+        self._waiters: dict[str, set[asyncio.Future[None]]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def register(self, sid: str) -> asyncio.Future[None]:
+        """Returns a future which resolves once a decision for ``sid`` may be available."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(sid, set()).add(future)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    def unregister(self, sid: str, future: asyncio.Future[None]) -> None:
+        futures = self._waiters.get(sid)
+        if futures is None:
+            return
+        futures.discard(future)
+        if not futures:
+            del self._waiters[sid]
+
+    def _resolve(self, sid: str) -> None:
+        for future in self._waiters.pop(sid, set()):
+            if not future.done():
+                future.set_result(None)
+
+    async def _poll(self) -> None:
+        sids = list(self._waiters)
+        if not sids:
+            return
+        async with self._r.pipeline(transaction=False) as pipe:
+            for sid in sids:
+                pipe.hget(f"{KEY_PREFIX}{sid}", "status")
+            statuses = await pipe.execute()
+        for sid, status in zip(sids, statuses, strict=True):
+            # A missing key means the plan expired, which also ends the wait
+            if status != "pending":
+                self._resolve(sid)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            pubsub = self._r.pubsub()
+            try:
+                await pubsub.psubscribe(f"{KEY_PREFIX}*")
+                await self._poll()
+                last_poll = loop.time()
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=self._poll_interval
+                    )
+                    if message and message.get("type") == "pmessage":
+                        self._resolve(message["channel"].removeprefix(KEY_PREFIX))
+                    if loop.time() - last_poll >= self._poll_interval:
+                        await self._poll()
+                        last_poll = loop.time()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.warning(f"Pending plan subscription failed, reconnecting: {e}")
+                await asyncio.sleep(self._reconnect_delay)
+            finally:
+                await pubsub.aclose()
 
 
 class PendingPlanStore:
@@ -26,9 +116,12 @@ class PendingPlanStore:
             db=int(cfg.get(TA_REDIS_DB.env_name) or 0),
             decode_responses=True,
         )
+        self._listener = PendingPlanListener(
+            self._r, poll_interval=float(cfg.get(TA_HITL_POLL_INTERVAL.env_name) or 30)
+        )
 
     def key(self, sid: str) -> str:
-        return f"pending-plan:{sid}"
+        return f"{KEY_PREFIX}{sid}"
 
     # -------- CRUD ----------
     async def save(self, sid: str, plan_dict: dict) -> None:
@@ -75,30 +168,19 @@ class PendingPlanStore:
         Suspend until status != pending OR key expires OR timeout.
         Returns full hash dict, or None on timeout/expiry.
         """
-        # quick pre-check
-        snap = await self.get(sid)
-        if snap and snap["status"] != "pending":
-            return snap
-
-        pubsub = self._r.pubsub()
-        await pubsub.subscribe(self.key(sid))
+        # register before the pre-check so a decision made in between is not missed
+        decided = self._listener.register(sid)
         try:
-
-            async def _listen():
-                async for message in pubsub.listen():
-                    # Only respond for actual published messages, not subscription confirmations
-                    if message.get("type") == "message":
-                        return
-
-            waiter = asyncio.create_task(_listen())
+            snap = await self.get(sid)
+            if snap is None or snap["status"] != "pending":
+                return snap
             try:
                 if timeout and timeout > 0:
-                    await asyncio.wait_for(waiter, timeout)
+                    await asyncio.wait_for(decided, timeout)
                 else:
-                    await waiter
+                    await decided
             except TimeoutError:
                 return None
             return await self.get(sid)
         finally:
-            await pubsub.unsubscribe(self.key(sid))
-            await pubsub.close()
+            self._listener.unregister(sid, decided)
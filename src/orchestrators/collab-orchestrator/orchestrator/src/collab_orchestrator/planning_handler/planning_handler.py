@@ -21,7 +21,9 @@ from collab_orchestrator.co_types import (
     TokenUsage,
     new_event_response,
 )
+from collab_orchestrator.distributed_tasks import DistributedTaskClient
 from collab_orchestrator.planning_handler.pending_plans import PendingPlanStore  # HITL support
+from collab_orchestrator.planning_handler.plan import ExecutableTask, Plan
 from collab_orchestrator.planning_handler.plan_manager import (
     PlanManager,
     PlanningFailedException,
@@ -29,6 +31,7 @@ from collab_orchestrator.planning_handler.plan_manager import (
 from collab_orchestrator.planning_handler.planning_agent import PlanningAgent
 from collab_orchestrator.planning_handler.step_executor import StepExecutor
 from collab_orchestrator.planning_handler.types import PlanningSpec
+from collab_orchestrator.session_event_log import SessionEventLog
 
 
 class PlanningHandler(KindHandler):
@@ -52,6 +55,10 @@ class PlanningHandler(KindHandler):
         self.timeout = int(getattr(config.spec, "hitl_timeout", 0) or 0)
         self.store = PendingPlanStore() if self.hitl else None
         # End HITL support
+        # Checkpoints task results so an interrupted plan can be resumed
+        self.event_log: SessionEventLog | None = None
+        # Hands plan tasks to the distributed worker pool when enabled
+        self.task_client: DistributedTaskClient | None = None
 
     def _start_span(self, name: str, attributes: dict | None = None):
         if self.t.telemetry_enabled():
@@ -146,39 +153,67 @@ class PlanningHandler(KindHandler):
                     await self.store.delete(session_id)
                 # End HITL support
 
-            with self._start_span(name="execute-plan"):
-                step_executor = StepExecutor(self.task_agents)
-                for step in plan.steps:
-                    try:
-                        if self.stream_tokens:
-                            async for result in step_executor.execute_step_sse(
-                                session_id, source, request_id, step
-                            ):
-                                yield result
-                        else:
-                            async for result in step_executor.execute_step(
-                                session_id, source, request_id, step
-                            ):
-                                yield result
-                    except Exception as e:
-                        yield new_event_response(
-                            EventType.ERROR,
-                            ErrorResponse(
-                                session_id=session_id,
-                                source=source,
-                                request_id=request_id,
-                                status_code=500,
-                                detail=str(e),
-                            ),
-                        )
+            async for result in self._execute_plan(plan, session_id, source, request_id):
+                yield result
 
-            yield new_event_response(
-                EventType.FINAL_RESPONSE,
-                InvokeResponse(
-                    session_id=session_id,
-                    source=source,
-                    request_id=request_id,
-                    token_usage=TokenUsage(completion_tokens=0, prompt_tokens=0, total_tokens=0),
-                    output_raw=plan.steps[-1].step_tasks[0].result,
-                ),
-            )
+    async def resume(self, session_id: str) -> AsyncIterable:
+        """Continues a checkpointed plan, skipping the tasks which already completed."""
+        plan = await self.event_log.get_checkpoint(session_id, Plan)
+        if plan is None:
+            raise ValueError(f"No checkpoint found for session {session_id}")
+        with self._start_span(name="resume-plan", attributes={"session_id": session_id}):
+            async for result in self._execute_plan(plan, session_id, plan.source, plan.request_id):
+                yield result
+
+    async def _execute_plan(
+        self, plan: Plan, session_id: str, source: str, request_id: str
+    ) -> AsyncIterable:
+        with self._start_span(name="execute-plan"):
+            step_executor = StepExecutor(self.task_agents)
+            if self.task_client is not None:
+                step_executor.task_client = self.task_client
+            if self.event_log is not None:
+                plan.session_id = session_id
+                plan.source = source
+                plan.request_id = request_id
+                await self.event_log.save_checkpoint(session_id, plan)
+
+                async def checkpoint(_task: ExecutableTask):
+                    await self.event_log.save_checkpoint(session_id, plan)
+
+                step_executor.on_task_complete = checkpoint
+            for step in plan.steps:
+                try:
+                    # Token streaming is not available from remote workers
+                    if self.stream_tokens and self.task_client is None:
+                        async for result in step_executor.execute_step_sse(
+                            session_id, source, request_id, step
+                        ):
+                            yield result
+                    else:
+                        async for result in step_executor.execute_step(
+                            session_id, source, request_id, step
+                        ):
+                            yield result
+                except Exception as e:
+                    yield new_event_response(
+                        EventType.ERROR,
+                        ErrorResponse(
+                            session_id=session_id,
+                            source=source,
+                            request_id=request_id,
+                            status_code=500,
+                            detail=str(e),
+                        ),
+                    )
+
+        yield new_event_response(
+            EventType.FINAL_RESPONSE,
+            InvokeResponse(
+                session_id=session_id,
+                source=source,
+                request_id=request_id,
+                token_usage=TokenUsage(completion_tokens=0, prompt_tokens=0, total_tokens=0),
+                output_raw=plan.steps[-1].step_tasks[0].result,
+            ),
+        )
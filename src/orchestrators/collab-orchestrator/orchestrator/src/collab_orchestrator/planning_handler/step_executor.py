@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Awaitable, Callable
 from contextlib import nullcontext
 
 from httpx_sse import ServerSentEvent
@@ -14,17 +14,46 @@ from collab_orchestrator.co_types import (
     PartialResponse,
     new_event_response,
 )
+from collab_orchestrator.distributed_tasks import DistributedTaskClient
 from collab_orchestrator.planning_handler.plan import ExecutableTask, Step, TaskStatus
 
 
 class StepExecutor:
-    def __init__(self, task_agents: list[TaskAgent]):
+    def __init__(
+        self,
+        task_agents: list[TaskAgent],
+        on_task_complete: Callable[[ExecutableTask], Awaitable[None]] | None = None,
+    ):
         self.task_agents: dict[str, TaskAgent] = {}
         for task_agent in task_agents:
             self.task_agents[f"{task_agent.agent.name}:{task_agent.agent.version}"] = task_agent
         self.task_accumulator: dict[str, ExecutableTask] = {}
+        self.on_task_complete = on_task_complete
+        # When set, tasks are executed by the distributed worker pool
+        self.task_client: DistributedTaskClient | None = None
         self.t = get_telemetry()
 
+    def _pending_tasks(self, step: Step) -> list[ExecutableTask]:
+        """Returns the tasks of a step which still need to run.
+
+        Tasks already completed (e.g. when resuming a checkpointed plan) are
+        only recorded so that later tasks can use them as prerequisites.
+        """
+        pending: list[ExecutableTask] = []
+        for task in step.step_tasks:
+            if task.status == TaskStatus.DONE:
+                self.task_accumulator[task.task_id] = task
+            else:
+                pending.append(task)
+        return pending
+
+    async def _complete_task(self, task: ExecutableTask, result: str | None):
+        task.result = result
+        task.status = TaskStatus.DONE
+        self.task_accumulator[task.task_id] = task
+        if self.on_task_complete is not None:
+            await self.on_task_complete(task)
+
     @staticmethod
     def _task_to_pre_requisite(task: ExecutableTask) -> PreRequisite:
         return PreRequisite(goal=task.task_goal, result=task.result)
@@ -45,10 +74,13 @@ class StepExecutor:
                 StepExecutor._task_to_pre_requisite(self.task_accumulator[pre_requisite])
                 for pre_requisite in task.prerequisite_tasks
             ]
-            response = await task_agent.perform_task(session_id, task.task_goal, pre_requisites)
-            task.result = response.output_raw
-            task.status = TaskStatus.DONE
-            self.task_accumulator[task.task_id] = task
+            if self.task_client is not None:
+                response = await self.task_client.perform_task(
+                    task.task_agent, session_id, task.task_goal, pre_requisites
+                )
+            else:
+                response = await task_agent.perform_task(session_id, task.task_goal, pre_requisites)
+            await self._complete_task(task, response.output_raw)
             return response
 
     async def _execute_task_sse(
@@ -75,9 +107,7 @@ class StepExecutor:
                 if isinstance(content, PartialResponse):
                     yield new_event_response(EventType.PARTIAL_RESPONSE, content)
                 elif isinstance(content, InvokeResponse):
-                    task.result = content.output_raw
-                    task.status = TaskStatus.DONE
-                    self.task_accumulator[task.task_id] = task
+                    await self._complete_task(task, content.output_raw)
                     yield new_event_response(EventType.FINAL_RESPONSE, content)
                 elif isinstance(content, ServerSentEvent):
                     yield f"event: {content.event}\ndata: {content.data}\n\n"
@@ -103,7 +133,7 @@ class StepExecutor:
             if self.t.telemetry_enabled()
             else nullcontext()
         ):
-            for task in step.step_tasks:
+            for task in self._pending_tasks(step):
                 yield new_event_response(
                     EventType.AGENT_REQUEST,
                     AgentRequestEvent(
@@ -156,7 +186,7 @@ class StepExecutor:
                 async for result in self._execute_task_sse(session_id, source, request_id, task):
                     yield result
 
-            streams = [process_task(task) for task in step.step_tasks]
+            streams = [process_task(task) for task in self._pending_tasks(step)]
             async for result in self._merge_async_iterables(streams):
                 yield result
 
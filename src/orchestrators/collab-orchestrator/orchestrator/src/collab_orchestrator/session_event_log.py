@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterable, Awaitable, Callable
+from typing import TypeVar
+
+import redis.asyncio as redis
+from pydantic import BaseModel
+from ska_utils import AppConfig, KeepaliveMessage
+
+from collab_orchestrator.co_types import BaseMultiModalInput, EventType, new_event_response
+from collab_orchestrator.configs import TA_REDIS_DB, TA_REDIS_HOST, TA_REDIS_PORT, TA_REDIS_TTL
+
+T = TypeVar("T", bound=BaseModel)
+
+_END_FIELD = "end"
+_EVENT_FIELD = "event"
+
+
+class SessionEventLog:
+    """Redis-backed event log, checkpoints and session inputs for orchestrator runs.
+
+    Every event a handler produces for a session is appended to a Redis Stream,
+    so a client can disconnect and later replay from its ``Last-Event-ID``
+    while the run continues in the background. A short-lived lease, refreshed
+    by the worker producing the events, tells readers whether the run is still
+    alive or has to be resumed from its last checkpoint.
+    """
+
+    def __init__(self, lease_seconds: int = 15, block_ms: int = 15000) -> None:
+        cfg = AppConfig()
+        host = cfg.get(TA_REDIS_HOST.env_name)
+        if host is None:
+            raise RuntimeError("Event log requested but TA_REDIS_HOST not set")
+
+        self._ttl = int(cfg.get(TA_REDIS_TTL.env_name) or 3600)
+        self._lease_seconds = lease_seconds
+        self._block_ms = block_ms
+        self._r: redis.Redis = redis.Redis(
+            host=host,
+            port=int(cfg.get(TA_REDIS_PORT.env_name) or 6379),
+            db=int(cfg.get(TA_REDIS_DB.env_name) or 0),
+            decode_responses=True,
+        )
+
+    @staticmethod
+    def events_key(sid: str) -> str:
+        return f"session-events:{sid}"
+
+    @staticmethod
+    def checkpoint_key(sid: str) -> str:
+        return f"session-checkpoint:{sid}"
+
+    @staticmethod
+    def lease_key(sid: str) -> str:
+        return f"session-lease:{sid}"
+
+    @staticmethod
+    def input_key(sid: str) -> str:
+        return f"session-input:{sid}"
+
+    # -------- session inputs ----------
+    async def save_input(self, sid: str, chat_history: BaseMultiModalInput) -> None:
+        await self._r.set(self.input_key(sid), chat_history.model_dump_json(), ex=self._ttl)
+
+    async def get_input(self, sid: str) -> BaseMultiModalInput | None:
+        data = await self._r.get(self.input_key(sid))
+        if data is None:
+            return None
+        return BaseMultiModalInput.model_validate_json(data)
+
+    # -------- checkpoints ----------
+    async def save_checkpoint(self, sid: str, checkpoint: BaseModel) -> None:
+        await self._r.set(self.checkpoint_key(sid), checkpoint.model_dump_json(), ex=self._ttl)
+
+    async def get_checkpoint(self, sid: str, model: type[T]) -> T | None:
+        data = await self._r.get(self.checkpoint_key(sid))
+        if data is None:
+            return None
+        return model.model_validate_json(data)
+
+    # -------- leases ----------
+    async def acquire(self, sid: str) -> bool:
+        """Claims the right to produce events for ``sid``; False if another worker holds it."""
+        return bool(await self._r.set(self.lease_key(sid), "1", nx=True, ex=self._lease_seconds))
+
+    async def is_active(self, sid: str) -> bool:
+        return bool(await self._r.exists(self.lease_key(sid)))
+
+    async def exists(self, sid: str) -> bool:
+        return bool(await self._r.exists(self.events_key(sid)))
+
+    async def _heartbeat(self, sid: str) -> None:
+        while True:
+            await asyncio.sleep(self._lease_seconds / 3)
+            await self._r.expire(self.lease_key(sid), self._lease_seconds)
+
+    # -------- producing ----------
+    async def reset(self, sid: str) -> None:
+        """Clears the log and checkpoint of a previous run in this session."""
+        await self._r.delete(self.events_key(sid), self.checkpoint_key(sid))
+
+    async def append(self, sid: str, event: str) -> str:
+        async with self._r.pipeline(transaction=False) as pipe:
+            pipe.xadd(self.events_key(sid), {_EVENT_FIELD: event})
+            pipe.expire(self.events_key(sid), self._ttl)
+            event_id, _ = await pipe.execute()
+        return event_id
+
+    async def record(self, sid: str, events: AsyncIterable[str]) -> None:
+        """Appends every event to the log, then marks the run as finished.
+
+        The run is finished when ``events`` is exhausted or raises. If the
+        recording is cancelled instead, e.g. on shutdown, the run is left
+        unfinished: its lease expires and a reader resumes it from its last
+        checkpoint. The caller must hold the lease (see ``acquire``) for ``sid``.
+        """
+        heartbeat = asyncio.create_task(self._heartbeat(sid))
+        cancelled = False
+        try:
+            async for event in events:
+                await self.append(sid, event)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+            if not cancelled:
+                await self._r.xadd(self.events_key(sid), {_END_FIELD: "1"})
+                await self._r.delete(self.lease_key(sid))
+
+    # -------- consuming ----------
+    async def follow(
+        self,
+        sid: str,
+        last_event_id: str | None = None,
+        on_orphaned: Callable[[], Awaitable[bool]] | None = None,
+    ) -> AsyncIterable[str]:
+        """Replays events after ``last_event_id`` and then tails the live log.
+
+        Each event is prefixed with its SSE ``id`` so clients can reconnect
+        with ``Last-Event-ID``. A keepalive is emitted whenever no event
+        arrives within the block interval. If the run stops producing events
+        without finishing, ``on_orphaned`` is called to resume it; when it
+        returns False (or is not given) the stream ends.
+        """
+        last_id = last_event_id or "0-0"
+        while True:
+            response = await self._r.xread(
+                {self.events_key(sid): last_id}, block=self._block_ms, count=100
+            )
+            if not response:
+                if await self.is_active(sid):
+                    yield new_event_response(EventType.KEEPALIVE_RESPONSE, KeepaliveMessage())
+                    continue
+                if on_orphaned is not None and await on_orphaned():
+                    continue
+                return
+            for event_id, fields in response[0][1]:
+                last_id = event_id
+                if _END_FIELD in fields:
+                    return
+                yield f"id: {event_id}\n{fields[_EVENT_FIELD]}"
@@ -32,6 +32,7 @@ class Action(Enum):
     PROVIDE_RESULT = "provide_result"
     ABORT = "abort"
     ASSIGN_NEW_TASK = "assign_new_task"
+    ASSIGN_NEW_TASKS = "assign_new_tasks"
 
 
 class ResultOutput(BaseModel):
@@ -49,13 +50,17 @@ class AssignTaskOutput(BaseModel):
     instructions: str
 
 
+class AssignTasksOutput(BaseModel):
+    tasks: list[AssignTaskOutput]
+
+
 class ManagerOutput(BaseModel):
     session_id: str | None = None
     source: str | None = None
     request_id: str | None = None
 
     next_action: Action
-    action_detail: ResultOutput | AbortOutput | AssignTaskOutput
+    action_detail: ResultOutput | AbortOutput | AssignTaskOutput | AssignTasksOutput
 
 
 class ManagerAgent(InvokableAgent):
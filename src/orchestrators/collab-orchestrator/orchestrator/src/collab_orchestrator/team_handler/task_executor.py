@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncIterable
 from contextlib import nullcontext
 
@@ -14,14 +15,16 @@ from collab_orchestrator.co_types import (
     new_event_response,
 )
 from collab_orchestrator.team_handler.conversation import Conversation
+from collab_orchestrator.team_handler.manager_agent import AssignTaskOutput
 
 
 class TaskExecutor:
-    def __init__(self, agents: list[TaskAgent]):
+    def __init__(self, agents: list[TaskAgent], max_parallel_tasks: int = 4):
         self._logger = get_telemetry().get_logger(self.__class__.__name__)
         self.agents = {}
         for agent in agents:
             self.agents[f"{agent.agent.name}:{agent.agent.version}"] = agent
+        self.max_parallel_tasks = max(1, max_parallel_tasks)
         self.t = get_telemetry()
 
     async def execute_task_sse(
@@ -164,3 +167,83 @@ class TaskExecutor:
                         detail=f"Unexpected error occurred: {e}",
                     ),
                 )
+
+    async def execute_tasks(
+        self,
+        tasks: list[AssignTaskOutput],
+        conversation: Conversation,
+        stream_tokens: bool,
+        session_id: str | None = None,
+        source: str | None = None,
+        request_id: str | None = None,
+    ) -> AsyncIterable[str]:
+        """Executes a batch of independent tasks concurrently and streams results.
+
+        At most ``max_parallel_tasks`` tasks run at once. Every task sees the
+        conversation as it was before the batch started, and results are added
+        to the conversation in the order the tasks were assigned once the whole
+        batch has finished.
+        """
+        with (
+            self.t.tracer.start_as_current_span(
+                name="execute-tasks", attributes={"task_count": len(tasks)}
+            )
+            if self.t.telemetry_enabled()
+            else nullcontext()
+        ):
+            execute = self.execute_task_sse if stream_tokens else self.execute_task
+            semaphore = asyncio.Semaphore(self.max_parallel_tasks)
+            base_length = len(conversation.messages)
+            task_conversations = [Conversation(messages=list(conversation.messages)) for _ in tasks]
+            queue: asyncio.Queue[str | None] = asyncio.Queue()
+
+            async def run(task: AssignTaskOutput, task_conversation: Conversation):
+                try:
+                    async with semaphore:
+                        async for result in execute(
+                            task.task_id,
+                            task.instructions,
+                            task.agent_name,
+                            task_conversation,
+                            session_id,
+                            source,
+                            request_id,
+                        ):
+                            await queue.put(result)
+                except Exception as e:
+                    self._logger.error(f"Task {task.task_id} failed: {e}")
+                    await queue.put(
+                        new_event_response(
+                            EventType.ERROR,
+                            ErrorResponse(
+                                session_id=session_id or "",
+                                source=source or "",
+                                request_id=request_id or "",
+                                status_code=500,
+                                detail=str(e),
+                            ),
+                        )
+                    )
+                finally:
+                    await queue.put(None)
+
+            runners = [
+                asyncio.create_task(run(task, task_conversation))
+                for task, task_conversation in zip(tasks, task_conversations, strict=True)
+            ]
+            try:
+                num_finished = 0
+                while num_finished < len(runners):
+                    result = await queue.get()
+                    if result is None:
+                        num_finished += 1
+                    else:
+                        yield result
+                await asyncio.gather(*runners)
+            finally:
+                for runner in runners:
+                    if not runner.done():
+                        runner.cancel()
+
+            for task_conversation in task_conversations:
+                conversation.messages.extend(task_conversation.messages[base_length:])
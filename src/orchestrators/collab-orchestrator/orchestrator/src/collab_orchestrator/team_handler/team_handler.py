@@ -104,7 +104,7 @@ class TeamHandler(KindHandler):
         self.manager_agent = ManagerAgent(agent=manager_agent_base, gateway=self.agent_gateway)
         self.max_rounds = spec.max_rounds
         self.stream_tokens = spec.stream_tokens
-        self.task_executor = TaskExecutor(self.task_agents)
+        self.task_executor = TaskExecutor(self.task_agents, spec.max_parallel_tasks)
 
     async def invoke(self, chat_history: BaseMultiModalInput, request: str) -> AsyncIterable:
         session_id: str
@@ -209,6 +209,19 @@ class TeamHandler(KindHandler):
                                 request_id,
                             ):
                                 yield result
+                        case Action.ASSIGN_NEW_TASKS:
+                            self._logger.debug(
+                                f"Assigning {len(manager_output.action_detail.tasks)} new tasks"
+                            )
+                            async for result in self.task_executor.execute_tasks(
+                                manager_output.action_detail.tasks,
+                                conversation,
+                                self.stream_tokens,
+                                session_id,
+                                source,
+                                request_id,
+                            ):
+                                yield result
                         case _:
                             self._logger.warning("Unknown action received")
                             yield new_event_response(
@@ -5,3 +5,4 @@ class TeamSpec(SpecBase):
     max_rounds: int
     manager_agent: str
     stream_tokens: bool = True
+    max_parallel_tasks: int = 4
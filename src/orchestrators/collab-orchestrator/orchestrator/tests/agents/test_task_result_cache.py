@@ -0,0 +1,107 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from collab_orchestrator import InvokeResponse
+from collab_orchestrator.agents import (
+    BaseAgent,
+    InMemoryTaskResultCache,
+    PreRequisite,
+    TaskAgent,
+    TaskResultCache,
+)
+
+
+def _response(output: str) -> InvokeResponse:
+    return InvokeResponse(
+        output_raw=output,
+        token_usage={"total_tokens": 10, "prompt_tokens": 5, "completion_tokens": 5},
+    )
+
+
+@pytest.fixture
+def base_agent():
+    return BaseAgent(name="agent", version="1.0", description="An agent")
+
+
+@pytest.fixture
+def task_agent(base_agent):
+    with patch("collab_orchestrator.agents.task_agent.get_telemetry"):
+        task_agent = TaskAgent(agent=base_agent, gateway=MagicMock())
+    task_agent.invoke = AsyncMock(return_value=_response("fresh").model_dump())
+    task_agent.result_cache = InMemoryTaskResultCache()
+    return task_agent
+
+
+def test_key_depends_on_agent_goal_and_pre_requisites(base_agent):
+    other_version = BaseAgent(name="agent", version="2.0", description="An agent")
+    pre_reqs = [PreRequisite(goal="g", result="r")]
+
+    key = TaskResultCache.key_for(base_agent, "goal", pre_reqs)
+
+    assert key == TaskResultCache.key_for(base_agent, "goal", list(pre_reqs))
+    assert key != TaskResultCache.key_for(other_version, "goal", pre_reqs)
+    assert key != TaskResultCache.key_for(base_agent, "other goal", pre_reqs)
+    assert key != TaskResultCache.key_for(base_agent, "goal", [])
+
+
+@pytest.fixture
+def metrics():
+    with patch("collab_orchestrator.agents.task_result_cache.get_metrics") as get_metrics:
+        yield get_metrics.return_value
+
+
+def _lookups(metrics) -> list[bool]:
+    return [c.args[0] for c in metrics.record_task_cache_lookup.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_evicts_least_recently_used(metrics):
+    cache = InMemoryTaskResultCache(max_entries=2)
+    await cache.set("a", _response("a"))
+    await cache.set("b", _response("b"))
+    await cache.get("a")
+    await cache.set("c", _response("c"))
+
+    assert await cache.get("b") is None
+    assert (await cache.get("a")).output_raw == "a"
+    assert (await cache.get("c")).output_raw == "c"
+    assert _lookups(metrics) == [True, False, True, True]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_expires_entries():
+    cache = InMemoryTaskResultCache(ttl=-1)
+    await cache.set("a", _response("a"))
+
+    assert await cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_perform_task_uses_cached_result(task_agent, metrics):
+    first = await task_agent.perform_task("s1", "goal", [])
+    second = await task_agent.perform_task("s2", "goal", [])
+
+    assert first.output_raw == second.output_raw == "fresh"
+    task_agent.invoke.assert_awaited_once()
+    assert _lookups(metrics) == [False, True]
+    assert second.session_id == "s2"
+    assert second.source == "agent:1.0"
+    assert second.request_id != first.request_id
+    assert second.token_usage.total_tokens == 0
+    assert first.token_usage.total_tokens == 10
+
+
+@pytest.mark.asyncio
+async def test_perform_task_sse_uses_cached_result(task_agent):
+    await task_agent.result_cache.set(
+        TaskResultCache.key_for(task_agent.agent, "goal", []), _response("cached")
+    )
+    task_agent.invoke_sse = MagicMock()
+
+    results = [result async for result in task_agent.perform_task_sse("s1", "goal", [])]
+
+    assert [result.output_raw for result in results] == ["cached"]
+    assert results[0].session_id == "s1"
+    assert results[0].token_usage.total_tokens == 0
+    task_agent.invoke_sse.assert_not_called()
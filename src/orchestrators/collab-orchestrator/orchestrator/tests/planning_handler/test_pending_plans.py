@@ -0,0 +1,105 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from ska_utils import Singleton
+
+from collab_orchestrator.planning_handler.pending_plans import (
+    PendingPlanListener,
+    PendingPlanStore,
+)
+
+
+def _pipeline(statuses: list[str | None]) -> MagicMock:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=statuses)
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    return pipe
+
+
+@pytest.fixture
+def listener():
+    Singleton._instances.pop(PendingPlanListener, None)
+    with patch("collab_orchestrator.planning_handler.pending_plans.get_telemetry"):
+        listener = PendingPlanListener(MagicMock())
+    # Keep the background subscriber out of the unit tests
+    listener._task = MagicMock()
+    listener._task.done.return_value = False
+    yield listener
+    Singleton._instances.pop(PendingPlanListener, None)
+
+
+@pytest.mark.asyncio
+async def test_listener_is_shared_per_process(listener):
+    assert PendingPlanListener(MagicMock()) is listener
+
+
+@pytest.mark.asyncio
+async def test_resolve_wakes_all_waiters_for_session(listener):
+    first = listener.register("s1")
+    second = listener.register("s1")
+    other = listener.register("s2")
+
+    listener._resolve("s1")
+
+    assert first.done() and second.done()
+    assert not other.done()
+    assert list(listener._waiters) == ["s2"]
+
+
+@pytest.mark.asyncio
+async def test_unregister_drops_empty_sessions(listener):
+    future = listener.register("s1")
+
+    listener.unregister("s1", future)
+    listener.unregister("s1", future)
+
+    assert listener._waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_poll_resolves_decided_and_expired_plans(listener):
+    decided = listener.register("decided")
+    expired = listener.register("expired")
+    pending = listener.register("pending")
+    listener._r.pipeline.return_value = _pipeline(["approve", None, "pending"])
+
+    await listener._poll()
+
+    assert decided.done()
+    assert expired.done()
+    assert not pending.done()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_decision_returns_after_notification(listener):
+    store = PendingPlanStore.__new__(PendingPlanStore)
+    store._listener = listener
+    store.get = AsyncMock(side_effect=[{"status": "pending"}, {"status": "approve", "plan": {}}])
+
+    waiter = asyncio.create_task(store.wait_for_decision("s1", None))
+    await asyncio.sleep(0)
+    listener._resolve("s1")
+
+    assert await waiter == {"status": "approve", "plan": {}}
+    assert listener._waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_decision_times_out(listener):
+    store = PendingPlanStore.__new__(PendingPlanStore)
+    store._listener = listener
+    store.get = AsyncMock(return_value={"status": "pending"})
+
+    assert await store.wait_for_decision("s1", 0.01) is None
+    assert listener._waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_decision_returns_none_for_expired_plan(listener):
+    store = PendingPlanStore.__new__(PendingPlanStore)
+    store._listener = listener
+    store.get = AsyncMock(return_value=None)
+
+    assert await store.wait_for_decision("s1", None) is None
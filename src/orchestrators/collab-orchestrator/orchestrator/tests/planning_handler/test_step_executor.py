@@ -611,3 +611,35 @@ async def test_merge_async_iterables_empty(step_executor):
 async def async_generator(items):
     for item in items:
         yield item
+
+
+@pytest.mark.asyncio
+async def test_execute_step_skips_completed_tasks(step_executor, mock_task_agent):
+    done_task = MagicMock(spec=ExecutableTask)
+    done_task.task_id = "done_task"
+    done_task.task_goal = "done_goal"
+    done_task.result = "done_result"
+    done_task.status = TaskStatus.DONE
+
+    step = MagicMock(spec=Step)
+    step.step_number = 1
+    step.step_tasks = [done_task]
+
+    results = [
+        result async for result in step_executor.execute_step("session", "source", "req", step)
+    ]
+
+    assert results == []
+    assert step_executor.task_accumulator["done_task"] == done_task
+    mock_task_agent.perform_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_task_calls_on_task_complete(
+    step_executor, mock_executable_task, mock_task_agent
+):
+    step_executor.on_task_complete = AsyncMock()
+
+    await step_executor._execute_task("test_session", mock_executable_task)
+
+    step_executor.on_task_complete.assert_awaited_once_with(mock_executable_task)
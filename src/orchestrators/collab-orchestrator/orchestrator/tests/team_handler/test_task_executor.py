@@ -0,0 +1,110 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from collab_orchestrator import InvokeResponse
+from collab_orchestrator.agents import TaskAgent
+from collab_orchestrator.team_handler.conversation import Conversation
+from collab_orchestrator.team_handler.manager_agent import (
+    Action,
+    AssignTaskOutput,
+    AssignTasksOutput,
+    ManagerOutput,
+)
+from collab_orchestrator.team_handler.task_executor import TaskExecutor
+
+
+def _task_agent(name: str, delay: float, tracker: dict) -> TaskAgent:
+    agent = MagicMock()
+    agent.name = name
+    agent.version = "1.0"
+
+    async def perform_task(session_id, instructions, pre_reqs):
+        tracker["running"] += 1
+        tracker["max_running"] = max(tracker["max_running"], tracker["running"])
+        tracker["pre_reqs"][instructions] = len(pre_reqs)
+        await asyncio.sleep(delay)
+        tracker["running"] -= 1
+        return InvokeResponse(
+            output_raw=f"{name} result",
+            token_usage={"total_tokens": 10, "prompt_tokens": 5, "completion_tokens": 5},
+        )
+
+    task_agent = MagicMock(spec=TaskAgent)
+    task_agent.agent = agent
+    task_agent.perform_task = perform_task
+    return task_agent
+
+
+@pytest.fixture
+def tracker():
+    return {"running": 0, "max_running": 0, "pre_reqs": {}}
+
+
+@pytest.fixture
+def task_executor(tracker):
+    with patch("collab_orchestrator.team_handler.task_executor.get_telemetry") as mock_telemetry:
+        mock_telemetry.return_value.telemetry_enabled.return_value = False
+        agents = [
+            _task_agent("slow", 0.05, tracker),
+            _task_agent("fast", 0.01, tracker),
+            _task_agent("other", 0.01, tracker),
+        ]
+        yield TaskExecutor(agents, max_parallel_tasks=2)
+
+
+def test_manager_output_parses_task_batch():
+    output = ManagerOutput(
+        next_action=Action.ASSIGN_NEW_TASKS,
+        action_detail={
+            "tasks": [
+                {"task_id": "t1", "agent_name": "a:1.0", "instructions": "one"},
+                {"task_id": "t2", "agent_name": "b:1.0", "instructions": "two"},
+            ]
+        },
+    )
+
+    assert isinstance(output.action_detail, AssignTasksOutput)
+    assert [task.task_id for task in output.action_detail.tasks] == ["t1", "t2"]
+
+
+@pytest.mark.asyncio
+async def test_execute_tasks_runs_concurrently_under_limit(task_executor, tracker):
+    conversation = Conversation(messages=[])
+    conversation.add_item("t0", "fast:1.0", "earlier", "earlier result")
+    tasks = [
+        AssignTaskOutput(task_id="t1", agent_name="slow:1.0", instructions="first"),
+        AssignTaskOutput(task_id="t2", agent_name="fast:1.0", instructions="second"),
+        AssignTaskOutput(task_id="t3", agent_name="other:1.0", instructions="third"),
+    ]
+
+    results = [
+        result
+        async for result in task_executor.execute_tasks(
+            tasks, conversation, stream_tokens=False, session_id="s"
+        )
+    ]
+
+    assert tracker["max_running"] == 2
+    assert tracker["pre_reqs"] == {"first": 1, "second": 1, "third": 1}
+    assert sum("event: final-response" in result for result in results) == 3
+    assert [message.task_id for message in conversation.messages] == ["t0", "t1", "t2", "t3"]
+    assert conversation.get_message_by_task_id("t1").result == "slow result"
+
+
+@pytest.mark.asyncio
+async def test_execute_tasks_reports_unknown_agent(task_executor):
+    conversation = Conversation(messages=[])
+    tasks = [
+        AssignTaskOutput(task_id="t1", agent_name="missing:1.0", instructions="first"),
+        AssignTaskOutput(task_id="t2", agent_name="fast:1.0", instructions="second"),
+    ]
+
+    results = [
+        result
+        async for result in task_executor.execute_tasks(tasks, conversation, stream_tokens=False)
+    ]
+
+    assert any("event: error" in result for result in results)
+    assert [message.task_id for message in conversation.messages] == ["t2"]
@@ -0,0 +1,159 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from collab_orchestrator import InvokeResponse
+from collab_orchestrator.agents import PreRequisite, TaskAgent
+from collab_orchestrator.distributed_tasks import (
+    DistributedTaskClient,
+    RemoteTaskRequest,
+    RemoteTaskResult,
+    TaskWorker,
+)
+
+
+def _response(output: str) -> InvokeResponse:
+    return InvokeResponse(
+        output_raw=output,
+        token_usage={"total_tokens": 10, "prompt_tokens": 5, "completion_tokens": 5},
+    )
+
+
+@pytest.fixture
+def task_agent():
+    agent = MagicMock()
+    agent.name = "test_agent"
+    agent.version = "1.0"
+    task_agent = MagicMock(spec=TaskAgent)
+    task_agent.agent = agent
+    task_agent.perform_task = AsyncMock(return_value=_response("done"))
+    return task_agent
+
+
+@pytest.fixture
+def task_client():
+    with patch("collab_orchestrator.distributed_tasks.get_telemetry"):
+        client = DistributedTaskClient("tasks", MagicMock(), timeout=1)
+    client._publisher = MagicMock()
+    return client
+
+
+def _request(task_agent: str) -> RemoteTaskRequest:
+    return RemoteTaskRequest(
+        request_id="req-1",
+        reply_topic="tasks:results:abc",
+        session_id="session",
+        task_agent=task_agent,
+        task_goal="goal",
+        pre_requisites=[PreRequisite(goal="pre goal", result="pre result")],
+    )
+
+
+def _worker(task_agent) -> tuple[TaskWorker, MagicMock]:
+    r = MagicMock()
+    pipe = r.pipeline.return_value.__enter__.return_value
+    worker = TaskWorker("tasks", r, [task_agent], asyncio.get_running_loop())
+    return worker, pipe
+
+
+def _published(pipe) -> tuple[str, RemoteTaskResult]:
+    topic, fields = pipe.xadd.call_args.args
+    return topic, RemoteTaskResult.model_validate_json(fields["event_data"])
+
+
+@pytest.mark.asyncio
+async def test_worker_publishes_result(task_agent):
+    worker, pipe = _worker(task_agent)
+
+    # Received on the worker's thread, performed on the application's loop
+    await asyncio.to_thread(asyncio.run, worker.process_event(_request("test_agent:1.0")))
+
+    task_agent.perform_task.assert_awaited_once_with(
+        "session", "goal", [PreRequisite(goal="pre goal", result="pre result")]
+    )
+    topic, result = _published(pipe)
+    assert topic == "tasks:results:abc"
+    assert result.request_id == "req-1"
+    assert result.response.output_raw == "done"
+    assert result.error is None
+    assert pipe.xadd.call_args.kwargs == {"maxlen": 1000, "approximate": True}
+    pipe.expire.assert_called_once_with("tasks:results:abc", 300)
+
+
+@pytest.mark.asyncio
+async def test_worker_publishes_error_for_unknown_agent(task_agent):
+    worker, pipe = _worker(task_agent)
+
+    await worker.process_event(_request("missing:1.0"))
+
+    _, result = _published(pipe)
+    assert result.response is None
+    assert result.error == "Task agent missing:1.0 not found."
+
+
+@pytest.mark.asyncio
+async def test_worker_publishes_error_for_dead_lettered_task(task_agent):
+    worker, pipe = _worker(task_agent)
+    dead_letter_pipe = MagicMock()
+    dead_letter_pipe.execute = AsyncMock()
+    dead_letter_pipe.__aenter__ = AsyncMock(return_value=dead_letter_pipe)
+    dead_letter_pipe.__aexit__ = AsyncMock(return_value=None)
+    worker._ar = MagicMock()
+    worker._ar.pipeline.return_value = dead_letter_pipe
+
+    fields = {"event_data": _request("test_agent:1.0").model_dump_json()}
+    await worker._dead_letter("1-0", fields, "Maximum deliveries exceeded")
+
+    _, result = _published(pipe)
+    assert result.request_id == "req-1"
+    assert result.error == "Maximum deliveries exceeded"
+
+
+@pytest.mark.asyncio
+async def test_client_returns_matching_result(task_client):
+    task_client._loop = asyncio.get_running_loop()
+
+    def publish(topic, payload):
+        request = RemoteTaskRequest.model_validate_json(payload)
+        assert topic == "tasks"
+        task_client._on_result(
+            RemoteTaskResult(request_id=request.request_id, response=_response("remote"))
+        )
+
+    task_client._publisher.publish_event.side_effect = publish
+
+    response = await task_client.perform_task("test_agent:1.0", "session", "goal", [])
+
+    assert response.output_raw == "remote"
+    assert task_client._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_client_raises_remote_error(task_client):
+    task_client._loop = asyncio.get_running_loop()
+
+    def publish(topic, payload):
+        request = RemoteTaskRequest.model_validate_json(payload)
+        task_client._on_result(RemoteTaskResult(request_id=request.request_id, error="boom"))
+
+    task_client._publisher.publish_event.side_effect = publish
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await task_client.perform_task("test_agent:1.0", "session", "goal", [])
+
+
+@pytest.mark.asyncio
+async def test_client_trims_task_stream():
+    with patch("collab_orchestrator.distributed_tasks.get_telemetry"):
+        client = DistributedTaskClient("tasks", MagicMock(), max_len=100)
+    assert client._publisher._max_len == 100
+
+
+@pytest.mark.asyncio
+async def test_client_times_out(task_client):
+    task_client._timeout = 0.01
+
+    with pytest.raises(TimeoutError):
+        await task_client.perform_task("test_agent:1.0", "session", "goal", [])
+    assert task_client._pending == {}
@@ -0,0 +1,146 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from collab_orchestrator.session_event_log import SessionEventLog
+
+
+def _pipeline(results: list) -> MagicMock:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=results)
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    return pipe
+
+
+@pytest.fixture
+def event_log():
+    event_log = SessionEventLog.__new__(SessionEventLog)
+    event_log._ttl = 3600
+    event_log._lease_seconds = 15
+    event_log._block_ms = 10
+    event_log._r = MagicMock()
+    event_log._r.set = AsyncMock(return_value=True)
+    event_log._r.exists = AsyncMock(return_value=1)
+    event_log._r.expire = AsyncMock()
+    event_log._r.xadd = AsyncMock()
+    event_log._r.delete = AsyncMock()
+    event_log._r.xread = AsyncMock()
+    event_log._r.pipeline.return_value = _pipeline(["1-0", True])
+    return event_log
+
+
+async def _events(*events: str, error: Exception | None = None, delay: float = 0):
+    for event in events:
+        await asyncio.sleep(delay)
+        yield event
+    if error is not None:
+        raise error
+
+
+def _read(*entries: tuple[str, dict[str, str]]) -> list:
+    return [["session-events:s1", list(entries)]]
+
+
+async def _collect(events) -> list[str]:
+    return [event async for event in events]
+
+
+@pytest.mark.asyncio
+async def test_acquire_claims_lease_once(event_log):
+    assert await event_log.acquire("s1")
+    event_log._r.set.assert_awaited_once_with("session-lease:s1", "1", nx=True, ex=15)
+
+    event_log._r.set.return_value = None
+    assert not await event_log.acquire("s1")
+
+
+@pytest.mark.asyncio
+async def test_record_appends_events_and_marks_end(event_log):
+    pipe = event_log._r.pipeline.return_value
+
+    await event_log.record("s1", _events("a", "b"))
+
+    assert [c.args for c in pipe.xadd.call_args_list] == [
+        ("session-events:s1", {"event": "a"}),
+        ("session-events:s1", {"event": "b"}),
+    ]
+    event_log._r.xadd.assert_awaited_once_with("session-events:s1", {"end": "1"})
+    event_log._r.delete.assert_awaited_once_with("session-lease:s1")
+
+
+@pytest.mark.asyncio
+async def test_record_refreshes_lease_while_running(event_log):
+    event_log._lease_seconds = 0.03
+
+    await event_log.record("s1", _events("a", "b", "c", delay=0.02))
+
+    event_log._r.expire.assert_any_await("session-lease:s1", 0.03)
+
+
+@pytest.mark.asyncio
+async def test_record_marks_end_when_run_fails(event_log):
+    with pytest.raises(ValueError):
+        await event_log.record("s1", _events("a", error=ValueError("boom")))
+
+    event_log._r.xadd.assert_awaited_once_with("session-events:s1", {"end": "1"})
+    event_log._r.delete.assert_awaited_once_with("session-lease:s1")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_record_leaves_lease_to_expire(event_log):
+    recording = asyncio.create_task(event_log.record("s1", _events("a", "b", delay=10)))
+    await asyncio.sleep(0.01)
+    recording.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await recording
+
+    event_log._r.xadd.assert_not_awaited()
+    event_log._r.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_follow_replays_after_last_event_id(event_log):
+    event_log._r.xread.side_effect = [
+        _read(("2-0", {"event": "b"}), ("3-0", {"event": "c"})),
+        _read(("4-0", {"end": "1"})),
+    ]
+
+    events = await _collect(event_log.follow("s1", "1-0"))
+
+    assert events == ["id: 2-0\nb", "id: 3-0\nc"]
+    reads = [c.args[0] for c in event_log._r.xread.call_args_list]
+    assert reads == [{"session-events:s1": "1-0"}, {"session-events:s1": "3-0"}]
+
+
+@pytest.mark.asyncio
+async def test_follow_sends_keepalive_while_run_is_active(event_log):
+    event_log._r.xread.side_effect = [[], _read(("1-0", {"end": "1"}))]
+
+    events = await _collect(event_log.follow("s1"))
+
+    assert len(events) == 1
+    assert events[0].startswith("event: keepalive")
+
+
+@pytest.mark.asyncio
+async def test_follow_resumes_orphaned_run(event_log):
+    event_log._r.exists.return_value = 0
+    event_log._r.xread.side_effect = [[], _read(("1-0", {"event": "a"}), ("2-0", {"end": "1"}))]
+    on_orphaned = AsyncMock(return_value=True)
+
+    events = await _collect(event_log.follow("s1", on_orphaned=on_orphaned))
+
+    assert events == ["id: 1-0\na"]
+    on_orphaned.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_follow_ends_when_orphaned_run_is_not_resumed(event_log):
+    event_log._r.exists.return_value = 0
+    event_log._r.xread.return_value = []
+
+    assert await _collect(event_log.follow("s1", on_orphaned=AsyncMock(return_value=False))) == []
+    assert await _collect(event_log.follow("s1")) == []
@@ -8,7 +8,10 @@ from .wf_types import WorkflowUpdateRequest as WorkflowUpdateRequest
 from .wf_types import WorkflowState as WorkflowState
 from .wf_types import WorkflowEvent as WorkflowEvent
 from .wf_types import ScheduleWorkflowResponse as ScheduleWorkflowResponse
+from .wf_types import BulkScheduleResult as BulkScheduleResult
+from .agent_invoker import AgentInvocationError as AgentInvocationError
 from .agent_invoker import create_agent_input as create_agent_input
 from .agent_invoker import invoke_agent_task as invoke_agent_task
+from .agent_invoker import invoke_agents as invoke_agents
 from .workflow_client import WorkflowClient as WorkflowClient
 from .workflow_client import WorkflowNotFoundException as WorkflowNotFoundException
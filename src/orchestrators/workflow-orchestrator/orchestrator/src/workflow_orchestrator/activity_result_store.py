@@ -0,0 +1,88 @@
+import hashlib
+import json
+import logging
+import threading
+from typing import Any
+
+from dapr.clients import DaprClient
+from dapr.clients.exceptions import DaprInternalError
+from grpc import RpcError
+from ska_utils import AppConfig
+
+from workflow_orchestrator.configs import (
+    TA_ACTIVITY_RESULT_STORE,
+    TA_ACTIVITY_RESULT_TTL,
+)
+
+
+class ActivityResultStore:
+    """Records activity results in a Dapr state store.
+
+    Results are keyed by workflow instance, the activity's task ID within it,
+    activity name and a hash of the activity input. An activity delivered
+    again after its result was lost, e.g. when its worker crashed, returns
+    the recorded result rather than repeating its work, while separate calls
+    of an activity with the same input are still run. Entries expire after
+    ``ttl`` seconds.
+    """
+
+    def __init__(self, store_name: str, ttl: int):
+        self._store_name = store_name
+        self._ttl = ttl
+        self._client = DaprClient()
+        self._logger = logging.getLogger("ActivityResultStore")
+
+    @staticmethod
+    def key_for(
+        instance_id: str, task_id: int, activity_name: str, activity_input: Any
+    ) -> str:
+        input_json = json.dumps(
+            activity_input, default=lambda o: o.__dict__, sort_keys=True
+        )
+        input_hash = hashlib.sha256(input_json.encode("utf-8")).hexdigest()
+        return f"activity-result:{instance_id}:{task_id}:{activity_name}:{input_hash}"
+
+    def get(self, key: str) -> Any | None:
+        try:
+            response = self._client.get_state(self._store_name, key)
+        except (RpcError, DaprInternalError) as e:
+            self._logger.warning(f"Failed to read activity result {key}: {e}")
+            return None
+        if not response.data:
+            return None
+        self._logger.info(f"Reusing recorded activity result {key}")
+        return json.loads(response.data)
+
+    def save(self, key: str, result: Any) -> None:
+        try:
+            self._client.save_state(
+                self._store_name,
+                key,
+                json.dumps(result),
+                state_metadata={"ttlInSeconds": str(self._ttl)},
+            )
+        except (RpcError, DaprInternalError) as e:
+            # The result is still returned to the workflow; a failed write
+            # only means a retry would call the agent again.
+            self._logger.warning(f"Failed to record activity result {key}: {e}")
+
+
+_store: ActivityResultStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_activity_result_store() -> ActivityResultStore | None:
+    """Returns the process-wide result store, or None if TA_ACTIVITY_RESULT_STORE
+    is not set."""
+    global _store
+    if _store is None:
+        app_config = AppConfig()
+        store_name = app_config.get(TA_ACTIVITY_RESULT_STORE.env_name)
+        if not store_name:
+            return None
+        with _store_lock:
+            if _store is None:
+                _store = ActivityResultStore(
+                    store_name, int(app_config.get(TA_ACTIVITY_RESULT_TTL.env_name))
+                )
+    return _store
@@ -1,25 +1,134 @@
 import json
 import logging
-from typing import Generic, Type
+import threading
+from collections.abc import Generator
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Generic
 
 import requests
-from dapr.ext.workflow import WorkflowActivityContext
-from ska_utils import AppConfig, strtobool
+from dapr.ext.workflow import (
+    DaprWorkflowContext,
+    RetryPolicy,
+    WorkflowActivityContext,
+    when_any,
+)
+from requests.adapters import HTTPAdapter
+from ska_utils import AppConfig, get_metrics, strtobool
+from urllib3.util.retry import Retry
 
 from workflow_orchestrator import TAgentInput, TAgentOutput, AgentActivityInput
-from workflow_orchestrator.configs import TA_AGW_SECURE, TA_AGW_HOST, TA_AGW_KEY
+from workflow_orchestrator.activity_result_store import get_activity_result_store
+from workflow_orchestrator.configs import (
+    TA_AGW_SECURE,
+    TA_AGW_HOST,
+    TA_AGW_KEY,
+    TA_AGW_CONNECT_TIMEOUT,
+    TA_AGW_READ_TIMEOUT,
+    TA_AGW_MAX_RETRIES,
+    TA_AGW_POOL_SIZE,
+)
+
+# Statuses for which the gateway or agent may be retried without risk of having
+# already performed the work
+_TRANSPORT_RETRY_STATUS_CODES = (429, 503)
+
+
+class AgentInvocationError(Exception):
+    """Raised when an agent could not be invoked through the gateway.
+
+    ``status_code`` is the gateway's HTTP status, if it responded. Whether the
+    activity is retried is up to the workflow's retry policy.
+    """
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass(frozen=True)
+class _GatewaySettings:
+    api_key: str
+    host: str
+    secure: bool
+    connect_timeout: float
+    read_timeout: float
+    max_retries: int
+    pool_size: int
+
+
+@cache
+def _gateway_settings() -> _GatewaySettings:
+    app_config = AppConfig()
+    return _GatewaySettings(
+        api_key=app_config.get(TA_AGW_KEY.env_name),
+        host=app_config.get(TA_AGW_HOST.env_name),
+        secure=strtobool(app_config.get(TA_AGW_SECURE.env_name)),
+        connect_timeout=float(app_config.get(TA_AGW_CONNECT_TIMEOUT.env_name)),
+        read_timeout=float(app_config.get(TA_AGW_READ_TIMEOUT.env_name)),
+        max_retries=int(app_config.get(TA_AGW_MAX_RETRIES.env_name)),
+        pool_size=int(app_config.get(TA_AGW_POOL_SIZE.env_name)),
+    )
+
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Returns the HTTP session shared by all agent activities in this process.
+
+    Connections to the gateway are pooled and reused across activity
+    executions. Only failures where the agent cannot have started work
+    (connection errors, 429 and 503) are retried at the transport level;
+    everything else surfaces as an ``AgentInvocationError`` so the workflow's
+    retry policy decides.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                settings = _gateway_settings()
+                retry = Retry(
+                    total=settings.max_retries,
+                    connect=settings.max_retries,
+                    read=0,
+                    other=0,
+                    status=settings.max_retries,
+                    status_forcelist=_TRANSPORT_RETRY_STATUS_CODES,
+                    allowed_methods=frozenset({"POST"}),
+                    backoff_factor=0.5,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=settings.pool_size,
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
 
 
 class AgentInvoker(Generic[TAgentInput, TAgentOutput]):
-    def __init__(self, agent_name: str, agent_version: str):
+    def __init__(
+        self,
+        agent_name: str,
+        agent_version: str,
+        session: requests.Session | None = None,
+    ):
         self.agent_name = agent_name
         self.agent_version = agent_version
         self.logger = logging.getLogger("agent-invoker")
 
-        app_config = AppConfig()
-        self.api_key = app_config.get(TA_AGW_KEY.env_name)
-        self.agpt_gw_host = app_config.get(TA_AGW_HOST.env_name)
-        self.agpt_gw_secure = strtobool(app_config.get(TA_AGW_SECURE.env_name))
+        settings = _gateway_settings()
+        self.api_key = settings.api_key
+        self.agpt_gw_host = settings.host
+        self.agpt_gw_secure = settings.secure
+        self.timeout = (settings.connect_timeout, settings.read_timeout)
+        self.session = session or _get_session()
 
     def _http_or_https(self) -> str:
         return "https" if self.agpt_gw_secure else "http"
@@ -27,37 +136,65 @@ class AgentInvoker(Generic[TAgentInput, TAgentOutput]):
     def _get_agent_endpoint(self) -> str:
         return f"{self._http_or_https()}://{self.agpt_gw_host}/{self.agent_name}/{self.agent_version}"
 
-    def invoke_agent(
-        self, agent_input: TAgentInput, output_type: type[TAgentOutput] | None = None
-    ) -> TAgentOutput | str:
+    def _fail(
+        self, message: str, status_code: int | None = None
+    ) -> AgentInvocationError:
+        self.logger.error(
+            f"Error invoking agent {self.agent_name}:{self.agent_version}: {message}"
+        )
+        return AgentInvocationError(message, status_code)
+
+    def request_agent(self, agent_input: TAgentInput) -> dict:
+        """Calls the agent and returns the gateway's JSON response."""
         endpoint: str = self._get_agent_endpoint()
         headers = {"taAgwKey": self.api_key}
         self.logger.info(
             f"Invoking agent {self.agent_name}:{self.agent_version} at {endpoint}"
         )
+        body_json = json.dumps(
+            agent_input.__dict__ if hasattr(agent_input, "__dict__") else agent_input
+        )
         try:
-            body_json = json.dumps(
-                agent_input.__dict__
-                if hasattr(agent_input, "__dict__")
-                else agent_input
-            )
-            response = requests.post(
-                endpoint,
-                data=body_json,
-                headers=headers,
+            with get_metrics().time_agent_gateway(
+                f"{self.agent_name}:{self.agent_version}"
+            ):
+                response = self.session.post(
+                    endpoint,
+                    data=body_json,
+                    headers=headers,
+                    timeout=self.timeout,
+                )
+        except requests.RequestException as e:
+            raise self._fail(str(e)) from e
+
+        if not response.ok:
+            raise self._fail(
+                f"HTTP {response.status_code}: {response.text[:500]}",
+                status_code=response.status_code,
             )
-            response.raise_for_status()
+        try:
+            return response.json()
+        except ValueError as e:
+            raise self._fail(f"Invalid agent response: {e}") from e
+
+    def parse_output(
+        self, response_json: dict, output_type: type[TAgentOutput] | None = None
+    ) -> TAgentOutput | str:
+        try:
             if output_type:
-                response_json = response.json()["output_pydantic"]
-                return output_type(**response_json)
+                return output_type(**response_json["output_pydantic"])
             else:
-                return response.json()["output_raw"]
-        except Exception as e:
-            self.logger.error(f"Error invoking agent: {str(e)}")
-            return str(e)
+                return response_json["output_raw"]
+        except (KeyError, TypeError) as e:
+            raise self._fail(f"Invalid agent response: {e}") from e
+
+    def invoke_agent(
+        self, agent_input: TAgentInput, output_type: type[TAgentOutput] | None = None
+    ) -> TAgentOutput | str:
+        return self.parse_output(self.request_agent(agent_input), output_type)
 
 
-def _serialize_type(type_: Type) -> dict:
+def _serialize_type(type_: type) -> dict:
     """Serializes a type object to a dictionary."""
     return {
         "name": type_.__name__,
@@ -65,7 +202,7 @@ def _serialize_type(type_: Type) -> dict:
     }
 
 
-def _deserialize_type(data: dict) -> Type:
+def _deserialize_type(data: dict) -> type:
     """Deserializes a type object from a dictionary."""
     module_name = data["module"]
     type_name = data["name"]
@@ -98,4 +235,80 @@ def invoke_agent_task(
     else:
         output_type = None
     agent_invoker = AgentInvoker(agent_input.agent_name, agent_input.agent_version)
-    return agent_invoker.invoke_agent(agent_input.agent_input, output_type)
+
+    result_store = get_activity_result_store()
+    if result_store is None:
+        return agent_invoker.invoke_agent(agent_input.agent_input, output_type)
+
+    # Activities are delivered again after worker failures; reuse the result
+    # recorded by an earlier delivery instead of calling the agent again.
+    key = result_store.key_for(
+        ctx.workflow_id, ctx.task_id, "invoke_agent_task", agent_input
+    )
+    response_json = result_store.get(key)
+    if response_json is None:
+        response_json = agent_invoker.request_agent(agent_input.agent_input)
+        result_store.save(
+            key,
+            {
+                "output_raw": response_json.get("output_raw"),
+                "output_pydantic": response_json.get("output_pydantic"),
+            },
+        )
+    return agent_invoker.parse_output(response_json, output_type)
+
+
+def invoke_agents(
+    ctx: DaprWorkflowContext,
+    agent_inputs: list[AgentActivityInput],
+    max_parallel: int = 10,
+    retry_policy: RetryPolicy | None = None,
+    return_exceptions: bool = False,
+) -> Generator[Any, Any, list[Any]]:
+    """Invokes several agents concurrently from within a workflow.
+
+    At most ``max_parallel`` agent activities are in flight at once; as each
+    one finishes, the next input is scheduled. Results are returned in the
+    order of ``agent_inputs``. If an activity fails, the remaining ones still
+    run to completion; the first failure is then raised, or, when
+    ``return_exceptions`` is True, failures are returned in place of their
+    results.
+
+    Use with ``yield from`` inside a workflow entrypoint::
+
+        results = yield from invoke_agents(ctx, [input_1, input_2, input_3])
+    """
+    if max_parallel < 1:
+        raise ValueError("max_parallel must be at least 1")
+
+    results: list[Any] = [None] * len(agent_inputs)
+    first_error: Exception | None = None
+    in_flight = {}
+    next_index = 0
+    while next_index < len(agent_inputs) or in_flight:
+        while next_index < len(agent_inputs) and len(in_flight) < max_parallel:
+            task = ctx.call_activity(
+                invoke_agent_task,
+                input=agent_inputs[next_index],
+                retry_policy=retry_policy,
+            )
+            in_flight[next_index] = task
+            next_index += 1
+
+        yield when_any(list(in_flight.values()))
+
+        for index, task in list(in_flight.items()):
+            if not task.is_complete:
+                continue
+            del in_flight[index]
+            if task.is_failed:
+                error = task.get_exception()
+                results[index] = error
+                if first_error is None:
+                    first_error = error
+            else:
+                results[index] = task.get_result()
+
+    if first_error is not None and not return_exceptions:
+        raise first_error
+    return results
@@ -1,8 +1,16 @@
+import asyncio
+import functools
 import logging
 import os
+from collections.abc import AsyncIterable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TypeVar
 
 from dapr.ext.workflow import WorkflowRuntime
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from grpc import RpcError
 from pydantic_yaml import parse_yaml_file_as
 from ska_utils import AppConfig
 from ska_utils import get_telemetry, initialize_telemetry
@@ -10,11 +18,15 @@ from ska_utils import get_telemetry, initialize_telemetry
 from workflow_orchestrator import WorkflowClient, WorkflowNotFoundException
 from workflow_orchestrator.configs import (
     configs,
+    TA_BULK_SCHEDULE_CONCURRENCY,
+    TA_BULK_SCHEDULE_MAX_INPUTS,
+    TA_MAX_WORKFLOW_WAITERS,
     TA_SERVICE_CONFIG,
     TA_WORKFLOW_MODULE,
 )
 from workflow_orchestrator.middleware import TelemetryMiddleware
 from workflow_orchestrator.wf_types import (
+    BulkScheduleResult,
     Config,
     ScheduleWorkflowResponse,
     WorkflowState,
@@ -23,6 +35,8 @@ from workflow_orchestrator.wf_types import (
 )
 from workflow_orchestrator.workflow_loader import get_workflow_loader
 
+T = TypeVar("T")
+
 
 def docstring_parameter(*sub):
     def dec(obj):
@@ -67,6 +81,45 @@ for activity_function in activity_functions:
     wfr.register_activity(activity_function)
 wfr.start()
 
+workflow_client = WorkflowClient()
+bulk_schedule_concurrency = int(app_config.get(TA_BULK_SCHEDULE_CONCURRENCY.env_name))
+bulk_schedule_max_inputs = int(app_config.get(TA_BULK_SCHEDULE_MAX_INPUTS.env_name))
+
+# Waits block a thread for up to their timeout, so they get their own pool
+# rather than starving the default one used by every other endpoint. Each
+# /wait request or open /sse stream holds one of the pool's threads.
+max_waiters = int(app_config.get(TA_MAX_WORKFLOW_WAITERS.env_name))
+wait_executor = ThreadPoolExecutor(
+    max_workers=max_waiters, thread_name_prefix="workflow-wait"
+)
+active_waiters = 0
+
+
+def check_waiter_capacity() -> None:
+    if active_waiters >= max_waiters:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many workflows are being waited on",
+            headers={"Retry-After": "1"},
+        )
+
+
+@contextmanager
+def waiter() -> Iterator[None]:
+    global active_waiters
+    active_waiters += 1
+    try:
+        yield
+    finally:
+        active_waiters -= 1
+
+
+async def run_wait(func: Callable[..., T], *args) -> T:
+    return await asyncio.get_running_loop().run_in_executor(
+        wait_executor, functools.partial(func, *args)
+    )
+
+
 app = FastAPI()
 # noinspection PyTypeChecker
 app.add_middleware(TelemetryMiddleware, get_telemetry())
@@ -80,9 +133,42 @@ async def invoke(inputs: input_type) -> ScheduleWorkflowResponse:
     """
     {0}
     """
-    client = WorkflowClient()
+    return await asyncio.to_thread(
+        workflow_client.schedule_new_workflow, workflow_class.entrypoint, inputs
+    )
+
+
+@app.post(
+    f"/{config.service_name}/{str(config.version)}/bulk",
+    responses={413: {"description": "Too many inputs"}},
+)
+async def invoke_bulk(inputs: list[input_type]) -> list[BulkScheduleResult]:
+    """
+    Schedule one workflow instance per input. A result is returned for every
+    input, in the order of the inputs, holding either the instance ID or the
+    error which prevented scheduling it.
+    """
+    if len(inputs) > bulk_schedule_max_inputs:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {bulk_schedule_max_inputs} inputs can be scheduled at once",
+        )
+    semaphore = asyncio.Semaphore(bulk_schedule_concurrency)
 
-    return client.schedule_new_workflow(workflow_class.entrypoint, inputs)
+    async def schedule(workflow_input) -> BulkScheduleResult:
+        async with semaphore:
+            try:
+                response = await asyncio.to_thread(
+                    workflow_client.schedule_new_workflow,
+                    workflow_class.entrypoint,
+                    workflow_input,
+                )
+            except (RpcError, TypeError, ValueError) as e:
+                logging.warning(f"Failed to schedule workflow: {e}")
+                return BulkScheduleResult(error=str(e))
+            return BulkScheduleResult(instance_id=response.instance_id)
+
+    return list(await asyncio.gather(*(schedule(i) for i in inputs)))
 
 
 @app.get(
@@ -93,10 +179,8 @@ async def get_workflow(instance_id: str) -> WorkflowState:
     """
     Retrieve the workflow state by instance ID
     """
-    client = WorkflowClient()
-
     try:
-        return client.get_workflow_state(instance_id)
+        return await asyncio.to_thread(workflow_client.get_workflow_state, instance_id)
     except WorkflowNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -105,14 +189,18 @@ async def get_workflow(instance_id: str) -> WorkflowState:
     f"/{config.service_name}/{str(config.version)}/{{instance_id}}/events",
     responses={404: {"description": "Workflow not found"}},
 )
-async def send_event(instance_id: str, event: WorkflowEvent) -> WorkflowState:
+async def send_event(
+    instance_id: str, event: WorkflowEvent, include_state: bool = True
+) -> WorkflowState | None:
     """
-    Send an event to a workflow instance
+    Send an event to a workflow instance. Set `include_state` to false to skip
+    fetching the workflow's state after the event is raised; only the
+    workflow's existence is checked, and null is returned.
     """
-    client = WorkflowClient()
-
     try:
-        return client.raise_workflow_event(instance_id, event)
+        return await asyncio.to_thread(
+            workflow_client.raise_workflow_event, instance_id, event, include_state
+        )
     except WorkflowNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -122,14 +210,81 @@ async def send_event(instance_id: str, event: WorkflowEvent) -> WorkflowState:
     responses={404: {"description": "Workflow not found"}},
 )
 async def update_state(
-    instance_id: str, update_request: WorkflowUpdateRequest
+    instance_id: str, update_request: WorkflowUpdateRequest, include_state: bool = True
+) -> WorkflowState | None:
+    """
+    Pause, Resume, or Terminate an existing workflow by instance ID. Set
+    `include_state` to false to skip fetching the workflow's state afterwards;
+    only the workflow's existence is checked, and null is returned.
+    """
+    try:
+        return await asyncio.to_thread(
+            workflow_client.update_state, instance_id, update_request, include_state
+        )
+    except WorkflowNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@app.get(
+    f"/{config.service_name}/{str(config.version)}/{{instance_id}}/wait",
+    responses={
+        404: {"description": "Workflow not found"},
+        503: {"description": "Too many workflows are being waited on"},
+    },
+)
+async def wait_for_workflow(
+    instance_id: str,
+    timeout: float = Query(30, gt=0, le=300),
+    until_started: bool = False,
 ) -> WorkflowState:
     """
-    Pause, Resume, or Terminate an existing workflow by instance ID
+    Wait for a workflow to complete (or start, if `until_started` is set) and
+    return its state. If the timeout passes first, the current state is
+    returned.
     """
-    client = WorkflowClient()
+    check_waiter_capacity()
+    try:
+        with waiter():
+            return await run_wait(
+                workflow_client.wait_for_workflow, instance_id, timeout, until_started
+            )
+    except WorkflowNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
+
+@app.get(
+    f"/{config.service_name}/{str(config.version)}/{{instance_id}}/sse",
+    responses={
+        404: {"description": "Workflow not found"},
+        503: {"description": "Too many workflows are being waited on"},
+    },
+)
+async def stream_workflow_state(
+    instance_id: str, interval: float = Query(15, gt=0, le=300)
+) -> StreamingResponse:
+    """
+    Stream the workflow's state as server-sent events, one event per state
+    change, until it reaches a terminal state. Completion is reported as soon
+    as it happens; other transitions are picked up every `interval` seconds.
+    """
+    check_waiter_capacity()
     try:
-        return client.update_state(instance_id, update_request)
+        state = await asyncio.to_thread(workflow_client.get_workflow_state, instance_id)
     except WorkflowNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
+
+    async def state_events(state: WorkflowState) -> AsyncIterable[str]:
+        last_seen = None
+        with waiter():
+            while True:
+                seen = (state.runtime_status, state.last_updated_at)
+                if seen != last_seen:
+                    last_seen = seen
+                    yield f"event: state\ndata: {state.model_dump_json()}\n\n"
+                if state.is_terminal:
+                    return
+                state = await run_wait(
+                    workflow_client.wait_for_workflow, instance_id, interval
+                )
+
+    return StreamingResponse(state_events(state), media_type="text/event-stream")
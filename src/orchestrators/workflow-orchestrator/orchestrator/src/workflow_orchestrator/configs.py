@@ -9,6 +9,33 @@ TA_AGW_HOST = Config(
 TA_AGW_SECURE = Config(
     env_name="TA_AGW_SECURE", is_required=True, default_value="false"
 )
+TA_AGW_CONNECT_TIMEOUT = Config(
+    env_name="TA_AGW_CONNECT_TIMEOUT", is_required=False, default_value="5"
+)
+TA_AGW_READ_TIMEOUT = Config(
+    env_name="TA_AGW_READ_TIMEOUT", is_required=False, default_value="300"
+)
+TA_AGW_MAX_RETRIES = Config(
+    env_name="TA_AGW_MAX_RETRIES", is_required=False, default_value="3"
+)
+TA_AGW_POOL_SIZE = Config(
+    env_name="TA_AGW_POOL_SIZE", is_required=False, default_value="20"
+)
+TA_BULK_SCHEDULE_CONCURRENCY = Config(
+    env_name="TA_BULK_SCHEDULE_CONCURRENCY", is_required=False, default_value="16"
+)
+TA_BULK_SCHEDULE_MAX_INPUTS = Config(
+    env_name="TA_BULK_SCHEDULE_MAX_INPUTS", is_required=False, default_value="1000"
+)
+TA_MAX_WORKFLOW_WAITERS = Config(
+    env_name="TA_MAX_WORKFLOW_WAITERS", is_required=False, default_value="64"
+)
+TA_ACTIVITY_RESULT_STORE = Config(
+    env_name="TA_ACTIVITY_RESULT_STORE", is_required=False, default_value=None
+)
+TA_ACTIVITY_RESULT_TTL = Config(
+    env_name="TA_ACTIVITY_RESULT_TTL", is_required=False, default_value="86400"
+)
 TA_SERVICE_CONFIG = Config(
     env_name="TA_SERVICE_CONFIG", is_required=True, default_value="conf/config.yaml"
 )
@@ -20,6 +47,15 @@ configs: List[Config] = [
     TA_AGW_KEY,
     TA_AGW_HOST,
     TA_AGW_SECURE,
+    TA_AGW_CONNECT_TIMEOUT,
+    TA_AGW_READ_TIMEOUT,
+    TA_AGW_MAX_RETRIES,
+    TA_AGW_POOL_SIZE,
+    TA_BULK_SCHEDULE_CONCURRENCY,
+    TA_BULK_SCHEDULE_MAX_INPUTS,
+    TA_MAX_WORKFLOW_WAITERS,
+    TA_ACTIVITY_RESULT_STORE,
+    TA_ACTIVITY_RESULT_TTL,
     TA_SERVICE_CONFIG,
     TA_WORKFLOW_MODULE,
 ]
@@ -55,6 +55,11 @@ class ScheduleWorkflowResponse(BaseModel):
     instance_id: str
 
 
+class BulkScheduleResult(BaseModel):
+    instance_id: str | None = None
+    error: str | None = None
+
+
 class WorkflowState(BaseModel):
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
@@ -67,6 +72,10 @@ class WorkflowState(BaseModel):
     serialized_output: Union[str, None]
     serialized_custom_status: Union[str, None]
 
+    @property
+    def is_terminal(self) -> bool:
+        return self.runtime_status in ("COMPLETED", "FAILED", "TERMINATED")
+
     @staticmethod
     def new_from_orchestrator_state(orch_state: OrchestrationState) -> "WorkflowState":
         return WorkflowState(
@@ -3,6 +3,7 @@ from typing import TypeVar
 
 from dapr.ext.workflow import DaprWorkflowClient
 from dapr.ext.workflow.workflow_context import Workflow
+from grpc import RpcError, StatusCode
 
 from workflow_orchestrator import (
     ScheduleWorkflowResponse,
@@ -20,7 +21,18 @@ class WorkflowNotFoundException(Exception):
         super().__init__(msg)
 
 
+def _is_not_found(e: RpcError) -> bool:
+    return e.code() == StatusCode.NOT_FOUND
+
+
 class WorkflowClient:
+    """Thin wrapper around ``DaprWorkflowClient``.
+
+    The underlying gRPC channel is thread-safe, so a single instance is meant
+    to be shared for the lifetime of the process. All methods block on the
+    Dapr sidecar; async callers should run them in a worker thread.
+    """
+
     def __init__(self):
         self._client = DaprWorkflowClient()
         self._logger = logging.getLogger("WorkflowClient")
@@ -36,25 +48,79 @@ class WorkflowClient:
             state = self._client._DaprWorkflowClient__obj.get_orchestration_state(
                 instance_id
             )
-            return WorkflowState.new_from_orchestrator_state(state)
-        except Exception as e:
-            self._logger.warning(f"Failed to get workflow state: {e}")
+        except RpcError as e:
+            if not _is_not_found(e):
+                self._logger.warning(f"Failed to get workflow state: {e}")
+                raise
+            raise WorkflowNotFoundException(f"Workflow {instance_id} not found") from e
+        if state is None:
             raise WorkflowNotFoundException(f"Workflow {instance_id} not found")
+        return WorkflowState.new_from_orchestrator_state(state)
 
-    def raise_workflow_event(
-        self, instance_id: str, event: WorkflowEvent
+    def _ensure_exists(self, instance_id: str) -> None:
+        """Checks that a workflow exists without fetching its inputs and outputs."""
+        try:
+            state = self._client._DaprWorkflowClient__obj.get_orchestration_state(
+                instance_id, fetch_payloads=False
+            )
+        except RpcError as e:
+            if not _is_not_found(e):
+                raise
+            raise WorkflowNotFoundException(f"Workflow {instance_id} not found") from e
+        if state is None:
+            raise WorkflowNotFoundException(f"Workflow {instance_id} not found")
+
+    def wait_for_workflow(
+        self, instance_id: str, timeout: float, until_started: bool = False
     ) -> WorkflowState:
+        """Blocks until the workflow completes (or starts, if ``until_started``)
+        or ``timeout`` seconds pass, then returns its current state.
+
+        Only a workflow which doesn't exist raises ``WorkflowNotFoundException``;
+        other sidecar errors are raised as is.
+        """
+        client = self._client._DaprWorkflowClient__obj
+        try:
+            if until_started:
+                state = client.wait_for_orchestration_start(
+                    instance_id, fetch_payloads=True, timeout=timeout
+                )
+            else:
+                state = client.wait_for_orchestration_completion(
+                    instance_id, fetch_payloads=True, timeout=timeout
+                )
+        except TimeoutError:
+            return self.get_workflow_state(instance_id)
+        except RpcError as e:
+            if not _is_not_found(e):
+                self._logger.warning(f"Failed to wait for workflow: {e}")
+                raise
+            raise WorkflowNotFoundException(f"Workflow {instance_id} not found") from e
+        if state is None:
+            raise WorkflowNotFoundException(f"Workflow {instance_id} not found")
+        return WorkflowState.new_from_orchestrator_state(state)
+
+    def raise_workflow_event(
+        self, instance_id: str, event: WorkflowEvent, include_state: bool = True
+    ) -> WorkflowState | None:
+        if not include_state:
+            self._ensure_exists(instance_id)
         event_data = event.event_data.model_dump()
         self._client.raise_workflow_event(
             instance_id=instance_id,
             event_name=event.event_name,
             data=event_data,
         )
-        return self.get_workflow_state(instance_id)
+        return self.get_workflow_state(instance_id) if include_state else None
 
     def update_state(
-        self, instance_id: str, update_request: WorkflowUpdateRequest
-    ) -> WorkflowState:
+        self,
+        instance_id: str,
+        update_request: WorkflowUpdateRequest,
+        include_state: bool = True,
+    ) -> WorkflowState | None:
+        if not include_state:
+            self._ensure_exists(instance_id)
         match update_request.action:
             case WorkflowAction.PAUSE:
                 self._client.pause_workflow(instance_id)
@@ -62,4 +128,4 @@ class WorkflowClient:
                 self._client.resume_workflow(instance_id)
             case WorkflowAction.TERMINATE:
                 self._client.terminate_workflow(instance_id)
-        return self.get_workflow_state(instance_id)
+        return self.get_workflow_state(instance_id) if include_state else None
@@ -0,0 +1,99 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from dapr.clients.exceptions import DaprInternalError
+from grpc import RpcError
+
+from workflow_orchestrator import create_agent_input, invoke_agent_task
+from workflow_orchestrator.activity_result_store import ActivityResultStore
+
+
+@pytest.fixture
+def store():
+    with patch("workflow_orchestrator.activity_result_store.DaprClient"):
+        return ActivityResultStore("statestore", 60)
+
+
+def _input(text: str = "hello"):
+    return create_agent_input("Agent", "0.1", {"text": text})
+
+
+def test_keys_are_per_call():
+    key = ActivityResultStore.key_for("wf-1", 1, "invoke_agent_task", _input())
+
+    assert key == ActivityResultStore.key_for("wf-1", 1, "invoke_agent_task", _input())
+    assert key != ActivityResultStore.key_for("wf-1", 2, "invoke_agent_task", _input())
+    assert key != ActivityResultStore.key_for("wf-2", 1, "invoke_agent_task", _input())
+    assert key != ActivityResultStore.key_for(
+        "wf-1", 1, "invoke_agent_task", _input("bye")
+    )
+
+
+def test_get_returns_recorded_result(store):
+    store._client.get_state.return_value = MagicMock(data=json.dumps({"a": 1}))
+
+    assert store.get("key") == {"a": 1}
+    store._client.get_state.assert_called_once_with("statestore", "key")
+
+
+def test_get_missing_result(store):
+    store._client.get_state.return_value = MagicMock(data=b"")
+
+    assert store.get("key") is None
+
+
+def test_get_ignores_store_errors(store):
+    store._client.get_state.side_effect = RpcError("unavailable")
+
+    assert store.get("key") is None
+
+
+def test_save_sets_ttl(store):
+    store.save("key", {"a": 1})
+
+    store._client.save_state.assert_called_once_with(
+        "statestore", "key", '{"a": 1}', state_metadata={"ttlInSeconds": "60"}
+    )
+
+
+def test_save_ignores_store_errors(store):
+    store._client.save_state.side_effect = DaprInternalError("unavailable")
+
+    store.save("key", {"a": 1})
+
+
+@pytest.fixture
+def agent_invoker():
+    with patch("workflow_orchestrator.agent_invoker.AgentInvoker") as agent_invoker:
+        invoker = agent_invoker.return_value
+        invoker.request_agent.side_effect = lambda agent_input: {
+            "output_raw": f"answer {invoker.request_agent.call_count}"
+        }
+        invoker.parse_output.side_effect = lambda response, output_type: response[
+            "output_raw"
+        ]
+        yield invoker
+
+
+def test_invoke_agent_task_reuses_result_of_same_call(agent_invoker):
+    recorded = {}
+    result_store = MagicMock()
+    result_store.key_for = ActivityResultStore.key_for
+    result_store.get.side_effect = recorded.get
+    result_store.save.side_effect = recorded.__setitem__
+
+    with patch(
+        "workflow_orchestrator.agent_invoker.get_activity_result_store",
+        return_value=result_store,
+    ):
+        first = MagicMock(workflow_id="wf-1", task_id=1)
+        second = MagicMock(workflow_id="wf-1", task_id=2)
+        results = [
+            invoke_agent_task(first, _input()),
+            invoke_agent_task(first, _input()),
+            invoke_agent_task(second, _input()),
+        ]
+
+    assert results == ["answer 1", "answer 1", "answer 2"]
+    assert agent_invoker.request_agent.call_count == 2
@@ -0,0 +1,184 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from workflow_orchestrator import (
+    AgentActivityInput,
+    AgentInvocationError,
+    invoke_agents,
+)
+from workflow_orchestrator import agent_invoker
+from workflow_orchestrator.agent_invoker import AgentInvoker, _GatewaySettings
+
+
+class FakeTask:
+    def __init__(self, agent_input: AgentActivityInput):
+        self.agent_input = agent_input
+        self.is_complete = False
+        self.is_failed = False
+        self._result = None
+        self._exception = None
+
+    def complete(self, result=None, exception: Exception | None = None) -> None:
+        self.is_complete = True
+        self.is_failed = exception is not None
+        self._result = result
+        self._exception = exception
+
+    def get_result(self):
+        return self._result
+
+    def get_exception(self) -> Exception:
+        return self._exception
+
+
+class FakeContext:
+    """Schedules activities as fake tasks, recording the most in flight at once."""
+
+    def __init__(self):
+        self.tasks: list[FakeTask] = []
+        self.max_in_flight = 0
+
+    def call_activity(self, activity, input, retry_policy=None) -> FakeTask:
+        task = FakeTask(input)
+        self.tasks.append(task)
+        in_flight = sum(not t.is_complete for t in self.tasks)
+        self.max_in_flight = max(self.max_in_flight, in_flight)
+        return task
+
+
+def _input(name: str) -> AgentActivityInput:
+    return AgentActivityInput(agent_name=name, agent_version="0.1", agent_input={})
+
+
+def _run(ctx: FakeContext, inputs, finish, **kwargs):
+    """Drives invoke_agents like the workflow runtime, completing the
+    in-flight tasks chosen by ``finish`` each time it waits."""
+    with patch("workflow_orchestrator.agent_invoker.when_any", lambda tasks: tasks):
+        generator = invoke_agents(ctx, inputs, **kwargs)
+        try:
+            waiting = next(generator)
+            while True:
+                finish(waiting)
+                waiting = generator.send(None)
+        except StopIteration as stop:
+            return stop.value
+
+
+def _finish_last(waiting: list[FakeTask]) -> None:
+    task = waiting[-1]
+    if task.agent_input.agent_name == "failing":
+        task.complete(exception=RuntimeError("agent failed"))
+    else:
+        task.complete(result=f"{task.agent_input.agent_name} result")
+
+
+def test_results_are_in_input_order():
+    ctx = FakeContext()
+    inputs = [_input(name) for name in "abcde"]
+
+    results = _run(ctx, inputs, _finish_last, max_parallel=2)
+
+    assert results == [f"{name} result" for name in "abcde"]
+    assert ctx.max_in_flight == 2
+
+
+def test_failure_is_raised_after_other_agents_finish():
+    ctx = FakeContext()
+    inputs = [_input("a"), _input("failing"), _input("c")]
+
+    with pytest.raises(RuntimeError, match="agent failed"):
+        _run(ctx, inputs, _finish_last)
+
+    assert all(task.is_complete for task in ctx.tasks)
+    assert len(ctx.tasks) == 3
+
+
+def test_failures_are_returned_in_place():
+    ctx = FakeContext()
+    inputs = [_input("a"), _input("failing"), _input("c")]
+
+    results = _run(ctx, inputs, _finish_last, return_exceptions=True)
+
+    assert results[0] == "a result"
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == "c result"
+
+
+def test_max_parallel_must_be_positive():
+    with pytest.raises(ValueError):
+        _run(FakeContext(), [_input("a")], _finish_last, max_parallel=0)
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    settings = _GatewaySettings(
+        api_key="key",
+        host="gateway:8000",
+        secure=False,
+        connect_timeout=2,
+        read_timeout=30,
+        max_retries=3,
+        pool_size=8,
+    )
+    monkeypatch.setattr(agent_invoker, "_gateway_settings", lambda: settings)
+    monkeypatch.setattr(agent_invoker, "_session", None)
+
+
+def test_session_is_shared(gateway):
+    first = AgentInvoker("AgentA", "0.1")
+    second = AgentInvoker("AgentB", "0.1")
+
+    assert first.session is second.session
+    adapter = first.session.get_adapter("http://gateway:8000/AgentA/0.1")
+    assert adapter._pool_maxsize == 8
+    retry = adapter.max_retries
+    assert (retry.total, retry.connect, retry.read) == (3, 3, 0)
+    assert set(retry.status_forcelist) == {429, 503}
+
+
+def _invoker_responding(**response) -> AgentInvoker:
+    session = MagicMock()
+    session.post.return_value = MagicMock(**response)
+    return AgentInvoker("Agent", "0.1", session=session)
+
+
+def test_request_uses_gateway_timeouts(gateway):
+    invoker = _invoker_responding(ok=True, json=lambda: {"output_raw": "hi"})
+
+    assert invoker.invoke_agent({"text": "hello"}) == "hi"
+    invoker.session.post.assert_called_once_with(
+        "http://gateway:8000/Agent/0.1",
+        data='{"text": "hello"}',
+        headers={"taAgwKey": "key"},
+        timeout=(2, 30),
+    )
+
+
+def test_timeouts_raise_invocation_error(gateway):
+    invoker = _invoker_responding()
+    invoker.session.post.side_effect = requests.ReadTimeout("read timed out")
+
+    with pytest.raises(AgentInvocationError, match="read timed out") as raised:
+        invoker.request_agent({"text": "hello"})
+    assert raised.value.status_code is None
+
+
+@pytest.mark.parametrize("status_code", [400, 429, 500, 503])
+def test_error_responses_raise_with_status_code(gateway, status_code):
+    invoker = _invoker_responding(ok=False, status_code=status_code, text="nope")
+
+    with pytest.raises(AgentInvocationError) as raised:
+        invoker.request_agent({"text": "hello"})
+    assert raised.value.status_code == status_code
+
+
+def test_invalid_responses_raise_invocation_error(gateway):
+    def invalid_json():
+        raise ValueError("not json")
+
+    with pytest.raises(AgentInvocationError, match="Invalid agent response"):
+        _invoker_responding(ok=True, json=invalid_json).request_agent({})
+    with pytest.raises(AgentInvocationError, match="Invalid agent response"):
+        _invoker_responding(ok=True, json=lambda: {}).invoke_agent({})
@@ -0,0 +1,187 @@
+import importlib
+import os
+import sys
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from grpc import RpcError
+
+from workflow_orchestrator import WorkflowNotFoundException, WorkflowState
+
+CONFIG = """
+apiVersion: skagents/v1
+kind: WorkflowOrchestrator
+service_name: TestWorkflow
+version: 0.1
+entrypoint: TestWorkflow
+input_type: TestWorkflowInput
+"""
+
+WORKFLOW = """
+from pydantic import BaseModel
+
+from workflow_orchestrator import Workflow
+
+
+class TestWorkflowInput(BaseModel):
+    name: str
+
+
+class TestWorkflow(Workflow):
+    @staticmethod
+    def setup():
+        pass
+
+    @staticmethod
+    def entrypoint(ctx, workflow_input: TestWorkflowInput):
+        yield None
+"""
+
+BASE = "/TestWorkflow/0.1"
+
+
+@pytest.fixture(scope="module")
+def app_module(tmp_path_factory):
+    conf = tmp_path_factory.mktemp("conf")
+    (conf / "config.yaml").write_text(CONFIG)
+    (conf / "workflow.py").write_text(WORKFLOW)
+    env = {
+        "TA_SERVICE_CONFIG": str(conf / "config.yaml"),
+        "TA_AGW_KEY": "key",
+        "TA_TELEMETRY_ENABLED": "false",
+        "TA_BULK_SCHEDULE_MAX_INPUTS": "3",
+        "TA_MAX_WORKFLOW_WAITERS": "2",
+    }
+    with (
+        patch.dict(os.environ, env),
+        patch("dapr.ext.workflow.WorkflowRuntime"),
+        patch("workflow_orchestrator.WorkflowClient"),
+    ):
+        sys.modules.pop("workflow_orchestrator.app", None)
+        yield importlib.import_module("workflow_orchestrator.app")
+    sys.modules.pop("workflow_orchestrator.app", None)
+
+
+@pytest.fixture
+def workflow_client(app_module, monkeypatch):
+    workflow_client = MagicMock()
+    monkeypatch.setattr(app_module, "workflow_client", workflow_client)
+    return workflow_client
+
+
+@pytest.fixture
+def client(app_module):
+    return TestClient(app_module.app, raise_server_exceptions=False)
+
+
+def _state(runtime_status: str, minute: int = 0) -> WorkflowState:
+    return WorkflowState(
+        instance_id="wf-1",
+        name="TestWorkflow",
+        runtime_status=runtime_status,
+        created_at=datetime(2025, 1, 1),
+        last_updated_at=datetime(2025, 1, 1, 0, minute),
+        serialized_input=None,
+        serialized_output=None,
+        serialized_custom_status=None,
+    )
+
+
+def test_bulk_reports_result_per_input(client, workflow_client):
+    def schedule(workflow, workflow_input):
+        if workflow_input.name == "bad":
+            raise RpcError("unavailable")
+        return MagicMock(instance_id=f"wf-{workflow_input.name}")
+
+    workflow_client.schedule_new_workflow.side_effect = schedule
+
+    response = client.post(
+        f"{BASE}/bulk", json=[{"name": "a"}, {"name": "bad"}, {"name": "c"}]
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"instance_id": "wf-a", "error": None},
+        {"instance_id": None, "error": "unavailable"},
+        {"instance_id": "wf-c", "error": None},
+    ]
+
+
+def test_bulk_rejects_too_many_inputs(client, workflow_client):
+    response = client.post(f"{BASE}/bulk", json=[{"name": str(i)} for i in range(4)])
+
+    assert response.status_code == 413
+    workflow_client.schedule_new_workflow.assert_not_called()
+
+
+def test_wait_returns_state(client, workflow_client):
+    workflow_client.wait_for_workflow.return_value = _state("COMPLETED")
+
+    response = client.get(
+        f"{BASE}/wf-1/wait", params={"timeout": 5, "until_started": True}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["runtime_status"] == "COMPLETED"
+    workflow_client.wait_for_workflow.assert_called_once_with("wf-1", 5.0, True)
+
+
+def test_wait_for_unknown_workflow(client, workflow_client):
+    workflow_client.wait_for_workflow.side_effect = WorkflowNotFoundException(
+        "not found"
+    )
+
+    assert client.get(f"{BASE}/wf-1/wait").status_code == 404
+
+
+def test_wait_sidecar_errors_are_not_reported_as_not_found(client, workflow_client):
+    workflow_client.wait_for_workflow.side_effect = RpcError("unavailable")
+
+    assert client.get(f"{BASE}/wf-1/wait").status_code == 500
+
+
+def test_waiters_are_bounded(app_module, client, workflow_client, monkeypatch):
+    monkeypatch.setattr(app_module, "active_waiters", app_module.max_waiters)
+
+    for path in ("wait", "sse"):
+        response = client.get(f"{BASE}/wf-1/{path}")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+    workflow_client.wait_for_workflow.assert_not_called()
+    workflow_client.get_workflow_state.assert_not_called()
+
+
+def test_waiters_are_released(app_module, client, workflow_client):
+    workflow_client.wait_for_workflow.side_effect = RpcError("unavailable")
+
+    client.get(f"{BASE}/wf-1/wait")
+
+    assert app_module.active_waiters == 0
+
+
+def test_sse_streams_state_changes_until_terminal(app_module, client, workflow_client):
+    workflow_client.get_workflow_state.return_value = _state("RUNNING")
+    workflow_client.wait_for_workflow.side_effect = [
+        _state("RUNNING"),
+        _state("RUNNING", minute=1),
+        _state("COMPLETED", minute=2),
+    ]
+
+    response = client.get(f"{BASE}/wf-1/sse", params={"interval": 1})
+
+    assert response.status_code == 200
+    events = [e for e in response.text.split("\n\n") if e]
+    assert len(events) == 3
+    assert all(e.startswith("event: state\ndata: ") for e in events)
+    assert '"COMPLETED"' in events[-1]
+    assert app_module.active_waiters == 0
+
+
+def test_sse_for_unknown_workflow(client, workflow_client):
+    workflow_client.get_workflow_state.side_effect = WorkflowNotFoundException(
+        "not found"
+    )
+
+    assert client.get(f"{BASE}/wf-1/sse").status_code == 404
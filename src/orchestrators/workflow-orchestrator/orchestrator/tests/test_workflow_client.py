@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from grpc import RpcError, StatusCode
+
+from workflow_orchestrator import WorkflowClient, WorkflowNotFoundException
+
+
+class FakeRpcError(RpcError):
+    def __init__(self, code: StatusCode):
+        self._code = code
+
+    def code(self) -> StatusCode:
+        return self._code
+
+
+@pytest.fixture
+def orchestration_client():
+    with patch("workflow_orchestrator.workflow_client.DaprWorkflowClient"):
+        client = WorkflowClient()
+    orchestration_client = MagicMock()
+    client._client._DaprWorkflowClient__obj = orchestration_client
+    return client, orchestration_client
+
+
+def test_wait_for_unknown_workflow(orchestration_client):
+    client, orchestration_client = orchestration_client
+    orchestration_client.wait_for_orchestration_completion.return_value = None
+
+    with pytest.raises(WorkflowNotFoundException):
+        client.wait_for_workflow("wf-1", 5)
+
+
+def test_wait_maps_not_found_error(orchestration_client):
+    client, orchestration_client = orchestration_client
+    orchestration_client.wait_for_orchestration_start.side_effect = FakeRpcError(
+        StatusCode.NOT_FOUND
+    )
+
+    with pytest.raises(WorkflowNotFoundException):
+        client.wait_for_workflow("wf-1", 5, until_started=True)
+
+
+def test_wait_raises_sidecar_errors(orchestration_client):
+    client, orchestration_client = orchestration_client
+    error = FakeRpcError(StatusCode.UNAVAILABLE)
+    orchestration_client.wait_for_orchestration_completion.side_effect = error
+
+    with pytest.raises(RpcError) as raised:
+        client.wait_for_workflow("wf-1", 5)
+    assert raised.value is error
+
+
+def test_get_state_of_unknown_workflow(orchestration_client):
+    client, orchestration_client = orchestration_client
+    orchestration_client.get_orchestration_state.return_value = None
+
+    with pytest.raises(WorkflowNotFoundException):
+        client.get_workflow_state("wf-1")
+
+
+def test_wait_timeout_raises_sidecar_errors_of_state_lookup(orchestration_client):
+    client, orchestration_client = orchestration_client
+    orchestration_client.wait_for_orchestration_completion.side_effect = TimeoutError()
+    orchestration_client.get_orchestration_state.side_effect = FakeRpcError(
+        StatusCode.UNAVAILABLE
+    )
+
+    with pytest.raises(RpcError):
+        client.wait_for_workflow("wf-1", 5)
+    orchestration_client.get_orchestration_state.assert_called_once_with("wf-1")
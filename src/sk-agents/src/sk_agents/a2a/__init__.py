@@ -1,4 +1,5 @@
 from .a2a_agent_executor import A2AAgentExecutor as A2AAgentExecutor
+from .cancellation import CancellationRegistry as CancellationRegistry
 from .redis_task_store import RedisTaskStore as RedisTaskStore
 from .request_processor import RequestProcessor as RequestProcessor
 from .response_classifier import A2AResponseClassifier as A2AResponseClassifier
@@ -1,3 +1,6 @@
+import asyncio
+import logging
+
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.types import (
@@ -8,6 +11,7 @@ from a2a.types import (
 from a2a.utils import new_agent_text_message
 from ska_utils import AppConfig
 
+from sk_agents.a2a.cancellation import CancellationRegistry
 from sk_agents.a2a.request_processor import RequestProcessor
 from sk_agents.a2a.response_classifier import A2AResponseClassifier
 from sk_agents.ska_types import (
@@ -33,8 +37,24 @@ class A2AAgentExecutor(AgentExecutor):
             app_config=app_config, chat_completion_builder=chat_completion_builder
         )
         self.state_manager = state_manager
+        self.cancellations = CancellationRegistry()
+        self._cancellation_listener: asyncio.Task | None = None
+        self.logger = logging.getLogger(__name__)
+
+    def _ensure_cancellation_listener(self) -> None:
+        if self._cancellation_listener is None or self._cancellation_listener.done():
+            self._cancellation_listener = asyncio.create_task(self._listen_for_cancellations())
+
+    async def _listen_for_cancellations(self) -> None:
+        try:
+            async for task_id in self.state_manager.listen_for_cancellations():
+                self.cancellations.cancel(task_id)
+        except Exception as e:
+            # Restarted by the next request; polling the canceled state still applies
+            self.logger.warning(f"Stopped listening for task cancellations: {e}")
 
     async def execute(self, context: RequestContext, event_queue: EventQueue):
+        self._ensure_cancellation_listener()
         try:
             handler: BaseHandler = skagents_handle(self.config, self.app_config, None)
             processor = RequestProcessor(
@@ -43,8 +63,16 @@ class A2AAgentExecutor(AgentExecutor):
                 context,
                 event_queue,
                 self.state_manager,
+                stream_output=self.config.output_type is None,
             )
-            await processor.process_request()
+            processing = asyncio.create_task(processor.process_request())
+            with self.cancellations.running(context.task_id, processing):
+                try:
+                    await processing
+                except asyncio.CancelledError:
+                    if not self.cancellations.was_canceled(context.task_id):
+                        raise
+                    processor.handle_canceled()
 
         except Exception as e:
             event_queue.enqueue_event(
@@ -61,3 +89,19 @@ class A2AAgentExecutor(AgentExecutor):
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue):
         await self.state_manager.set_canceled(context.task_id)
+        if self.cancellations.cancel(context.task_id):
+            # The canceled status is sent by the interrupted execution
+            return
+        # The task isn't processed here; another instance is notified by the
+        # state manager, and the caller gets its final status right away
+        event_queue.enqueue_event(
+            TaskStatusUpdateEvent(
+                contextId=context.context_id,
+                taskId=context.task_id,
+                final=True,
+                status=TaskStatus(
+                    state=TaskState.canceled,
+                    message=new_agent_text_message("Task was cancelled by the user."),
+                ),
+            )
+        )
@@ -0,0 +1,45 @@
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class CancellationRegistry:
+    """Tracks the asyncio task processing each A2A task so it can be cancelled.
+
+    Cancelling the asyncio task interrupts whatever it is awaiting, including
+    in-flight model and remote plugin calls, instead of waiting for the next
+    point where the task's canceled state is checked.
+    """
+
+    def __init__(self):
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._canceled: set[str] = set()
+
+    @contextmanager
+    def running(self, task_id: str, task: asyncio.Task) -> Iterator[None]:
+        self._tasks[task_id] = task
+        try:
+            yield
+        finally:
+            if self._tasks.get(task_id) is task:
+                del self._tasks[task_id]
+            self._canceled.discard(task_id)
+
+    def is_running(self, task_id: str) -> bool:
+        return task_id in self._tasks
+
+    def cancel(self, task_id: str) -> bool:
+        """Cancels the task's processing if it runs in this process.
+
+        Returns:
+            True if the processing was cancelled.
+        """
+        task = self._tasks.get(task_id)
+        if task is None or task.done():
+            return False
+        self._canceled.add(task_id)
+        task.cancel()
+        return True
+
+    def was_canceled(self, task_id: str) -> bool:
+        return task_id in self._canceled
@@ -1,13 +1,28 @@
 """
 Redis implementation of the TaskStore interface.
 This implementation uses Redis as the persistent store for Task objects.
+
+A task is stored across three keys so that saving an update only writes what
+changed since the previous save:
+- a hash holding the task without its history and artifacts, along with what
+  has already been stored of them;
+- an append-only list of history messages;
+- an append-only list of artifact chunks, each holding the parts added to an
+  artifact since the previous save.
 """
 
+import hashlib
 import json
 
 from a2a.server.tasks.task_store import TaskStore
-from a2a.types import Task
+from a2a.types import Artifact, Message, Task
+from pydantic import BaseModel
 from redis.asyncio import Redis
+from redis.exceptions import WatchError
+from ska_utils import get_metrics
+
+# Frame header of zstd-compressed data, which can't start a JSON document
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
 
 
 class RedisTaskStore(TaskStore):
@@ -16,16 +31,37 @@ class RedisTaskStore(TaskStore):
     This class provides Redis-based persistence for Task objects.
     """
 
-    def __init__(self, redis_client: Redis, ttl: int | None = None, key_prefix: str = "task:"):
+    def __init__(
+        self,
+        redis_client: Redis,
+        ttl: int | None = None,
+        key_prefix: str = "task:",
+        compression_threshold: int | None = None,
+    ):
         """Initialize the RedisTaskStore with a Redis client.
 
         Args:
             redis_client: An instance of Redis client
+            ttl: Time-to-live in seconds for stored tasks (default: no expiry)
             key_prefix: Prefix used for Redis keys (default: "task:")
+            compression_threshold: Size in bytes above which stored values are
+                compressed with zstd (default: no compression)
         """
         self._redis = redis_client
         self._ttl = ttl
         self._key_prefix = key_prefix
+        self._compression_threshold = compression_threshold
+        self._compressor = None
+        self._decompressor = None
+        if compression_threshold is not None:
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ValueError(
+                    "The zstandard package is required to compress stored tasks"
+                ) from e
+            self._compressor = zstandard.ZstdCompressor()
+            self._decompressor = zstandard.ZstdDecompressor()
 
     def _get_key(self, task_id: str) -> str:
         """Generate a Redis key for a given task ID.
@@ -38,20 +74,175 @@ class RedisTaskStore(TaskStore):
         """
         return f"{self._key_prefix}{task_id}"
 
+    def _get_meta_key(self, task_id: str) -> str:
+        """Generate the Redis key of the hash holding a task's status and metadata.
+
+        Args:
+            task_id: The ID of the task
+
+        Returns:
+            A Redis key string
+        """
+        return f"{self._key_prefix}{task_id}:meta"
+
+    def _get_history_key(self, task_id: str) -> str:
+        """Generate the Redis key of the list holding a task's history.
+
+        Args:
+            task_id: The ID of the task
+
+        Returns:
+            A Redis key string
+        """
+        return f"{self._key_prefix}{task_id}:history"
+
+    def _get_artifacts_key(self, task_id: str) -> str:
+        """Generate the Redis key of the list holding a task's artifact chunks.
+
+        Args:
+            task_id: The ID of the task
+
+        Returns:
+            A Redis key string
+        """
+        return f"{self._key_prefix}{task_id}:artifacts"
+
+    def _encode(self, model: BaseModel, **kwargs) -> bytes:
+        data = model.model_dump_json(**kwargs).encode()
+        if self._compressor is not None and len(data) > self._compression_threshold:
+            return self._compressor.compress(data)
+        return data
+
+    def _decode(self, data: bytes | str) -> dict:
+        if isinstance(data, bytes) and data.startswith(_ZSTD_MAGIC):
+            if self._decompressor is None:
+                raise ValueError("Stored task is compressed but compression is not configured")
+            data = self._decompressor.decompress(data)
+        return json.loads(data)
+
+    @staticmethod
+    def _fingerprint(artifact: Artifact) -> str:
+        """Identifies an artifact's stored content, so replacing it can be detected."""
+        first_part = artifact.parts[0].model_dump_json() if artifact.parts else ""
+        content = artifact.model_dump_json(exclude={"parts"}) + first_part
+        return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+    def _artifact_chunks(
+        self, artifacts: list[Artifact], manifest: dict[str, list]
+    ) -> tuple[list[bytes], dict[str, list], bool]:
+        """Determines the artifact chunks to append since the previous save.
+
+        Args:
+            artifacts: The task's artifacts
+            manifest: Per artifact ID, the number of parts stored and the
+                fingerprint of the artifact when first stored
+
+        Returns:
+            The chunks to store, the updated manifest, and whether the stored
+            chunks must be replaced rather than appended to
+        """
+        chunks: list[bytes] = []
+        updated: dict[str, list] = {}
+        replaced = not manifest.keys() <= {a.artifactId for a in artifacts}
+        for artifact in artifacts:
+            fingerprint = self._fingerprint(artifact)
+            stored_parts, stored_fingerprint = manifest.get(artifact.artifactId, (0, None))
+            if replaced or (
+                stored_fingerprint is not None
+                and (stored_fingerprint != fingerprint or stored_parts > len(artifact.parts))
+            ):
+                # An artifact was replaced or removed; store all artifacts again
+                return (
+                    [self._encode(a) for a in artifacts],
+                    {a.artifactId: [len(a.parts), self._fingerprint(a)] for a in artifacts},
+                    True,
+                )
+            if stored_fingerprint is None:
+                chunks.append(self._encode(artifact))
+            elif stored_parts < len(artifact.parts):
+                chunk = Artifact(
+                    artifactId=artifact.artifactId, parts=artifact.parts[stored_parts:]
+                )
+                chunks.append(self._encode(chunk, include={"artifactId", "parts"}))
+            updated[artifact.artifactId] = [len(artifact.parts), fingerprint]
+        return chunks, updated, False
+
     async def save(self, task: Task):
         """Saves or updates a task in the Redis store.
 
+        Only the history messages and artifact parts added since the task was
+        last saved are written.
+
         Args:
             task: The Task object to save
         """
-        # Convert the Task object to a serializable dictionary
-        task_dict = task.model_dump(mode="json")
+        meta_key = self._get_meta_key(task.id)
+        history_key = self._get_history_key(task.id)
+        artifacts_key = self._get_artifacts_key(task.id)
+        history = task.history or []
+        artifacts = task.artifacts or []
+        # Keeps whether the task has a history and artifacts, which are stored apart
+        summary = task.model_copy(
+            update={
+                "history": None if task.history is None else [],
+                "artifacts": None if task.artifacts is None else [],
+            }
+        )
 
-        # Serialize the task dictionary to JSON
-        task_json = json.dumps(task_dict)
+        with get_metrics().time_state_store("redis", "save_task"):
+            async with self._redis.pipeline(transaction=True) as pipe:
+                while True:
+                    try:
+                        # Retried if the task is saved concurrently
+                        await pipe.watch(meta_key)
+                        stored_history, stored_artifacts = await pipe.hmget(
+                            meta_key, "history", "artifacts"
+                        )
+                        stored_history = int(stored_history) if stored_history else 0
+                        manifest = json.loads(stored_artifacts) if stored_artifacts else {}
+                        chunks, manifest, replace_artifacts = self._artifact_chunks(
+                            artifacts, manifest
+                        )
 
-        # Store the serialized task in Redis using the task ID as the key
-        await self._redis.set(self._get_key(task.id), task_json, ex=self._ttl)
+                        pipe.multi()
+                        if stored_history > len(history):
+                            pipe.delete(history_key)
+                            stored_history = 0
+                        if stored_history < len(history):
+                            pipe.rpush(
+                                history_key,
+                                *[self._encode(m) for m in history[stored_history:]],
+                            )
+                        if replace_artifacts:
+                            pipe.delete(artifacts_key)
+                        if chunks:
+                            pipe.rpush(artifacts_key, *chunks)
+                        pipe.hset(
+                            meta_key,
+                            mapping={
+                                "task": self._encode(summary),
+                                "history": len(history),
+                                "artifacts": json.dumps(manifest),
+                            },
+                        )
+                        if self._ttl:
+                            for key in (meta_key, history_key, artifacts_key):
+                                pipe.expire(key, self._ttl)
+                        await pipe.execute()
+                        return
+                    except WatchError:
+                        continue
+
+    def _assemble_artifacts(self, chunks: list[bytes]) -> list[Artifact]:
+        artifacts: dict[str, dict] = {}
+        for chunk in chunks:
+            data = self._decode(chunk)
+            artifact = artifacts.get(data["artifactId"])
+            if artifact is None:
+                artifacts[data["artifactId"]] = data
+            else:
+                artifact["parts"].extend(data["parts"])
+        return [Artifact.model_validate(a) for a in artifacts.values()]
 
     async def get(self, task_id: str) -> Task | None:
         """Retrieves a task from the Redis store by ID.
@@ -62,16 +253,27 @@ class RedisTaskStore(TaskStore):
         Returns:
             The Task object if found, None otherwise
         """
-        # Get the serialized task from Redis
-        task_json = await self._redis.get(self._get_key(task_id))
-
-        if task_json is None:
-            return None
+        with get_metrics().time_state_store("redis", "get_task"):
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hget(self._get_meta_key(task_id), "task")
+                pipe.lrange(self._get_history_key(task_id), 0, -1)
+                pipe.lrange(self._get_artifacts_key(task_id), 0, -1)
+                pipe.get(self._get_key(task_id))
+                task_data, history, chunks, legacy_task = await pipe.execute()
 
-        # Deserialize the JSON string to a dictionary
-        task_dict = json.loads(task_json)
+        if task_data is None:
+            # Tasks saved before the split layout expire on their own
+            if legacy_task is None:
+                return None
+            return Task.model_validate(json.loads(legacy_task))
 
-        # Create and return a Task object from the dictionary
+        task_dict = self._decode(task_data)
+        if history:
+            task_dict["history"] = [
+                Message.model_validate(self._decode(message)) for message in history
+            ]
+        if chunks:
+            task_dict["artifacts"] = self._assemble_artifacts(chunks)
         return Task.model_validate(task_dict)
 
     async def delete(self, task_id: str):
@@ -80,5 +282,10 @@ class RedisTaskStore(TaskStore):
         Args:
             task_id: The ID of the task to delete
         """
-        # Delete the task from Redis
-        await self._redis.delete(self._get_key(task_id))
+        with get_metrics().time_state_store("redis", "delete_task"):
+            await self._redis.delete(
+                self._get_meta_key(task_id),
+                self._get_history_key(task_id),
+                self._get_artifacts_key(task_id),
+                self._get_key(task_id),
+            )
@@ -1,3 +1,5 @@
+import uuid
+
 from a2a.server.agent_execution import RequestContext
 from a2a.server.events import EventQueue
 from a2a.types import (
@@ -18,6 +20,7 @@ from a2a.utils import new_agent_text_message, new_data_artifact, new_text_artifa
 from sk_agents.a2a.response_classifier import (
     A2AResponseClassification,
     A2AResponseClassifier,
+    A2AResponseSignals,
     A2AResponseStatus,
 )
 from sk_agents.ska_types import (
@@ -25,10 +28,14 @@ from sk_agents.ska_types import (
     BaseMultiModalInput,
     ContentType,
     HistoryMultiModalMessage,
+    IntermediateTaskResponse,
     InvokeResponse,
     MultiModalItem,
+    PartialResponse,
+    TokenUsage,
 )
 from sk_agents.state.state_manager import StateManager
+from sk_agents.utils import listen_to_tool_calls
 
 
 class RequestProcessor:
@@ -39,12 +46,18 @@ class RequestProcessor:
         context: RequestContext,
         event_queue: EventQueue,
         state_manager: StateManager,
+        stream_output: bool = True,
     ):
         self.handler = handler
         self.response_classifier = response_classifier
         self.context = context
         self.event_queue = event_queue
         self.state_manager = state_manager
+        # Structured output is sent as data once validated, so it isn't streamed
+        self.stream_output = stream_output
+        self._streamed_artifact_id: str | None = None
+        # Tokens used so far, reported if the task is canceled midway
+        self._token_usage = TokenUsage(completion_tokens=0, prompt_tokens=0, total_tokens=0)
 
     @staticmethod
     def _part_to_multi_modal_item(part: Part) -> MultiModalItem:
@@ -80,23 +93,25 @@ class RequestProcessor:
             chat_history=all_messages,
         )
 
-        response: InvokeResponse = await self.handler.invoke(inputs=inputs.__dict__)
+        response = await self._stream_response(inputs)
         if await self.state_manager.is_canceled(self.context.task_id):
-            self._handle_canceled()
+            self.handle_canceled()
             return
         if not response.output_raw:
             raise ValueError("Unexpected empty response from handler.")
 
-        await self.state_manager.update_task_messages(
+        await self.state_manager.append_task_message(
             self.context.task_id,
             HistoryMultiModalMessage(
                 role="assistant",
                 items=[MultiModalItem(content_type=ContentType.TEXT, content=response.output_raw)],
             ),
         )
-        classification = await self.response_classifier.classify_response(response.output_raw)
+        classification = await self.response_classifier.classify_response(
+            response.output_raw, A2AResponseSignals.from_response(response)
+        )
         if await self.state_manager.is_canceled(self.context.task_id):
-            self._handle_canceled()
+            self.handle_canceled()
             return
 
         match classification.status:
@@ -111,13 +126,82 @@ class RequestProcessor:
             case _:
                 self._handle_task_unknown(response, classification)
 
+    async def _stream_response(self, inputs: BaseMultiModalInput) -> InvokeResponse:
+        """Streams the handler's output as chunks of a provisional artifact.
+
+        The artifact is only replaced by the final response once the response
+        is classified as completed. Returns the handler's final response once
+        the stream has ended.
+        """
+        response: InvokeResponse | None = None
+        with listen_to_tool_calls(self._on_tool_call):
+            async for content in self.handler.invoke_stream(inputs=inputs.__dict__):
+                if isinstance(content, PartialResponse):
+                    if content.output_partial and self.stream_output:
+                        self._send_artifact_chunk(content.output_partial)
+                elif isinstance(content, IntermediateTaskResponse):
+                    self._add_token_usage(content.response.token_usage)
+                    self._update_task_status(
+                        TaskState.working, status_message=f"Completed task {content.task_name}"
+                    )
+                elif isinstance(content, InvokeResponse):
+                    response = content
+                    self._token_usage = response.token_usage
+        if response is None:
+            raise ValueError("Handler stream ended without a final response.")
+        return response
+
+    def _add_token_usage(self, token_usage: TokenUsage) -> None:
+        self._token_usage = TokenUsage(
+            completion_tokens=self._token_usage.completion_tokens + token_usage.completion_tokens,
+            prompt_tokens=self._token_usage.prompt_tokens + token_usage.prompt_tokens,
+            total_tokens=self._token_usage.total_tokens + token_usage.total_tokens,
+        )
+
+    def _on_tool_call(self, plugin_name: str, function_name: str, finished: bool) -> None:
+        tool_name = f"{plugin_name}-{function_name}" if plugin_name else function_name
+        self._update_task_status(
+            TaskState.working,
+            status_message=f"Finished calling {tool_name}"
+            if finished
+            else f"Calling {tool_name}...",
+        )
+
+    def _send_artifact_chunk(
+        self, text: str, last_chunk: bool = False, metadata: dict | None = None
+    ) -> None:
+        append = self._streamed_artifact_id is not None
+        if not append:
+            self._streamed_artifact_id = str(uuid.uuid4())
+        self.event_queue.enqueue_event(
+            TaskArtifactUpdateEvent(
+                contextId=self.context.context_id,
+                taskId=self.context.task_id,
+                append=append,
+                lastChunk=last_chunk,
+                artifact=Artifact(
+                    artifactId=self._streamed_artifact_id,
+                    name="partial-response",
+                    description="The response as it is being generated",
+                    parts=[Part(root=TextPart(text=text))],
+                ),
+                metadata=metadata,
+            )
+        )
+
+    def _close_streamed_artifact(self, response: InvokeResponse) -> None:
+        if self._streamed_artifact_id is not None:
+            self._send_artifact_chunk("", last_chunk=True, metadata=response.token_usage.__dict__)
+
     @staticmethod
     def _build_text_artifact(response: InvokeResponse) -> Artifact:
         return new_text_artifact("final-response", response.output_raw, "The final response")
 
     @staticmethod
     def _build_data_artifact(response: InvokeResponse) -> Artifact:
-        return new_data_artifact("final-response", response.output_pydantic, "The final response")
+        return new_data_artifact(
+            "final-response", response.output_pydantic.model_dump(mode="json"), "The final response"
+        )
 
     @staticmethod
     def _build_appropriate_artifact(response: InvokeResponse) -> Artifact:
@@ -127,22 +211,27 @@ class RequestProcessor:
             return RequestProcessor._build_text_artifact(response)
 
     def _send_artifact(self, response: InvokeResponse) -> None:
+        artifact = self._build_appropriate_artifact(response)
+        if self._streamed_artifact_id is not None:
+            # Replaces the streamed chunks
+            artifact.artifactId = self._streamed_artifact_id
         self.event_queue.enqueue_event(
             TaskArtifactUpdateEvent(
                 contextId=self.context.context_id,
                 taskId=self.context.task_id,
                 append=False,
                 lastChunk=True,
-                artifact=self._build_appropriate_artifact(response),
+                artifact=artifact,
                 metadata=response.token_usage.__dict__,
             )
         )
 
-    def _handle_canceled(self) -> None:
+    def handle_canceled(self) -> None:
         self._update_task_status(
             TaskState.canceled,
             final=True,
             status_message="Task was cancelled by the user.",
+            metadata=self._token_usage.__dict__,
         )
 
     def _handle_task_completed(
@@ -158,6 +247,7 @@ class RequestProcessor:
     def _handle_task_input_required(
         self, response: InvokeResponse, classification: A2AResponseClassification
     ) -> None:
+        self._close_streamed_artifact(response)
         self._update_task_status(
             TaskState.input_required, final=True, status_message=response.output_raw
         )
@@ -165,6 +255,7 @@ class RequestProcessor:
     def _handle_task_auth_required(
         self, response: InvokeResponse, classification: A2AResponseClassification
     ) -> None:
+        self._close_streamed_artifact(response)
         status_message = ""
         if classification.message:
             status_message = f"{classification.message}\n\n"
@@ -176,6 +267,7 @@ class RequestProcessor:
     def _handle_task_failed(
         self, response: InvokeResponse, classification: A2AResponseClassification
     ) -> None:
+        self._close_streamed_artifact(response)
         status_message: str | None
         if classification.message:
             status_message = classification.message
@@ -187,6 +279,7 @@ class RequestProcessor:
     def _handle_task_unknown(
         self, response: InvokeResponse, classification: A2AResponseClassification
     ) -> None:
+        self._close_streamed_artifact(response)
         status_message: str | None
         if classification.message:
             status_message = classification.message
@@ -200,6 +293,7 @@ class RequestProcessor:
         state: TaskState,
         final: bool = False,
         status_message: str | None = None,
+        metadata: dict | None = None,
     ) -> None:
         self.event_queue.enqueue_event(
             TaskStatusUpdateEvent(
@@ -210,5 +304,6 @@ class RequestProcessor:
                     state=state,
                     message=(new_agent_text_message(status_message) if status_message else None),
                 ),
+                metadata=metadata,
             )
         )
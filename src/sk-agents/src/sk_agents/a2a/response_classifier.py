@@ -1,4 +1,7 @@
+import hashlib
 import json
+import re
+from collections import OrderedDict
 from enum import Enum
 
 from pydantic import ConfigDict
@@ -9,9 +12,14 @@ from semantic_kernel.kernel import Kernel
 from semantic_kernel.kernel_pydantic import KernelBaseModel
 from ska_utils import AppConfig
 
-from sk_agents.configs import TA_A2A_OUTPUT_CLASSIFIER_MODEL
+from sk_agents.configs import TA_A2A_CLASSIFIER_CACHE_SIZE, TA_A2A_OUTPUT_CLASSIFIER_MODEL
+from sk_agents.ska_types import InvokeResponse
 from sk_agents.skagents.chat_completion_builder import ChatCompletionBuilder
 
+# Extra data keys a plugin can set to report the status of the task directly
+A2A_STATUS_EXTRA_DATA_KEY = "a2a_status"
+A2A_MESSAGE_EXTRA_DATA_KEY = "a2a_message"
+
 
 class A2AResponseStatus(Enum):
     completed = "completed"
@@ -30,9 +38,83 @@ class A2AResponseClassification(KernelBaseModel):
     auth_details: ConcreteAuthDetails | None = None
 
 
+class A2AResponseSignals(KernelBaseModel):
+    """What the handler already knows about a response, before reading its text."""
+
+    structured_output: bool = False
+    status: A2AResponseStatus | None = None
+    message: str | None = None
+
+    @staticmethod
+    def from_response(response: InvokeResponse) -> "A2AResponseSignals":
+        signals = A2AResponseSignals(structured_output=response.output_pydantic is not None)
+        if response.extra_data:
+            for item in response.extra_data.items:
+                if item.key == A2A_STATUS_EXTRA_DATA_KEY:
+                    try:
+                        signals.status = A2AResponseStatus(item.value)
+                    except ValueError:
+                        pass
+                elif item.key == A2A_MESSAGE_EXTRA_DATA_KEY:
+                    signals.message = item.value
+        return signals
+
+
+# Weighted patterns for the statuses other than completed, matched case-insensitively
+_RULES: dict[A2AResponseStatus, list[tuple[re.Pattern[str], int]]] = {
+    A2AResponseStatus.auth_required: [
+        (re.compile(p, re.IGNORECASE), w)
+        for p, w in [
+            (r"\b(log|sign) ?in\b", 2),
+            (r"\bauthenticat(e|ion)\b", 2),
+            (r"\bunauthori[sz]ed\b", 2),
+            (r"\baccess denied\b", 2),
+            (r"\binvalid credentials\b", 2),
+            (r"\b(api key|bearer token|access token)\b", 1),
+            (r"\bpermissions?\b", 1),
+        ]
+    ],
+    A2AResponseStatus.input_required: [
+        (re.compile(p, re.IGNORECASE), w)
+        for p, w in [
+            (r"\bcould you (please )?(specify|provide|clarify|tell me|confirm)\b", 2),
+            (r"\bplease (specify|provide|clarify|confirm)\b", 2),
+            (r"\bwhich (one|option)\b.*\?", 2),
+            (r"\bdo you want (me )?to\b.*\?", 2),
+            (r"\bi need more information\b", 2),
+            (r"\?\s*$", 1),
+        ]
+    ],
+    A2AResponseStatus.failed: [
+        (re.compile(p, re.IGNORECASE), w)
+        for p, w in [
+            (r"\bi('m| am) sorry,? (but )?i (can't|cannot|am unable|was unable)\b", 2),
+            (r"\b(unable|not able) to (complete|process|fulfil|fulfill)\b", 2),
+            (r"\bcannot complete\b", 2),
+            (r"\bencountered an? (unexpected )?(error|problem)\b", 2),
+            (r"\berror code\b", 2),
+            (r"\bfailed to\b", 1),
+        ]
+    ],
+}
+
+# The rules only decide without the LLM when several strong patterns of one
+# status match, and its score clearly exceeds that of any other status.
+# Authentication is always left to the LLM, which extracts the auth details.
+_RULE_STATUSES = {A2AResponseStatus.input_required, A2AResponseStatus.failed}
+_STRONG_RULE_WEIGHT = 2
+_MIN_STRONG_RULE_MATCHES = 2
+_MIN_RULE_MARGIN = 2
+
+
 class A2AResponseClassifier:
     """
     A class to classify responses from the A2A agent.
+
+    Responses are classified by the cheapest tier able to decide: the signals
+    reported by the handler, then keyword rules for clear questions and
+    failures, and otherwise the classifier LLM, whose results are cached by
+    response hash.
     """
 
     NAME = "a2a-response-classifier"
@@ -216,31 +298,94 @@ class A2AResponseClassifier:
     )
 
     def __init__(self, app_config: AppConfig, chat_completion_builder: ChatCompletionBuilder):
+        self.agent = self._build_agent(app_config, chat_completion_builder)
+        self._cache_size = int(app_config.get(TA_A2A_CLASSIFIER_CACHE_SIZE.env_name) or 0)
+        self._cache: OrderedDict[str, A2AResponseClassification] = OrderedDict()
+
+    @classmethod
+    def _build_agent(
+        cls, app_config: AppConfig, chat_completion_builder: ChatCompletionBuilder
+    ) -> ChatCompletionAgent:
         model_name = app_config.get(TA_A2A_OUTPUT_CLASSIFIER_MODEL.env_name)
         chat_completion = chat_completion_builder.get_chat_completion_for_model(
-            service_id=self.NAME, model_name=model_name
+            service_id=cls.NAME, model_name=model_name
         )
         kernel = Kernel()
         kernel.add_service(chat_completion)
-        settings = kernel.get_prompt_execution_settings_from_service_id(self.NAME)
+        settings = kernel.get_prompt_execution_settings_from_service_id(cls.NAME)
         settings.response_format = A2AResponseClassification
-        self.agent = ChatCompletionAgent(
+        return ChatCompletionAgent(
             kernel=kernel,
-            name=self.NAME,
-            instructions=self.SYSTEM_PROMPT,
+            name=cls.NAME,
+            instructions=cls.SYSTEM_PROMPT,
             arguments=KernelArguments(settings=settings),
         )
 
-    async def classify_response(self, response: str) -> A2AResponseClassification:
+    async def classify_response(
+        self, response: str, signals: A2AResponseSignals | None = None
+    ) -> A2AResponseClassification:
         """
         Classify the response from the A2A agent.
 
         Args:
             response (str): The response from the A2A agent.
+            signals (A2AResponseSignals | None): What the handler reported about the response.
 
         Returns:
             str: The classification of the response.
         """
+        classification = self._classify_from_signals(signals) or self._classify_with_rules(response)
+        if classification:
+            return classification
+
+        key = hashlib.sha256(response.encode()).hexdigest()
+        cached = self._cache.get(key)
+        if cached:
+            self._cache.move_to_end(key)
+            return cached
+
+        classification = await self._classify_with_llm(response)
+        if self._cache_size > 0:
+            self._cache[key] = classification
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return classification
+
+    @staticmethod
+    def _classify_from_signals(
+        signals: A2AResponseSignals | None,
+    ) -> A2AResponseClassification | None:
+        if signals is None:
+            return None
+        if signals.status:
+            return A2AResponseClassification(status=signals.status, message=signals.message)
+        if signals.structured_output:
+            # The output was validated against the agent's output type
+            return A2AResponseClassification(status=A2AResponseStatus.completed)
+        return None
+
+    @staticmethod
+    def _classify_with_rules(response: str) -> A2AResponseClassification | None:
+        matches = {
+            status: [weight for pattern, weight in rules if pattern.search(response)]
+            for status, rules in _RULES.items()
+        }
+        scores = sorted(
+            ((sum(weights), status) for status, weights in matches.items()),
+            key=lambda score: score[0],
+            reverse=True,
+        )
+        (best_score, best), (runner_up_score, _) = scores[0], scores[1]
+        if (
+            best in _RULE_STATUSES
+            and sum(w >= _STRONG_RULE_WEIGHT for w in matches[best]) >= _MIN_STRONG_RULE_MATCHES
+            and best_score - runner_up_score >= _MIN_RULE_MARGIN
+        ):
+            return A2AResponseClassification(status=best)
+        # Answers without clear signals, weak or conflicting ones are left to the LLM
+        return None
+
+    async def _classify_with_llm(self, response: str) -> A2AResponseClassification:
         chat_history = ChatHistory()
         chat_history.add_user_message(f"Please classify the following response:\n\n{response}")
         async for content in self.agent.invoke(messages=chat_history):
@@ -16,6 +16,7 @@ from sk_agents.configs import (
     TA_AGENT_BASE_URL,
     TA_PROVIDER_ORG,
     TA_PROVIDER_URL,
+    TA_REDIS_COMPRESSION_THRESHOLD,
     TA_REDIS_DB,
     TA_REDIS_HOST,
     TA_REDIS_PORT,
@@ -113,10 +114,12 @@ class AppV2:
     @staticmethod
     def _get_redis_task_store(app_config: AppConfig) -> TaskStore:
         redis_ttl = app_config.get(TA_REDIS_TTL.env_name)
+        compression_threshold = app_config.get(TA_REDIS_COMPRESSION_THRESHOLD.env_name)
 
         return RedisTaskStore(
             redis_client=AppV2._get_redis_client(app_config),
             ttl=int(redis_ttl) if redis_ttl else None,
+            compression_threshold=int(compression_threshold) if compression_threshold else None,
         )
 
     @staticmethod
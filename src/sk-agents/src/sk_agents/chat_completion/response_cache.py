@@ -0,0 +1,299 @@
+import hashlib
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Callable
+from enum import Enum
+from typing import Any
+
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from semantic_kernel.connectors.ai.chat_completion_client_base import (
+    ChatCompletionClientBase,
+)
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents import ChatMessageContent, StreamingChatMessageContent
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.streaming_chat_message_content import STREAMING_CMC_ITEM_TYPES
+from ska_utils import AppConfig, get_metrics
+
+from sk_agents.configs import (
+    TA_LLM_CACHE_AGENTS,
+    TA_LLM_CACHE_BACKEND,
+    TA_LLM_CACHE_MAX_TEMPERATURE,
+    TA_LLM_CACHE_SIZE,
+    TA_LLM_CACHE_TTL,
+)
+
+logger = logging.getLogger(__name__)
+
+# The raw provider responses aren't serializable, and are what token usage is
+# read from, so cached responses report no usage
+_EXCLUDE_INNER_CONTENT = {"inner_content": True, "items": {"__all__": {"inner_content"}}}
+_streaming_items_adapter = TypeAdapter(list[STREAMING_CMC_ITEM_TYPES])
+
+
+class ResponseCache(ABC):
+    """Stores serialized chat completion responses by request key."""
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str) -> None:
+        pass
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Keeps the most recently used responses of this instance."""
+
+    def __init__(self, max_size: int = 1024, ttl: int | None = None):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+
+    async def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        expires_at = time.monotonic() + self._ttl if self._ttl else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+class RedisResponseCache(ResponseCache):
+    """Shares responses between instances through Redis."""
+
+    def __init__(self, redis_client: Redis, ttl: int | None = None, key_prefix: str = "llm:"):
+        self._redis = redis_client
+        self._ttl = ttl
+        self._key_prefix = key_prefix
+
+    async def get(self, key: str) -> str | None:
+        with get_metrics().time_state_store("redis", "get_llm_response"):
+            value = await self._redis.get(f"{self._key_prefix}{key}")
+        if value is None:
+            return None
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def set(self, key: str, value: str) -> None:
+        with get_metrics().time_state_store("redis", "set_llm_response"):
+            await self._redis.set(f"{self._key_prefix}{key}", value, ex=self._ttl)
+
+
+def _get_temperature(settings: PromptExecutionSettings) -> float | None:
+    temperature = getattr(settings, "temperature", None)
+    if temperature is None and settings.extension_data:
+        temperature = settings.extension_data.get("temperature")
+    return float(temperature) if temperature is not None else None
+
+
+def _dump_streaming(message: StreamingChatMessageContent) -> dict[str, Any]:
+    return message.model_dump(mode="json", exclude=_EXCLUDE_INNER_CONTENT)
+
+
+def _load_streaming(
+    data: dict[str, Any], function_invoke_attempt: int
+) -> StreamingChatMessageContent:
+    # Streaming text items don't serialize the choice they belong to
+    items = [{"choice_index": data["choice_index"], **item} for item in data["items"]]
+    return StreamingChatMessageContent(
+        role=data["role"],
+        choice_index=data["choice_index"],
+        items=_streaming_items_adapter.validate_python(items),
+        name=data["name"],
+        encoding=data["encoding"],
+        finish_reason=data["finish_reason"],
+        ai_model_id=data["ai_model_id"],
+        metadata=data["metadata"],
+        function_invoke_attempt=function_invoke_attempt,
+    )
+
+
+class CachingChatCompletion(ChatCompletionClientBase):
+    """Answers repeated chat completion requests from a cache.
+
+    Requests are keyed on the model, the chat history as sent to it, and the
+    execution settings, which include the tools offered. Only the requests to
+    the model are cached: function calls it returns are still invoked, so
+    responses depending on tool results are looked up again with them.
+    Streamed responses are stored once complete and replayed chunk by chunk.
+    """
+
+    inner: ChatCompletionClientBase
+    cache: ResponseCache
+    max_temperature: float = 0.0
+
+    @property
+    def SUPPORTS_FUNCTION_CALLING(self) -> bool:  # noqa: N802
+        return self.inner.SUPPORTS_FUNCTION_CALLING
+
+    def get_prompt_execution_settings_class(self) -> type[PromptExecutionSettings]:
+        return self.inner.get_prompt_execution_settings_class()
+
+    def service_url(self) -> str | None:
+        return self.inner.service_url()
+
+    def _prepare_chat_history_for_request(self, chat_history: ChatHistory, *args, **kwargs) -> Any:
+        return self.inner._prepare_chat_history_for_request(chat_history, *args, **kwargs)
+
+    def _verify_function_choice_settings(self, settings: PromptExecutionSettings) -> None:
+        self.inner._verify_function_choice_settings(settings)
+
+    def _update_function_choice_settings_callback(self) -> Callable[..., None]:
+        return self.inner._update_function_choice_settings_callback()
+
+    def _reset_function_choice_settings(self, settings: PromptExecutionSettings) -> None:
+        self.inner._reset_function_choice_settings(settings)
+
+    def _get_cache_key(
+        self, kind: str, chat_history: ChatHistory, settings: PromptExecutionSettings
+    ) -> str | None:
+        temperature = _get_temperature(settings)
+        if temperature is None or temperature > self.max_temperature:
+            return None
+        try:
+            request = {
+                "kind": kind,
+                "model": self.inner._get_ai_model_id(settings),
+                "messages": self.inner._prepare_chat_history_for_request(chat_history),
+                "settings": settings.model_dump(exclude_none=True),
+            }
+            serialized = json.dumps(request, default=str, sort_keys=True)
+        except Exception as e:
+            logger.warning(f"Could not compute LLM cache key for {self.service_id} - {e}")
+            return None
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    async def _cache_get(self, key: str) -> str | None:
+        try:
+            return await self.cache.get(key)
+        except Exception as e:
+            logger.warning(f"Could not read from LLM cache - {e}")
+            return None
+
+    async def _cache_set(self, key: str, value: str) -> None:
+        try:
+            await self.cache.set(key, value)
+        except Exception as e:
+            logger.warning(f"Could not write to LLM cache - {e}")
+
+    async def _inner_get_chat_message_contents(
+        self, chat_history: ChatHistory, settings: PromptExecutionSettings
+    ) -> list[ChatMessageContent]:
+        key = self._get_cache_key("chat", chat_history, settings)
+        if key is None:
+            return await self.inner._inner_get_chat_message_contents(chat_history, settings)
+
+        cached = await self._cache_get(key)
+        if cached is not None:
+            logger.debug(f"LLM cache hit for {self.service_id}")
+            return [ChatMessageContent.model_validate(message) for message in json.loads(cached)]
+
+        messages = await self.inner._inner_get_chat_message_contents(chat_history, settings)
+        value = json.dumps(
+            [m.model_dump(mode="json", exclude=_EXCLUDE_INNER_CONTENT) for m in messages]
+        )
+        await self._cache_set(key, value)
+        return messages
+
+    async def _inner_get_streaming_chat_message_contents(
+        self,
+        chat_history: ChatHistory,
+        settings: PromptExecutionSettings,
+        function_invoke_attempt: int = 0,
+    ) -> AsyncGenerator[list[StreamingChatMessageContent], Any]:
+        key = self._get_cache_key("stream", chat_history, settings)
+        if key is None:
+            async for messages in self.inner._inner_get_streaming_chat_message_contents(
+                chat_history, settings, function_invoke_attempt
+            ):
+                yield messages
+            return
+
+        cached = await self._cache_get(key)
+        if cached is not None:
+            logger.debug(f"LLM cache hit for {self.service_id}")
+            for chunk in json.loads(cached):
+                yield [_load_streaming(message, function_invoke_attempt) for message in chunk]
+            return
+
+        chunks: list[list[dict[str, Any]]] = []
+        async for messages in self.inner._inner_get_streaming_chat_message_contents(
+            chat_history, settings, function_invoke_attempt
+        ):
+            chunks.append([_dump_streaming(message) for message in messages])
+            yield messages
+        # Only complete responses are stored
+        await self._cache_set(key, json.dumps(chunks))
+
+
+class ResponseCacheBackends(Enum):
+    IN_MEMORY = "in-memory"
+    REDIS = "redis"
+
+
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache(app_config: AppConfig) -> ResponseCache | None:
+    """Gets the cache configured for LLM responses, if any.
+
+    The cache is shared by all the chat completion clients of the process.
+    """
+    global _response_cache
+    backend = app_config.get(TA_LLM_CACHE_BACKEND.env_name)
+    if not backend:
+        return None
+    if _response_cache is None:
+        ttl = app_config.get(TA_LLM_CACHE_TTL.env_name)
+        ttl = int(ttl) if ttl else None
+        match backend:
+            case ResponseCacheBackends.IN_MEMORY.value:
+                _response_cache = InMemoryResponseCache(
+                    max_size=int(app_config.get(TA_LLM_CACHE_SIZE.env_name)), ttl=ttl
+                )
+            case ResponseCacheBackends.REDIS.value:
+                # Imported here as the app imports the chat completion builders
+                from sk_agents.appv2 import AppV2
+
+                _response_cache = RedisResponseCache(AppV2._get_redis_client(app_config), ttl=ttl)
+            case _:
+                raise ValueError(f"Unknown LLM cache backend: {backend}")
+    return _response_cache
+
+
+def with_response_cache(
+    chat_completion: ChatCompletionClientBase, app_config: AppConfig
+) -> ChatCompletionClientBase:
+    """Wraps a chat completion client with the configured response cache.
+
+    The client is returned as is when no cache is configured, or when its
+    service, which is named after the agent, isn't one the cache is enabled for.
+    """
+    cache = get_response_cache(app_config)
+    if cache is None:
+        return chat_completion
+    agents = app_config.get(TA_LLM_CACHE_AGENTS.env_name)
+    if agents and chat_completion.service_id not in {a.strip() for a in agents.split(",")}:
+        return chat_completion
+    return CachingChatCompletion(
+        service_id=chat_completion.service_id,
+        ai_model_id=chat_completion.ai_model_id,
+        inner=chat_completion,
+        cache=cache,
+        max_temperature=float(app_config.get(TA_LLM_CACHE_MAX_TEMPERATURE.env_name)),
+    )
@@ -41,6 +41,11 @@ TA_A2A_OUTPUT_CLASSIFIER_MODEL = Config(
     is_required=False,
     default_value="gpt-4o-mini",
 )
+TA_A2A_CLASSIFIER_CACHE_SIZE = Config(
+    env_name="TA_A2A_CLASSIFIER_CACHE_SIZE",
+    is_required=False,
+    default_value="1024",
+)
 TA_STATE_MANAGEMENT = Config(
     env_name="TA_STATE_MANAGEMENT",
     is_required=True,
@@ -64,6 +69,19 @@ TA_REDIS_DB = Config(env_name="TA_REDIS_DB", is_required=False, default_value=No
 TA_REDIS_TTL = Config(env_name="TA_REDIS_TTL", is_required=False, default_value=None)
 TA_REDIS_SSL = Config(env_name="TA_REDIS_SSL", is_required=False, default_value="true")
 TA_REDIS_PWD = Config(env_name="TA_REDIS_PWD", is_required=False, default_value=None)
+TA_REDIS_COMPRESSION_THRESHOLD = Config(
+    env_name="TA_REDIS_COMPRESSION_THRESHOLD", is_required=False, default_value=None
+)
+
+TA_LLM_CACHE_BACKEND = Config(
+    env_name="TA_LLM_CACHE_BACKEND", is_required=False, default_value=None
+)
+TA_LLM_CACHE_TTL = Config(env_name="TA_LLM_CACHE_TTL", is_required=False, default_value="3600")
+TA_LLM_CACHE_SIZE = Config(env_name="TA_LLM_CACHE_SIZE", is_required=False, default_value="1024")
+TA_LLM_CACHE_AGENTS = Config(env_name="TA_LLM_CACHE_AGENTS", is_required=False, default_value=None)
+TA_LLM_CACHE_MAX_TEMPERATURE = Config(
+    env_name="TA_LLM_CACHE_MAX_TEMPERATURE", is_required=False, default_value="0"
+)
 
 TA_PERSISTENCE_MODULE = Config(
     env_name="TA_PERSISTENCE_MODULE",
@@ -90,6 +108,7 @@ configs: list[Config] = [
     TA_PROVIDER_ORG,
     TA_PROVIDER_URL,
     TA_A2A_OUTPUT_CLASSIFIER_MODEL,
+    TA_A2A_CLASSIFIER_CACHE_SIZE,
     TA_STATE_MANAGEMENT,
     TA_REDIS_HOST,
     TA_REDIS_PORT,
@@ -97,6 +116,12 @@ configs: list[Config] = [
     TA_REDIS_TTL,
     TA_REDIS_SSL,
     TA_REDIS_PWD,
+    TA_REDIS_COMPRESSION_THRESHOLD,
+    TA_LLM_CACHE_BACKEND,
+    TA_LLM_CACHE_TTL,
+    TA_LLM_CACHE_SIZE,
+    TA_LLM_CACHE_AGENTS,
+    TA_LLM_CACHE_MAX_TEMPERATURE,
     TA_PERSISTENCE_MODULE,
     TA_PERSISTENCE_CLASS,
     TA_AUTHORIZER_CLASS,
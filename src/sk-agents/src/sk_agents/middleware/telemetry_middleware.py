@@ -1,30 +1,80 @@
+import time
 from contextlib import nullcontext
 
-from fastapi import FastAPI, Request, Response
 from opentelemetry.propagate import extract
-from ska_utils import Telemetry
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from ska_utils import UNMATCHED_ROUTE, Telemetry
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class TelemetryMiddleware(BaseHTTPMiddleware):
+class TelemetryMiddleware:
+    """Traces HTTP requests as a pure ASGI middleware.
+
+    Unlike a ``BaseHTTPMiddleware`` the response is passed through untouched,
+    so streamed (SSE) responses aren't buffered and the request's span stays
+    open until the last body chunk has been sent. Time to first byte and total
+    response duration are recorded as span attributes and metrics, the latter
+    labelled with the matched route template to keep their cardinality bounded.
+    """
+
     _telemetry_excluded_path_suffixes: list[str] = ["/openapi.json"]
 
-    def __init__(self, app: FastAPI, st: Telemetry):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, st: Telemetry):
+        self.app = app
         self.st = st
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        context = extract(request.headers)
+    @staticmethod
+    def _route(scope: Scope) -> str:
+        # The router sets the matched route on the scope, whose path is the
+        # template (e.g. ``/{instance_id}``) rather than the requested path
+        route = scope.get("route")
+        return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path: str = scope["path"]
+        start = time.perf_counter()
+        first_byte: float | None = None
+        status_code: int | None = None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal first_byte, status_code
+            if message["type"] == "http.response.start":
+                first_byte = time.perf_counter()
+                status_code = message["status"]
+            await send(message)
+
         with (
-            self.st.tracer.start_as_current_span(
-                f"{request.method} {request.url.path}", context=context
-            )
-            if self.st.telemetry_enabled()
-            and not any(
-                request.url.path.endswith(suffix)
-                for suffix in self._telemetry_excluded_path_suffixes
-            )
-            else nullcontext()
+            (
+                self.st.tracer.start_as_current_span(
+                    f"{scope['method']} {path}", context=extract(Headers(scope=scope))
+                )
+                if self.st.telemetry_enabled()
+                and not any(
+                    path.endswith(suffix) for suffix in self._telemetry_excluded_path_suffixes
+                )
+                else nullcontext()
+            ) as span,
+            self.st.metrics.track_in_flight(),
         ):
-            response = await call_next(request)
-        return response
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                end = time.perf_counter()
+                time_to_first_byte_ms = None if first_byte is None else (first_byte - start) * 1000
+                duration_ms = (end - start) * 1000
+                route = self._route(scope)
+                self.st.metrics.record_http_response(
+                    route, status_code, time_to_first_byte_ms, duration_ms
+                )
+                if span is not None:
+                    if route != UNMATCHED_ROUTE:
+                        span.update_name(f"{scope['method']} {route}")
+                    if status_code is not None:
+                        span.set_attribute("http.status_code", status_code)
+                    if time_to_first_byte_ms is not None:
+                        span.set_attribute("http.time_to_first_byte_ms", time_to_first_byte_ms)
+                    span.set_attribute("http.duration_ms", duration_ms)
@@ -65,6 +65,7 @@ class SseEventType(Enum):
     INTERMEDIATE_TASK_RESPONSE = "intermediate-task-response"
     PARTIAL_RESPONSE = "partial-response"
     FINAL_RESPONSE = "final-response"
+    EXTRA_DATA = "extra-data"
     UNKNOWN = "unknown"
 
 
@@ -1,5 +1,6 @@
 import logging
 
+from semantic_kernel.filters import FilterTypes
 from semantic_kernel.kernel import Kernel
 from ska_utils import AppConfig
 
@@ -8,6 +9,7 @@ from sk_agents.plugin_loader import get_plugin_loader
 from sk_agents.ska_types import ModelType
 from sk_agents.skagents.chat_completion_builder import ChatCompletionBuilder
 from sk_agents.skagents.remote_plugin_loader import RemotePluginLoader
+from sk_agents.utils import tool_call_filter
 
 
 class KernelBuilder:
@@ -60,6 +62,7 @@ class KernelBuilder:
 
             kernel = Kernel()
             kernel.add_service(chat_completion)
+            kernel.add_filter(FilterTypes.FUNCTION_INVOCATION, tool_call_filter)
 
             return kernel
         except Exception as e:
@@ -7,9 +7,9 @@ from typing import Any
 from semantic_kernel.contents import ChatMessageContent, TextContent
 from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.contents.utils.author_role import AuthorRole
-from ska_utils import get_telemetry
+from ska_utils import get_metrics, get_telemetry
 
-from sk_agents.extra_data_collector import ExtraDataCollector, ExtraDataPartial
+from sk_agents.extra_data_collector import ExtraDataCollector
 from sk_agents.ska_types import (
     BaseConfig,
     BaseHandler,
@@ -102,20 +102,16 @@ class ChatAgents(BaseHandler):
                 completion_tokens += call_usage.completion_tokens
                 prompt_tokens += call_usage.prompt_tokens
                 total_tokens += call_usage.total_tokens
-                try:
-                    # Attempt to parse as ExtraDataPartial
-                    extra_data_partial: ExtraDataPartial = ExtraDataPartial.new_from_json(content)
-                    extra_data_collector.add_extra_data_items(extra_data_partial.extra_data)
-                except Exception:
-                    if len(content) > 0:
-                        # Handle and return partial response
-                        final_response.append(content)
-                        yield PartialResponse(
-                            session_id=session_id,
-                            source=f"{self.name}:{self.version}",
-                            request_id=request_id,
-                            output_partial=content,
-                        )
+                # Extra data is added to the collector by plugins, not streamed
+                if len(content) > 0:
+                    # Handle and return partial response
+                    final_response.append(content)
+                    yield PartialResponse(
+                        session_id=session_id,
+                        source=f"{self.name}:{self.version}",
+                        request_id=request_id,
+                        output_partial=content,
+                    )
             # Build the final response with InvokeResponse
             stream_span.set_attribute("completion_tokens", completion_tokens)
             stream_span.set_attribute("prompt_tokens", prompt_tokens)
@@ -124,6 +120,14 @@ class ChatAgents(BaseHandler):
                 "agent_time_to_first_token",
                 attributes={"first_token_time_ms": titme_to_first_token_ms},
             )
+            metrics = get_metrics()
+            metrics.record_time_to_first_token(agent.model_name, titme_to_first_token_ms)
+            metrics.record_llm_call(
+                agent.model_name,
+                (time.time() - start_time) * 1000,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+            )
             final_response = "".join(final_response)
             response = InvokeResponse(
                 session_id=session_id,
@@ -183,6 +187,12 @@ class ChatAgents(BaseHandler):
                 "agent_response_time_ms",
                 attributes={"response_time_ms": titme_to_first_token_ms},
             )
+            get_metrics().record_llm_call(
+                agent.model_name,
+                (time.time() - start_time) * 1000,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+            )
             return InvokeResponse(
                 session_id=session_id,
                 source=f"{self.name}:{self.version}",
@@ -10,11 +10,14 @@ class TaskConfig(BaseModel):
     description: str
     instructions: str
     agent: str
+    # Tasks this task needs the output of; if unset, all previous tasks
+    depends_on: list[str] | None = None
 
 
 class Spec(BaseModel):
     agents: list[AgentConfig]
     tasks: list[TaskConfig]
+    max_concurrent_tasks: int = 4
 
 
 class V1Config(BaseConfig):
@@ -1,5 +1,9 @@
+import ast
 import json
+import re
+from collections.abc import Iterator
 
+from pydantic import BaseModel, ValidationError
 from semantic_kernel.agents import ChatCompletionAgent
 from semantic_kernel.connectors.ai.function_choice_behavior import (
     FunctionChoiceBehavior,
@@ -13,6 +17,10 @@ from sk_agents.ska_types import InvokeResponse, TokenUsage
 from sk_agents.skagents.kernel_builder import KernelBuilder
 from sk_agents.type_loader import get_type_loader
 
+_FENCED_BLOCK = re.compile(r"```(?:json|JSON)?\s*\n?(.*?)```", re.DOTALL)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+_SMART_QUOTES = str.maketrans({"\u201c": '"', "\u201d": '"', "\u2018": "'", "\u2019": "'"})
+
 
 class OutputTransformer:
     NAME = "structured-output"
@@ -23,10 +31,73 @@ class OutputTransformer:
     def __init__(self, kernel_builder: KernelBuilder):
         self.kernel_builder = kernel_builder
 
+    @staticmethod
+    def _candidates(output: str) -> Iterator[str]:
+        """Yields the pieces of the output which could be the JSON of the structured output."""
+        yield output.strip()
+        for block in _FENCED_BLOCK.findall(output):
+            yield block.strip()
+        # Objects surrounded by other text, starting with the last one
+        objects = []
+        decoder = json.JSONDecoder()
+        start = output.find("{")
+        while start != -1:
+            try:
+                _, end = decoder.raw_decode(output, start)
+            except json.JSONDecodeError:
+                end = start + 1
+            else:
+                objects.append(output[start:end])
+            start = output.find("{", end)
+        yield from reversed(objects)
+
+    @staticmethod
+    def _load(candidate: str):
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            pass
+        # Repairs defects models commonly produce
+        repaired = _TRAILING_COMMA.sub(r"\1", candidate.translate(_SMART_QUOTES))
+        try:
+            return json.loads(repaired)
+        except json.JSONDecodeError:
+            pass
+        try:
+            # Single quotes, and Python's True, False and None
+            return ast.literal_eval(repaired)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            return None
+
+    @staticmethod
+    def parse_output(output: str, output_type: type[BaseModel]) -> BaseModel | None:
+        """Gets the structured output from output already holding it as JSON.
+
+        Returns:
+            The structured output, or None if it couldn't be found in the output
+        """
+        for candidate in OutputTransformer._candidates(output):
+            data = OutputTransformer._load(candidate)
+            if not isinstance(data, dict):
+                continue
+            try:
+                return output_type.model_validate(data)
+            except ValidationError:
+                continue
+        return None
+
     async def transform_output(self, output: str, output_type_str: str) -> InvokeResponse:
         type_loader = get_type_loader()
         output_type = type_loader.get_type(output_type_str)
 
+        output_pydantic = OutputTransformer.parse_output(output, output_type)
+        if output_pydantic is not None:
+            return InvokeResponse(
+                token_usage=TokenUsage(completion_tokens=0, prompt_tokens=0, total_tokens=0),
+                output_raw=output,
+                output_pydantic=output_pydantic,
+            )
+
         app_config = AppConfig()
         structured_output_model = app_config.get(TA_STRUCTURED_OUTPUT_TRANSFORMER_MODEL.env_name)
 
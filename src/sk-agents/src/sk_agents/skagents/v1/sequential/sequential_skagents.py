@@ -1,10 +1,8 @@
-import json
 import logging
 import time
 import uuid
 from collections.abc import AsyncIterable
 from contextlib import nullcontext
-from copy import deepcopy
 from typing import Any
 
 from semantic_kernel.contents.chat_history import ChatHistory
@@ -24,6 +22,7 @@ from sk_agents.skagents.kernel_builder import KernelBuilder
 from sk_agents.skagents.v1.sequential.config import Config
 from sk_agents.skagents.v1.sequential.output_transformer import OutputTransformer
 from sk_agents.skagents.v1.sequential.task_builder import TaskBuilder
+from sk_agents.skagents.v1.sequential.task_graph import TaskGraphRun, get_task_dependencies
 from sk_agents.skagents.v1.utils import get_token_usage_for_response, parse_chat_history
 from sk_agents.type_loader import get_type_loader
 
@@ -66,15 +65,18 @@ class SequentialSkagents(BaseHandler):
                 self.config.config.output_type,
             )
         )
+        self.dependencies = get_task_dependencies(sorted_configs)
+        self.max_concurrent_tasks = self.config.config.spec.max_concurrent_tasks
 
     async def _transform_output_if_required(self, response: InvokeResponse) -> InvokeResponse:
         if self.tasks[-1].agent.so_supported():
             type_loader = get_type_loader()
             output_type = type_loader.get_type(self.config.config.output_type)
-            response.output_pydantic = output_type(**json.loads(response.output_raw))
-            return response
-        else:
-            return await self._transform_output(response, self.config.config.output_type)
+            output_pydantic = OutputTransformer.parse_output(response.output_raw, output_type)
+            if output_pydantic is not None:
+                response.output_pydantic = output_pydantic
+                return response
+        return await self._transform_output(response, self.config.config.output_type)
 
     async def _transform_output(
         self, current_response: InvokeResponse, output_type_str: str
@@ -107,16 +109,17 @@ class SequentialSkagents(BaseHandler):
         inputs: dict[str, Any] | None = None,
     ) -> dict[str, Any] | None:
         if inputs is not None:
-            task_inputs = deepcopy(inputs)
-            if "chat_history" in task_inputs:
-                del task_inputs["chat_history"]
+            # Each task gets its own copy of the inputs, so they're not deep copied
+            task_inputs = {k: v for k, v in inputs.items() if k != "chat_history"}
         else:
             task_inputs = None
         return task_inputs
 
     async def invoke_stream(
         self, inputs: dict[str, Any] | None = None
-    ) -> AsyncIterable[PartialResponse | IntermediateTaskResponse | InvokeResponse]:
+    ) -> AsyncIterable[
+        PartialResponse | IntermediateTaskResponse | ExtraDataPartial | InvokeResponse
+    ]:
         collector = ExtraDataCollector()
         jt = get_telemetry()
         # Initialize tasks count and token metrics
@@ -142,47 +145,54 @@ class SequentialSkagents(BaseHandler):
             if jt.telemetry_enabled()
             else nullcontext()
         ) as stream_span:
-            # Process and stream back intermediate tasks results
-            for task in self.tasks[:-1]:
-                try:
-                    first_token_received = False
-                    start_time = time.time()
-                    i_response: InvokeResponse = await task.invoke(
-                        history=chat_history, inputs=task_inputs
-                    )
-                    if not first_token_received:
-                        first_token_time = time.time()
-                        ttft_ms = (first_token_time - start_time) * 1000
+            # Process and stream back intermediate tasks results, in order
+            run = TaskGraphRun(
+                self.tasks,
+                self.dependencies,
+                chat_history,
+                task_inputs,
+                self.max_concurrent_tasks,
+            )
+            run.start(len(self.tasks) - 1)
+            try:
+                for index, task in enumerate(self.tasks[:-1]):
+                    try:
+                        i_response, ttft_ms = await run.result(index)
                         average_ttft_ms.append(ttft_ms)
-                        first_token_received = True
-                    i_response.session_id = session_id
-                    i_response.source = f"{self.name}:{self.version}"
-                    i_response.request_id = request_id
+                        i_response.session_id = session_id
+                        i_response.source = f"{self.name}:{self.version}"
+                        i_response.request_id = request_id
 
-                    task_inputs[f"_{task.name}"] = i_response.output_raw
-                    completion_tokens += i_response.token_usage.completion_tokens
-                    prompt_tokens += i_response.token_usage.prompt_tokens
-                    total_tokens += i_response.token_usage.total_tokens
-                    collector.add_extra_data_items(i_response.extra_data)
-                    task_no += 1
-                    yield IntermediateTaskResponse(
-                        task_no=task_no,
-                        task_name=task.name,
-                        response=i_response,
-                    )
-                except Exception as e:
-                    raise AgentInvokeException(
-                        f"Error invoking {self.name}:{self.version} "
-                        f"for Session-id {session_id}, Request-id {request_id}, "
-                        f"Task description {task.description}. Error: {str(e)}"
-                    ) from e
+                        completion_tokens += i_response.token_usage.completion_tokens
+                        prompt_tokens += i_response.token_usage.prompt_tokens
+                        total_tokens += i_response.token_usage.total_tokens
+                        collector.add_extra_data_items(i_response.extra_data)
+                        task_no += 1
+                        yield IntermediateTaskResponse(
+                            task_no=task_no,
+                            task_name=task.name,
+                            response=i_response,
+                        )
+                    except Exception as e:
+                        raise AgentInvokeException(
+                            f"Error invoking {self.name}:{self.version} "
+                            f"for Session-id {session_id}, Request-id {request_id}, "
+                            f"Task description {task.description}. Error: {str(e)}"
+                        ) from e
+            finally:
+                run.cancel()
 
             # Process and stream back final task results
             first_token_received = False
             start_time = time.time()
+            final_history, final_inputs = run.get_task_view(len(self.tasks) - 1)
             async for chunk in self.tasks[-1].invoke_stream(
-                history=chat_history, inputs=task_inputs
+                history=final_history, inputs=final_inputs
             ):
+                if isinstance(chunk, ExtraDataPartial):
+                    collector.add_extra_data_items(chunk.extra_data)
+                    yield chunk
+                    continue
                 if not first_token_received:
                     first_token_time = time.time()
                     ttft_ms = (first_token_time - start_time) * 1000
@@ -197,19 +207,14 @@ class SequentialSkagents(BaseHandler):
                 completion_tokens += call_usage.completion_tokens
                 prompt_tokens += call_usage.prompt_tokens
                 total_tokens += call_usage.total_tokens
-                try:
-                    # Attempt to parse as ExtraDataPartial
-                    extra_data_partial: ExtraDataPartial = ExtraDataPartial.new_from_json(content)
-                    collector.add_extra_data_items(extra_data_partial.extra_data)
-                except Exception:
-                    # Handle and return partial response
-                    final_response.append(content)
-                    yield PartialResponse(
-                        session_id=session_id,
-                        source=f"{self.name}:{self.version}",
-                        request_id=request_id,
-                        output_partial=content,
-                    )
+                # Handle and return partial response
+                final_response.append(content)
+                yield PartialResponse(
+                    session_id=session_id,
+                    source=f"{self.name}:{self.version}",
+                    request_id=request_id,
+                    output_partial=content,
+                )
             stream_span.set_attribute("completion_tokens", completion_tokens)
             stream_span.set_attribute("prompt_tokens", prompt_tokens)
             stream_span.set_attribute("total_tokens", total_tokens)
@@ -268,25 +273,32 @@ class SequentialSkagents(BaseHandler):
             else nullcontext()
         ) as invoke_span:
             average_ttft_ms = []
-            for task in self.tasks:
-                try:
-                    start_time = time.time()
-                    i_response = await task.invoke(history=chat_history, inputs=task_inputs)
-                    response_time = time.time()
-                    ttft_ms = (response_time - start_time) * 1000
-                    average_ttft_ms.append(ttft_ms)
-                    task_inputs[f"_{task.name}"] = i_response.output_raw
-                    completion_tokens += i_response.token_usage.completion_tokens
-                    prompt_tokens += i_response.token_usage.prompt_tokens
-                    total_tokens += i_response.token_usage.total_tokens
-                    collector.add_extra_data_items(i_response.extra_data)
-                    task_no += 1
-                except Exception as e:
-                    raise AgentInvokeException(
-                        f"Error invoking {self.name}:{self.version} "
-                        f"for Session-id {session_id}, Request-id {request_id}, "
-                        f"Task description {task.description}. Error: {str(e)}"
-                    ) from e
+            run = TaskGraphRun(
+                self.tasks,
+                self.dependencies,
+                chat_history,
+                task_inputs,
+                self.max_concurrent_tasks,
+            )
+            run.start(len(self.tasks))
+            try:
+                for index, task in enumerate(self.tasks):
+                    try:
+                        i_response, ttft_ms = await run.result(index)
+                        average_ttft_ms.append(ttft_ms)
+                        completion_tokens += i_response.token_usage.completion_tokens
+                        prompt_tokens += i_response.token_usage.prompt_tokens
+                        total_tokens += i_response.token_usage.total_tokens
+                        collector.add_extra_data_items(i_response.extra_data)
+                        task_no += 1
+                    except Exception as e:
+                        raise AgentInvokeException(
+                            f"Error invoking {self.name}:{self.version} "
+                            f"for Session-id {session_id}, Request-id {request_id}, "
+                            f"Task description {task.description}. Error: {str(e)}"
+                        ) from e
+            finally:
+                run.cancel()
             invoke_span.set_attribute("completion_tokens", completion_tokens)
             invoke_span.set_attribute("prompt_tokens", prompt_tokens)
             invoke_span.set_attribute("total_tokens", total_tokens)
@@ -301,7 +313,7 @@ class SequentialSkagents(BaseHandler):
                 f"{self.name}:{self.version} responded with {total_tokens} tokens. "
                 f"Session-id {session_id}, Request-id {request_id}"
             )
-            last_message = chat_history.messages[-1].content
+            last_message = run.histories[len(self.tasks) - 1].messages[-1].content
             response = InvokeResponse(
                 session_id=session_id,
                 source=f"{self.name}:{self.version}",
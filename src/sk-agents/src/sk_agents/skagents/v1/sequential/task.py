@@ -1,3 +1,4 @@
+import time
 from collections.abc import AsyncIterable
 from typing import Any
 
@@ -13,6 +14,7 @@ from semantic_kernel.contents.streaming_chat_message_content import (
     StreamingChatMessageContent,
 )
 from semantic_kernel.kernel_pydantic import KernelBaseModel
+from ska_utils import get_metrics
 
 from sk_agents.extra_data_collector import ExtraDataCollector, ExtraDataPartial
 from sk_agents.ska_types import EmbeddedImage, InvokeResponse, TokenUsage
@@ -82,17 +84,20 @@ class Task:
         self,
         history: ChatHistory,
         inputs: dict[str, Any] | None = None,
-    ) -> AsyncIterable[StreamingChatMessageContent | str]:
+    ) -> AsyncIterable[StreamingChatMessageContent | ExtraDataPartial]:
         message = self._get_message(inputs)
         history.add_message(message)
         contents = []
+        start = time.perf_counter()
         async for content in self.agent.invoke_stream(history):
+            if not contents:
+                get_metrics().record_time_to_first_token(
+                    self.agent.model_name, (time.perf_counter() - start) * 1000
+                )
             contents.append(content)
             yield content
         if not self.extra_data_collector.is_empty():
-            yield ExtraDataPartial(
-                extra_data=self.extra_data_collector.get_extra_data()
-            ).model_dump_json()
+            yield ExtraDataPartial(extra_data=self.extra_data_collector.get_extra_data())
         message_content = "".join([content.content for content in contents])
         history.add_assistant_message(message_content)
 
@@ -107,6 +112,7 @@ class Task:
         completion_tokens: int = 0
         prompt_tokens: int = 0
         total_tokens: int = 0
+        start = time.perf_counter()
         async for content in self.agent.invoke(history):
             response_content.append(content)
             history.add_message(content)
@@ -114,6 +120,12 @@ class Task:
             completion_tokens += call_usage.completion_tokens
             prompt_tokens += call_usage.prompt_tokens
             total_tokens += call_usage.total_tokens
+        get_metrics().record_llm_call(
+            self.agent.model_name,
+            (time.perf_counter() - start) * 1000,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        )
         return InvokeResponse(
             token_usage=TokenUsage(
                 completion_tokens=completion_tokens,
@@ -0,0 +1,126 @@
+import asyncio
+import time
+from typing import Any
+
+from jinja2 import Environment, meta
+from semantic_kernel.contents import ChatMessageContent
+from semantic_kernel.contents.chat_history import ChatHistory
+
+from sk_agents.exceptions import InvalidConfigException
+from sk_agents.ska_types import InvokeResponse
+from sk_agents.skagents.v1.sequential.config import TaskConfig
+from sk_agents.skagents.v1.sequential.task import Task
+
+
+def get_task_dependencies(task_configs: list[TaskConfig]) -> list[frozenset[int]]:
+    """Determines the tasks each task depends on, directly or not.
+
+    A task without `depends_on` depends on all the tasks before it. Otherwise,
+    it depends on the tasks it lists and on those whose output its
+    instructions reference.
+
+    Args:
+        task_configs: The configs of the tasks, in the order they're performed
+
+    Returns:
+        For each task, the indices of the tasks it depends on
+    """
+    indices = {task_config.name: i for i, task_config in enumerate(task_configs)}
+    dependencies: list[frozenset[int]] = []
+    for i, task_config in enumerate(task_configs):
+        if task_config.depends_on is None:
+            dependencies.append(frozenset(range(i)))
+            continue
+        variables = meta.find_undeclared_variables(Environment().parse(task_config.instructions))
+        referenced = [v[1:] for v in variables if v.startswith("_") and v[1:] in indices]
+        closure: set[int] = set()
+        for name in [*task_config.depends_on, *referenced]:
+            if name not in indices:
+                raise InvalidConfigException(
+                    f"Task {task_config.name} depends on unknown task {name}"
+                )
+            if indices[name] >= i:
+                raise InvalidConfigException(
+                    f"Task {task_config.name} can only depend on tasks performed before it, "
+                    f"got {name}"
+                )
+            closure.add(indices[name])
+            closure |= dependencies[indices[name]]
+        dependencies.append(frozenset(closure))
+    return dependencies
+
+
+class TaskGraphRun:
+    """Performs tasks as soon as the tasks they depend on have completed.
+
+    Each task sees the chat history and inputs of the request, along with the
+    messages and outputs of the tasks it depends on, in the order the tasks are
+    configured. When every task depends on all the previous ones, this is the
+    same as performing them in sequence on a shared chat history.
+    """
+
+    def __init__(
+        self,
+        tasks: list[Task],
+        dependencies: list[frozenset[int]],
+        history: ChatHistory,
+        inputs: dict[str, Any],
+        max_concurrent_tasks: int,
+    ):
+        self._tasks = tasks
+        self._dependencies = dependencies
+        self._history = history
+        self._inputs = inputs
+        self._semaphore = asyncio.Semaphore(max_concurrent_tasks)
+        self._runs: list[asyncio.Task[tuple[InvokeResponse, float]]] = []
+        self._turns: dict[int, list[ChatMessageContent]] = {}
+        self._outputs: dict[int, str] = {}
+        self.histories: dict[int, ChatHistory] = {}
+
+    def start(self, count: int) -> None:
+        """Starts performing the first count tasks."""
+        for index in range(len(self._runs), count):
+            self._runs.append(asyncio.create_task(self._run(index)))
+
+    async def result(self, index: int) -> tuple[InvokeResponse, float]:
+        """Waits for a task's response, and how long it took in milliseconds."""
+        return await self._runs[index]
+
+    def get_task_view(self, index: int) -> tuple[ChatHistory, dict[str, Any]]:
+        """Gets the chat history and inputs a task is performed with.
+
+        The history shares its messages with the request's history and the
+        dependencies' messages instead of copying them.
+        """
+        dependencies = sorted(self._dependencies[index])
+        messages = list(self._history.messages)
+        inputs = dict(self._inputs)
+        if index != 0:
+            # As when performed in sequence, only the first task gets the image
+            inputs.pop("embedded_image", None)
+        for dependency in dependencies:
+            messages.extend(self._turns[dependency])
+            inputs[f"_{self._tasks[dependency].name}"] = self._outputs[dependency]
+        return ChatHistory(messages=messages), inputs
+
+    async def _run(self, index: int) -> tuple[InvokeResponse, float]:
+        await asyncio.gather(*(self._runs[i] for i in self._dependencies[index]))
+        async with self._semaphore:
+            history, inputs = self.get_task_view(index)
+            first_message = len(history.messages)
+            start_time = time.time()
+            response = await self._tasks[index].invoke(history=history, inputs=inputs)
+            duration_ms = (time.time() - start_time) * 1000
+        self.histories[index] = history
+        self._turns[index] = history.messages[first_message:]
+        self._outputs[index] = response.output_raw
+        return response, duration_ms
+
+    def cancel(self) -> None:
+        """Cancels the tasks still being performed."""
+        for run in self._runs:
+            if not run.done():
+                run.cancel()
+            elif not run.cancelled():
+                # Marks the failures of tasks that weren't waited for as retrieved
+                run.exception()
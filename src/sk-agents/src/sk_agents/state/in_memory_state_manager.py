@@ -35,6 +35,20 @@ class InMemoryStateManager(StateManager):
             # Return a copy to prevent external modification without synchronization
             return list(self._tasks[task_id].messages)
 
+    @override
+    async def append_task_message(self, task_id: str, new_message: HistoryMultiModalMessage) -> int:
+        return len(await self.update_task_messages(task_id, new_message))
+
+    @override
+    async def get_task_messages(
+        self, task_id: str, start: int = 0, end: int = -1
+    ) -> list[HistoryMultiModalMessage]:
+        with self._lock:
+            if task_id not in self._tasks:
+                return []
+            messages = self._tasks[task_id].messages
+            return messages[start : (end + 1) or None]
+
     @override
     async def set_canceled(self, task_id: str) -> None:
         with self._lock:
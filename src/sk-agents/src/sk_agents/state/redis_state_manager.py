@@ -4,8 +4,11 @@ This implementation uses Redis as the persistent store for task state management
 """
 
 import json
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 
 from redis.asyncio import Redis
+from ska_utils import get_metrics
 
 from sk_agents.ska_types import HistoryMultiModalMessage
 from sk_agents.state.state_manager import StateManager
@@ -22,16 +25,22 @@ class RedisStateManager(StateManager):
         redis_client: Redis,
         ttl: int | None = None,
         key_prefix: str = "task_state:",
+        cache_size: int = 128,
     ):
         """Initialize the RedisStateManager with a Redis client.
 
         Args:
             redis_client: An instance of Redis client
             key_prefix: Prefix used for Redis keys (default: "task_state:")
+            cache_size: Number of tasks whose parsed messages are kept in
+                memory (default: 128)
         """
         self._redis = redis_client
         self._key_prefix = key_prefix
         self._ttl = ttl
+        self._cache_size = cache_size
+        # Messages of the most recently read tasks; histories are append-only
+        self._messages_cache: OrderedDict[str, list[HistoryMultiModalMessage]] = OrderedDict()
 
     def _get_message_key(self, task_id: str) -> str:
         """Generate a Redis key for a task's messages.
@@ -55,6 +64,14 @@ class RedisStateManager(StateManager):
         """
         return f"{self._key_prefix}{task_id}:canceled"
 
+    def _get_cancellation_channel(self) -> str:
+        """Generate the Redis channel on which task cancellations are published.
+
+        Returns:
+            A Redis channel name
+        """
+        return f"{self._key_prefix}canceled"
+
     async def update_task_messages(
         self, task_id: str, new_message: HistoryMultiModalMessage
     ) -> list[HistoryMultiModalMessage]:
@@ -70,26 +87,82 @@ class RedisStateManager(StateManager):
         Returns:
             The complete list of messages for the task
         """
+        await self.append_task_message(task_id, new_message)
+        return await self.get_task_messages(task_id)
+
+    async def append_task_message(self, task_id: str, new_message: HistoryMultiModalMessage) -> int:
+        """Appends a message to a task's message history.
+
+        Args:
+            task_id: The ID of the task
+            new_message: The new message to add to the task's history
+
+        Returns:
+            The number of messages in the task's history
+        """
         # Get the Redis key for this task's messages
         message_key = self._get_message_key(task_id)
 
         # Serialize the new message to JSON with mode='json' to ensure enums are properly serialized
         message_json = json.dumps(new_message.model_dump(mode="json"))
 
-        # Add the new message to the list in Redis
-        await self._redis.rpush(message_key, message_json)
-        if self._ttl:
-            await self._redis.expire(message_key, int(self._ttl))
+        with get_metrics().time_state_store("redis", "append_task_message"):
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.rpush(message_key, message_json)
+                if self._ttl:
+                    pipe.expire(message_key, int(self._ttl))
+                length, *_ = await pipe.execute()
 
-        # Retrieve all messages for the task
-        message_jsons = await self._redis.lrange(message_key, 0, -1)
+        cached = self._messages_cache.get(task_id)
+        if cached is not None and len(cached) == length - 1:
+            cached.append(new_message)
+        return length
 
-        # Deserialize each message from JSON
-        messages = [
-            HistoryMultiModalMessage.model_validate(json.loads(msg)) for msg in message_jsons
-        ]
+    async def get_task_messages(
+        self, task_id: str, start: int = 0, end: int = -1
+    ) -> list[HistoryMultiModalMessage]:
+        """Gets messages from a task's message history.
 
-        return messages
+        Reading the whole history only fetches the messages appended since it
+        was last read by this instance.
+
+        Args:
+            task_id: The ID of the task
+            start: Index of the first message; negative indices count from the end
+            end: Index of the last message, inclusive; negative indices count
+                from the end
+
+        Returns:
+            The messages from start to end
+        """
+        if start != 0 or end != -1:
+            with get_metrics().time_state_store("redis", "get_task_messages"):
+                message_jsons = await self._redis.lrange(self._get_message_key(task_id), start, end)
+            return [self._parse_message(msg) for msg in message_jsons]
+
+        cached = self._messages_cache.pop(task_id, [])
+        message_key = self._get_message_key(task_id)
+        with get_metrics().time_state_store("redis", "get_task_messages"):
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.llen(message_key)
+                pipe.lrange(message_key, len(cached), -1)
+                length, message_jsons = await pipe.execute()
+
+        if length < len(cached):
+            # The history was recreated since it was cached
+            cached = []
+            with get_metrics().time_state_store("redis", "get_task_messages"):
+                message_jsons = await self._redis.lrange(message_key, 0, -1)
+
+        messages = cached + [self._parse_message(msg) for msg in message_jsons]
+        self._messages_cache[task_id] = messages
+        if len(self._messages_cache) > self._cache_size:
+            self._messages_cache.popitem(last=False)
+        return list(messages)
+
+    @staticmethod
+    def _parse_message(message_json: str | bytes) -> HistoryMultiModalMessage:
+        return HistoryMultiModalMessage.model_validate(json.loads(message_json))
 
     async def set_canceled(self, task_id: str) -> None:
         """Marks a task as canceled.
@@ -98,7 +171,12 @@ class RedisStateManager(StateManager):
             task_id: The ID of the task to mark as canceled
         """
         # Set the canceled flag for the task
-        await self._redis.set(self._get_canceled_key(task_id), "1", ex=self._ttl)
+        with get_metrics().time_state_store("redis", "set_canceled"):
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.set(self._get_canceled_key(task_id), "1", ex=self._ttl)
+                # Notify the instance processing the task
+                pipe.publish(self._get_cancellation_channel(), task_id)
+                await pipe.execute()
 
     async def is_canceled(self, task_id: str) -> bool:
         """Checks if a task is marked as canceled.
@@ -110,5 +188,23 @@ class RedisStateManager(StateManager):
             True if the task is canceled, False otherwise
         """
         # Check if the canceled flag is set
-        canceled = await self._redis.get(self._get_canceled_key(task_id))
+        with get_metrics().time_state_store("redis", "is_canceled"):
+            canceled = await self._redis.get(self._get_canceled_key(task_id))
         return canceled == "1"
+
+    async def listen_for_cancellations(self) -> AsyncIterator[str]:
+        """Yields the IDs of tasks as they are canceled, by any instance.
+
+        Returns:
+            An async iterator of canceled task IDs
+        """
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self._get_cancellation_channel())
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                data = message["data"]
+                yield data.decode() if isinstance(data, bytes) else data
+        finally:
+            await pubsub.aclose()
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from sk_agents.ska_types import HistoryMultiModalMessage
 
@@ -10,6 +11,26 @@ class StateManager(ABC):
     ) -> list[HistoryMultiModalMessage]:
         pass
 
+    @abstractmethod
+    async def append_task_message(self, task_id: str, new_message: HistoryMultiModalMessage) -> int:
+        """Appends a message to the task's history.
+
+        Returns:
+            The number of messages in the task's history
+        """
+        pass
+
+    @abstractmethod
+    async def get_task_messages(
+        self, task_id: str, start: int = 0, end: int = -1
+    ) -> list[HistoryMultiModalMessage]:
+        """Gets the messages of the task's history from start to end, inclusive.
+
+        Negative indices count from the end of the history, so start=-n gets the
+        last n messages.
+        """
+        pass
+
     @abstractmethod
     async def set_canceled(self, task_id: str) -> None:
         pass
@@ -17,3 +38,12 @@ class StateManager(ABC):
     @abstractmethod
     async def is_canceled(self, task_id) -> bool:
         pass
+
+    async def listen_for_cancellations(self) -> AsyncIterator[str]:
+        """Yields the IDs of tasks as they are canceled, by any instance.
+
+        State managers that aren't shared between instances yield nothing; the
+        tasks they know of are canceled in-process.
+        """
+        return
+        yield
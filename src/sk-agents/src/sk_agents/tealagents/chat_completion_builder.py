@@ -8,6 +8,7 @@ from ska_utils import AppConfig, ModuleLoader
 from sk_agents.chat_completion.default_chat_completion_factory import (
     DefaultChatCompletionFactory,
 )
+from sk_agents.chat_completion.response_cache import with_response_cache
 from sk_agents.configs import (
     TA_CUSTOM_CHAT_COMPLETION_FACTORY_CLASS_NAME,
     TA_CUSTOM_CHAT_COMPLETION_FACTORY_MODULE,
@@ -47,6 +48,15 @@ class ChatCompletionBuilder:
         self,
         service_id: str,
         model_name: str,
+    ) -> ChatCompletionClientBase:
+        return with_response_cache(
+            self._get_chat_completion_for_model(service_id, model_name), self.app_config
+        )
+
+    def _get_chat_completion_for_model(
+        self,
+        service_id: str,
+        model_name: str,
     ) -> ChatCompletionClientBase:
         if self.ccc_factory:
             try:
@@ -6,7 +6,7 @@ from semantic_kernel.contents import ChatMessageContent, TextContent
 from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.contents.utils.author_role import AuthorRole
 
-from sk_agents.extra_data_collector import ExtraDataCollector, ExtraDataPartial
+from sk_agents.extra_data_collector import ExtraDataCollector
 from sk_agents.ska_types import (
     BaseConfig,
     BaseHandler,
@@ -91,20 +91,16 @@ class ChatAgents(BaseHandler):
             completion_tokens += call_usage.completion_tokens
             prompt_tokens += call_usage.prompt_tokens
             total_tokens += call_usage.total_tokens
-            try:
-                # Attempt to parse as ExtraDataPartial
-                extra_data_partial: ExtraDataPartial = ExtraDataPartial.new_from_json(content)
-                extra_data_collector.add_extra_data_items(extra_data_partial.extra_data)
-            except Exception:
-                if len(content) > 0:
-                    # Handle and return partial response
-                    final_response.append(content)
-                    yield PartialResponse(
-                        session_id=session_id,
-                        source=f"{self.name}:{self.version}",
-                        request_id=request_id,
-                        output_partial=content,
-                    )
+            # Extra data is added to the collector by plugins, not streamed
+            if len(content) > 0:
+                # Handle and return partial response
+                final_response.append(content)
+                yield PartialResponse(
+                    session_id=session_id,
+                    source=f"{self.name}:{self.version}",
+                    request_id=request_id,
+                    output_partial=content,
+                )
         # Build the final response with InvokeResponse
         final_response = "".join(final_response)
         response = InvokeResponse(
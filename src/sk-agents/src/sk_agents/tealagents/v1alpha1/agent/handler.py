@@ -14,10 +14,11 @@ from semantic_kernel.contents.function_result_content import FunctionResultConte
 from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
 from semantic_kernel.contents.utils.author_role import AuthorRole
 from semantic_kernel.kernel import Kernel
+from ska_utils import get_metrics
 
 from sk_agents.authorization.dummy_authorizer import DummyAuthorizer
 from sk_agents.exceptions import AgentInvokeException, AuthenticationException, PersistenceLoadError
-from sk_agents.extra_data_collector import ExtraDataCollector, ExtraDataPartial
+from sk_agents.extra_data_collector import ExtraDataCollector
 from sk_agents.persistence.in_memory_persistence_manager import InMemoryPersistenceManager
 from sk_agents.ska_types import BaseConfig, BaseHandler, ContentType, TokenUsage
 from sk_agents.tealagents.models import (
@@ -461,12 +462,14 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
 
             # Initial call to the LLM
             response_list = []
-            responses = await chat_completion_service.get_chat_message_contents(
-                chat_history=chat_history,
-                settings=settings,
-                kernel=kernel,
-                arguments=arguments,
-            )
+            model_name = self.config.get_agent().model
+            with get_metrics().time_llm_call(model_name):
+                responses = await chat_completion_service.get_chat_message_contents(
+                    chat_history=chat_history,
+                    settings=settings,
+                    kernel=kernel,
+                    arguments=arguments,
+                )
             for response_chunk in responses:
                 # response_list.extend(response_chunk)
                 chat_history.add_message(response_chunk)
@@ -494,6 +497,7 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
                 else:
                     # If no function calls, it's a direct answer
                     final_response = response
+            get_metrics().record_tokens(model_name, prompt_tokens, completion_tokens)
             token_usage = TokenUsage(
                 completion_tokens=completion_tokens,
                 prompt_tokens=prompt_tokens,
@@ -567,12 +571,14 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
             all_responses = []
             # Stream the initial response from the LLM
             response_list = []
-            responses = await chat_completion_service.get_chat_message_contents(
-                chat_history=chat_history,
-                settings=settings,
-                kernel=kernel,
-                arguments=arguments,
-            )
+            model_name = self.config.get_agent().model
+            with get_metrics().time_llm_call(model_name):
+                responses = await chat_completion_service.get_chat_message_contents(
+                    chat_history=chat_history,
+                    settings=settings,
+                    kernel=kernel,
+                    arguments=arguments,
+                )
             for response_chunk in responses:
                 chat_history.add_message(response_chunk)
                 response_list.append(response_chunk)
@@ -585,25 +591,19 @@ class TealAgentsV1Alpha1Handler(BaseHandler):
                 prompt_tokens += call_usage.prompt_tokens
                 total_tokens += call_usage.total_tokens
 
+                # Extra data is added to the collector by plugins, not streamed
                 if response.content:
-                    try:
-                        # Attempt to parse as ExtraDataPartial
-                        extra_data_partial: ExtraDataPartial = ExtraDataPartial.new_from_json(
-                            response.content
-                        )
-                        extra_data_collector.add_extra_data_items(extra_data_partial.extra_data)
-                    except Exception:
-                        if len(response.content) > 0:
-                            # Handle and return partial response
-                            final_response.append(response.content)
-                            yield TealAgentsPartialResponse(
-                                session_id=session_id,
-                                task_id=task_id,
-                                request_id=request_id,
-                                output_partial=response.content,
-                                source=f"{self.name}:{self.version}",
-                            )
-
+                    # Handle and return partial response
+                    final_response.append(response.content)
+                    yield TealAgentsPartialResponse(
+                        session_id=session_id,
+                        task_id=task_id,
+                        request_id=request_id,
+                        output_partial=response.content,
+                        source=f"{self.name}:{self.version}",
+                    )
+
+            get_metrics().record_tokens(model_name, prompt_tokens, completion_tokens)
             token_usage = TokenUsage(
                 completion_tokens=completion_tokens,
                 prompt_tokens=prompt_tokens,
@@ -1,9 +1,14 @@
 import logging
 import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 
-from ska_utils import AppConfig
+from semantic_kernel.filters import FunctionInvocationContext
+from ska_utils import AppConfig, get_metrics
 
 from sk_agents.configs import TA_PLUGIN_MODULE
+from sk_agents.extra_data_collector import ExtraDataPartial
 from sk_agents.plugin_loader import get_plugin_loader
 from sk_agents.ska_types import (
     IntermediateTaskResponse,
@@ -22,6 +27,42 @@ def docstring_parameter(*sub):
     return dec
 
 
+# Called with the plugin name, the function name and whether the call has finished
+ToolCallListener = Callable[[str, str, bool], None]
+
+_tool_call_listener: ContextVar[ToolCallListener | None] = ContextVar(
+    "tool_call_listener", default=None
+)
+
+
+@contextmanager
+def listen_to_tool_calls(listener: ToolCallListener) -> Iterator[None]:
+    """Notifies ``listener`` of the tool calls made while the context is active."""
+    token = _tool_call_listener.set(listener)
+    try:
+        yield
+    finally:
+        _tool_call_listener.reset(token)
+
+
+async def tool_call_filter(context: FunctionInvocationContext, next):
+    """Kernel function invocation filter recording the duration of tool calls.
+
+    The listener set with ``listen_to_tool_calls``, if any, is notified when
+    each call starts and finishes.
+    """
+    plugin_name = context.function.plugin_name or ""
+    listener = _tool_call_listener.get()
+    if listener:
+        listener(plugin_name, context.function.name, False)
+    try:
+        with get_metrics().time_tool_call(plugin_name, context.function.name):
+            await next(context)
+    finally:
+        if listener:
+            listener(plugin_name, context.function.name, True)
+
+
 def initialize_plugin_loader(agents_path: str, app_config: AppConfig):
     try:
         plugin_module = app_config.get(TA_PLUGIN_MODULE.env_name)
@@ -39,13 +80,15 @@ def initialize_plugin_loader(agents_path: str, app_config: AppConfig):
 
 
 def get_sse_event_for_response(
-    response: IntermediateTaskResponse | PartialResponse | InvokeResponse,
+    response: IntermediateTaskResponse | PartialResponse | ExtraDataPartial | InvokeResponse,
 ) -> str:
     try:
         if isinstance(response, IntermediateTaskResponse):
             return f"event: intermediate-task-response\ndata: {response.model_dump_json()}\n\n"
         elif isinstance(response, PartialResponse):
             return f"event: partial-response\ndata: {response.model_dump_json()}\n\n"
+        elif isinstance(response, ExtraDataPartial):
+            return f"event: extra-data\ndata: {response.model_dump_json()}\n\n"
         elif isinstance(response, InvokeResponse):
             return f"event: final-response\ndata: {response.model_dump_json()}\n\n"
         else:
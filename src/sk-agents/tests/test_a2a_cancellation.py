@@ -0,0 +1,122 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from a2a.types import TaskState, TaskStatusUpdateEvent
+
+from sk_agents.a2a.a2a_agent_executor import A2AAgentExecutor
+from sk_agents.a2a.cancellation import CancellationRegistry
+from sk_agents.state.in_memory_state_manager import InMemoryStateManager
+
+
+@pytest.mark.asyncio
+async def test_registry_cancels_running_task():
+    registry = CancellationRegistry()
+    task = asyncio.create_task(asyncio.sleep(10))
+
+    with registry.running("task-1", task):
+        assert registry.is_running("task-1")
+        assert registry.cancel("task-1")
+        assert registry.was_canceled("task-1")
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert not registry.is_running("task-1")
+    assert not registry.was_canceled("task-1")
+
+
+def test_registry_cancel_unknown_task():
+    assert not CancellationRegistry().cancel("task-1")
+
+
+def _context():
+    context = MagicMock()
+    context.task_id = "task-1"
+    context.context_id = "context-1"
+    return context
+
+
+def _executor(state_manager):
+    with patch("sk_agents.a2a.a2a_agent_executor.A2AResponseClassifier"):
+        return A2AAgentExecutor(MagicMock(), MagicMock(), MagicMock(), state_manager)
+
+
+def _statuses(event_queue):
+    return [
+        call.args[0].status.state
+        for call in event_queue.enqueue_event.call_args_list
+        if isinstance(call.args[0], TaskStatusUpdateEvent)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cancel_interrupts_running_execution():
+    state_manager = InMemoryStateManager()
+    executor = _executor(state_manager)
+    started = asyncio.Event()
+
+    async def process_request():
+        started.set()
+        await asyncio.sleep(10)
+
+    processor = MagicMock()
+    processor.process_request = process_request
+    event_queue = MagicMock()
+
+    with (
+        patch("sk_agents.a2a.a2a_agent_executor.skagents_handle"),
+        patch("sk_agents.a2a.a2a_agent_executor.RequestProcessor", return_value=processor),
+    ):
+        execution = asyncio.create_task(executor.execute(_context(), event_queue))
+        await started.wait()
+        await executor.cancel(_context(), MagicMock())
+        await asyncio.wait_for(execution, 1)
+
+    processor.handle_canceled.assert_called_once()
+    assert not executor.cancellations.is_running("task-1")
+
+
+@pytest.mark.asyncio
+async def test_cancel_of_task_not_running_here_sends_final_status():
+    state_manager = MagicMock()
+    state_manager.set_canceled = AsyncMock()
+    executor = _executor(state_manager)
+    event_queue = MagicMock()
+
+    await executor.cancel(_context(), event_queue)
+
+    state_manager.set_canceled.assert_awaited_once_with("task-1")
+    assert _statuses(event_queue) == [TaskState.canceled]
+
+
+@pytest.mark.asyncio
+async def test_published_cancellation_interrupts_execution():
+    listened = asyncio.Queue()
+
+    async def listen_for_cancellations():
+        while True:
+            yield await listened.get()
+
+    state_manager = MagicMock()
+    state_manager.listen_for_cancellations = listen_for_cancellations
+    executor = _executor(state_manager)
+    started = asyncio.Event()
+
+    async def process_request():
+        started.set()
+        await asyncio.sleep(10)
+
+    processor = MagicMock()
+    processor.process_request = process_request
+
+    with (
+        patch("sk_agents.a2a.a2a_agent_executor.skagents_handle"),
+        patch("sk_agents.a2a.a2a_agent_executor.RequestProcessor", return_value=processor),
+    ):
+        execution = asyncio.create_task(executor.execute(_context(), MagicMock()))
+        await started.wait()
+        listened.put_nowait("task-1")
+        await asyncio.wait_for(execution, 1)
+
+    processor.handle_canceled.assert_called_once()
+    executor._cancellation_listener.cancel()
@@ -0,0 +1,153 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from a2a.types import (
+    Message,
+    Part,
+    Role,
+    TaskArtifactUpdateEvent,
+    TaskState,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
+from pydantic import BaseModel
+
+from sk_agents.a2a.request_processor import RequestProcessor
+from sk_agents.a2a.response_classifier import A2AResponseClassification, A2AResponseStatus
+from sk_agents.ska_types import (
+    IntermediateTaskResponse,
+    InvokeResponse,
+    PartialResponse,
+    TokenUsage,
+)
+from sk_agents.utils import tool_call_filter
+
+
+class Forecast(BaseModel):
+    summary: str
+
+
+def _final_response(text, output_pydantic=None):
+    return InvokeResponse(
+        token_usage=TokenUsage(completion_tokens=2, prompt_tokens=3, total_tokens=5),
+        output_raw=text,
+        output_pydantic=output_pydantic,
+    )
+
+
+def _processor(stream, status=A2AResponseStatus.completed, stream_output=True):
+    handler = MagicMock()
+    handler.invoke_stream = MagicMock(side_effect=lambda inputs: stream())
+    classifier = MagicMock()
+    classifier.classify_response = AsyncMock(return_value=A2AResponseClassification(status=status))
+    context = MagicMock()
+    context.task_id = "task-1"
+    context.context_id = "context-1"
+    context.message = Message(
+        messageId="message-1", role=Role.user, parts=[Part(root=TextPart(text="Hi"))]
+    )
+    state_manager = MagicMock()
+    state_manager.update_task_messages = AsyncMock(return_value=[])
+    state_manager.append_task_message = AsyncMock(return_value=2)
+    state_manager.is_canceled = AsyncMock(return_value=False)
+    event_queue = MagicMock()
+    processor = RequestProcessor(
+        handler, classifier, context, event_queue, state_manager, stream_output=stream_output
+    )
+    return processor, event_queue
+
+
+def _events(event_queue):
+    return [call.args[0] for call in event_queue.enqueue_event.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_process_request_streams_artifact_chunks():
+    async def stream(inputs=None):
+        yield PartialResponse(output_partial="Hello")
+        yield PartialResponse(output_partial=" world")
+        yield _final_response("Hello world")
+
+    processor, event_queue = _processor(stream)
+    await processor.process_request()
+
+    events = _events(event_queue)
+    chunks = [e for e in events if isinstance(e, TaskArtifactUpdateEvent)]
+    assert [(c.append, c.lastChunk, c.artifact.name) for c in chunks] == [
+        (False, False, "partial-response"),
+        (True, False, "partial-response"),
+        (False, True, "final-response"),
+    ]
+    assert len({c.artifact.artifactId for c in chunks}) == 1
+    assert [c.artifact.parts[0].root.text for c in chunks] == ["Hello", " world", "Hello world"]
+    assert chunks[-1].metadata["total_tokens"] == 5
+    assert events[-1].status.state == TaskState.completed
+    assert events[-1].final
+
+
+@pytest.mark.asyncio
+async def test_process_request_closes_artifact_before_input_required():
+    async def stream(inputs=None):
+        yield PartialResponse(output_partial="Which date?")
+        yield _final_response("Which date?")
+
+    processor, event_queue = _processor(stream, A2AResponseStatus.input_required)
+    await processor.process_request()
+
+    events = _events(event_queue)
+    assert isinstance(events[-2], TaskArtifactUpdateEvent)
+    assert events[-2].lastChunk
+    artifacts = {e.artifact.name for e in events if isinstance(e, TaskArtifactUpdateEvent)}
+    assert artifacts == {"partial-response"}
+    assert events[-1].status.state == TaskState.input_required
+
+
+@pytest.mark.asyncio
+async def test_process_request_sends_structured_output_once():
+    async def stream(inputs=None):
+        yield PartialResponse(output_partial='{"summary": ')
+        yield PartialResponse(output_partial='"Sunny"}')
+        yield _final_response('{"summary": "Sunny"}', Forecast(summary="Sunny"))
+
+    processor, event_queue = _processor(stream, stream_output=False)
+    await processor.process_request()
+
+    (artifact,) = [e for e in _events(event_queue) if isinstance(e, TaskArtifactUpdateEvent)]
+    assert artifact.artifact.name == "final-response"
+    assert artifact.artifact.parts[0].root.data == {"summary": "Sunny"}
+
+
+@pytest.mark.asyncio
+async def test_process_request_sends_status_updates_for_tasks_and_tools():
+    async def stream(inputs=None):
+        yield IntermediateTaskResponse(
+            task_no=1, task_name="research", response=_final_response("notes")
+        )
+        context = MagicMock()
+        context.function.plugin_name = "Search"
+        context.function.name = "lookup"
+        await tool_call_filter(context, AsyncMock())
+        yield _final_response("Done")
+
+    processor, event_queue = _processor(stream)
+    await processor.process_request()
+
+    messages = [
+        e.status.message.parts[0].root.text
+        for e in _events(event_queue)
+        if isinstance(e, TaskStatusUpdateEvent) and e.status.message
+    ]
+    assert "Completed task research" in messages
+    assert messages.index("Calling Search-lookup...") < messages.index(
+        "Finished calling Search-lookup"
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_request_without_final_response_raises():
+    async def stream(inputs=None):
+        yield PartialResponse(output_partial="Hello")
+
+    processor, _ = _processor(stream)
+    with pytest.raises(ValueError):
+        await processor.process_request()
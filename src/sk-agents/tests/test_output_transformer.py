@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from sk_agents.skagents.v1.sequential.output_transformer import OutputTransformer
+
+
+class MathOutput(BaseModel):
+    result: int
+    explanation: str | None = None
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        '{"result": 42}',
+        'Here you go:\n```json\n{"result": 42}\n```\nAnything else?',
+        'The sum is {"a": 1} and the answer is {"result": 42, "explanation": "6 * 7"}',
+        '{"result": 42, "explanation": “6 * 7”,}',
+        "{'result': 42, 'explanation': None}",
+    ],
+)
+def test_parse_output(output):
+    assert OutputTransformer.parse_output(output, MathOutput).result == 42
+
+
+@pytest.mark.parametrize(
+    "output",
+    ["The answer is 42", '{"answer": 42}', "[1, 2]", '{"result": 42'],
+)
+def test_parse_output_without_structured_output(output):
+    assert OutputTransformer.parse_output(output, MathOutput) is None
+
+
+@pytest.mark.asyncio
+async def test_transform_output_skips_llm_when_output_is_json():
+    kernel_builder = MagicMock()
+    type_loader = MagicMock()
+    type_loader.get_type.return_value = MathOutput
+    with patch(
+        "sk_agents.skagents.v1.sequential.output_transformer.get_type_loader",
+        return_value=type_loader,
+    ):
+        response = await OutputTransformer(kernel_builder).transform_output(
+            '```json\n{"result": 42}\n```', "MathOutput"
+        )
+
+    assert response.output_pydantic == MathOutput(result=42)
+    assert response.token_usage.total_tokens == 0
+    kernel_builder.build_kernel.assert_not_called()
@@ -0,0 +1,127 @@
+import pytest
+
+from sk_agents.ska_types import ContentType, HistoryMultiModalMessage, MultiModalItem
+from sk_agents.state import InMemoryStateManager, RedisStateManager
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def __getattr__(self, name):
+        def command(*args):
+            self._commands.append((getattr(self._redis, f"_{name}"), args))
+
+        return command
+
+    async def execute(self):
+        results = [command(*args) for command, args in self._commands]
+        self._commands = []
+        return results
+
+
+class FakeRedis:
+    """Keeps lists, and counts the list items read."""
+
+    def __init__(self):
+        self.lists = {}
+        self.items_read = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def lrange(self, key, start, end):
+        return self._lrange(key, start, end)
+
+    def _rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    def _expire(self, key, ttl):
+        return True
+
+    def _llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def _lrange(self, key, start, end):
+        items = self.lists.get(key, [])[start : (end + 1) or None]
+        self.items_read += len(items)
+        return items
+
+
+def _message(text):
+    return HistoryMultiModalMessage(
+        role="user", items=[MultiModalItem(content_type=ContentType.TEXT, content=text)]
+    )
+
+
+def _texts(messages):
+    return [m.items[0].content for m in messages]
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.mark.asyncio
+async def test_append_returns_length_without_reading(redis):
+    manager = RedisStateManager(redis, ttl=60)
+    assert await manager.append_task_message("task-1", _message("a")) == 1
+    assert await manager.append_task_message("task-1", _message("b")) == 2
+    assert redis.items_read == 0
+
+
+@pytest.mark.asyncio
+async def test_full_reads_only_fetch_new_messages(redis):
+    manager = RedisStateManager(redis)
+    messages = await manager.update_task_messages("task-1", _message("a"))
+    assert _texts(messages) == ["a"]
+
+    # Appended by another instance
+    other = RedisStateManager(redis)
+    await other.append_task_message("task-1", _message("b"))
+    redis.items_read = 0
+
+    messages = await manager.update_task_messages("task-1", _message("c"))
+    assert _texts(messages) == ["a", "b", "c"]
+    assert redis.items_read == 2
+
+
+@pytest.mark.asyncio
+async def test_recreated_history_is_read_again(redis):
+    manager = RedisStateManager(redis)
+    await manager.update_task_messages("task-1", _message("a"))
+    await manager.update_task_messages("task-1", _message("b"))
+
+    redis.lists.clear()
+    await RedisStateManager(redis).append_task_message("task-1", _message("c"))
+
+    assert _texts(await manager.get_task_messages("task-1")) == ["c"]
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded(redis):
+    manager = RedisStateManager(redis, cache_size=1)
+    await manager.update_task_messages("task-1", _message("a"))
+    await manager.update_task_messages("task-2", _message("b"))
+    assert list(manager._messages_cache) == ["task-2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("manager_type", [RedisStateManager, InMemoryStateManager])
+async def test_get_message_range(redis, manager_type):
+    manager = RedisStateManager(redis) if manager_type is RedisStateManager else manager_type()
+    for text in "abcd":
+        await manager.append_task_message("task-1", _message(text))
+
+    assert _texts(await manager.get_task_messages("task-1", -2)) == ["c", "d"]
+    assert _texts(await manager.get_task_messages("task-1", 1, 2)) == ["b", "c"]
+    assert await manager.get_task_messages("task-2") == []
@@ -0,0 +1,194 @@
+import json
+
+import pytest
+from a2a.types import (
+    Artifact,
+    Message,
+    Part,
+    Role,
+    Task,
+    TaskState,
+    TaskStatus,
+    TextPart,
+)
+
+from sk_agents.a2a.redis_task_store import RedisTaskStore
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def watch(self, *keys):
+        pass
+
+    async def hmget(self, key, *fields):
+        return [self._redis.data.get(key, {}).get(f) for f in fields]
+
+    def multi(self):
+        pass
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            self._commands.append((getattr(self._redis, f"_{name}"), args, kwargs))
+
+        return command
+
+    async def execute(self):
+        results = [command(*args, **kwargs) for command, args, kwargs in self._commands]
+        self._commands = []
+        return results
+
+
+class FakeRedis:
+    """Keeps the values stored through pipelines, and those written."""
+
+    def __init__(self):
+        self.data = {}
+        self.writes = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def delete(self, *keys):
+        self._delete(*keys)
+
+    def _delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def _rpush(self, key, *values):
+        self.writes.extend(values)
+        self.data.setdefault(key, []).extend(values)
+
+    def _hset(self, key, mapping):
+        values = {k: v if isinstance(v, bytes) else str(v).encode() for k, v in mapping.items()}
+        self.writes.extend(values.values())
+        self.data.setdefault(key, {}).update(values)
+
+    def _hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    def _lrange(self, key, start, end):
+        return list(self.data.get(key, []))
+
+    def _get(self, key):
+        return self.data.get(key)
+
+    def _expire(self, key, ttl):
+        pass
+
+
+def _message(text):
+    return Message(messageId=text, role=Role.agent, parts=[Part(root=TextPart(text=text))])
+
+
+def _task(history, artifacts=None, state=TaskState.working):
+    return Task(
+        id="task-1",
+        contextId="context-1",
+        status=TaskStatus(state=state),
+        history=history,
+        artifacts=artifacts,
+    )
+
+
+def _artifact(*texts, artifact_id="artifact-1"):
+    return Artifact(artifactId=artifact_id, parts=[Part(root=TextPart(text=t)) for t in texts])
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def store(redis):
+    return RedisTaskStore(redis, ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_save_and_get_round_trip(store):
+    task = _task([_message("hi"), _message("hello")], [_artifact("a", "b")], TaskState.completed)
+    await store.save(task)
+    assert await store.get("task-1") == task
+
+
+@pytest.mark.asyncio
+async def test_get_unknown_task(store):
+    assert await store.get("task-2") is None
+
+
+@pytest.mark.asyncio
+async def test_save_only_appends_new_history_and_parts(store, redis):
+    await store.save(_task([_message("hi")], [_artifact("a")]))
+    redis.writes.clear()
+
+    task = _task([_message("hi"), _message("hello")], [_artifact("a", "b")])
+    await store.save(task)
+
+    written = b"".join(redis.writes)
+    assert b'"hello"' in written
+    assert b'"b"' in written
+    assert b'"hi"' not in written
+    assert b'"a"' not in written
+    assert len(redis.data["task:task-1:artifacts"]) == 2
+    assert await store.get("task-1") == task
+
+
+@pytest.mark.asyncio
+async def test_replaced_artifact_is_stored_again(store, redis):
+    await store.save(_task([], [_artifact("a", "b"), _artifact("c", artifact_id="artifact-2")]))
+    task = _task([], [_artifact("x"), _artifact("c", artifact_id="artifact-2")])
+    await store.save(task)
+
+    assert len(redis.data["task:task-1:artifacts"]) == 2
+    assert await store.get("task-1") == task
+
+
+@pytest.mark.asyncio
+async def test_get_task_saved_before_split_layout(store, redis):
+    task = _task([_message("hi")])
+    redis.data["task:task-1"] = json.dumps(task.model_dump(mode="json"))
+    assert await store.get("task-1") == task
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_all_keys(store, redis):
+    await store.save(_task([_message("hi")], [_artifact("a")]))
+    await store.delete("task-1")
+    assert redis.data == {}
+
+
+def test_compression_requires_zstandard(monkeypatch, redis):
+    import builtins
+
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == "zstandard":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+    with pytest.raises(ValueError):
+        RedisTaskStore(redis, compression_threshold=1024)
+
+
+@pytest.mark.asyncio
+async def test_large_values_are_compressed(redis):
+    pytest.importorskip("zstandard")
+    store = RedisTaskStore(redis, compression_threshold=256)
+    task = _task([_message("hi"), _message("x" * 1000)])
+    await store.save(task)
+
+    assert not redis.data["task:task-1:history"][0].startswith(b"\x28\xb5\x2f\xfd")
+    assert redis.data["task:task-1:history"][1].startswith(b"\x28\xb5\x2f\xfd")
+    assert await store.get("task-1") == task
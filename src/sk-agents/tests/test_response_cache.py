@@ -0,0 +1,216 @@
+from unittest.mock import MagicMock
+
+import pytest
+from semantic_kernel.connectors.ai.chat_completion_client_base import (
+    ChatCompletionClientBase,
+)
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents import (
+    AuthorRole,
+    ChatMessageContent,
+    FunctionCallContent,
+    StreamingChatMessageContent,
+)
+from semantic_kernel.contents.chat_history import ChatHistory
+
+from sk_agents.chat_completion import response_cache
+from sk_agents.chat_completion.response_cache import (
+    CachingChatCompletion,
+    InMemoryResponseCache,
+    with_response_cache,
+)
+
+
+class FakeChatCompletion(ChatCompletionClientBase):
+    calls: int = 0
+
+    async def _inner_get_chat_message_contents(self, chat_history, settings):
+        self.calls += 1
+        return [
+            ChatMessageContent(
+                role=AuthorRole.ASSISTANT,
+                content=f"answer {self.calls}",
+                inner_content=MagicMock(),
+            )
+        ]
+
+    async def _inner_get_streaming_chat_message_contents(
+        self, chat_history, settings, function_invoke_attempt=0
+    ):
+        self.calls += 1
+        for text in ["ans", "wer"]:
+            yield [
+                StreamingChatMessageContent(
+                    role=AuthorRole.ASSISTANT,
+                    choice_index=0,
+                    content=text,
+                    inner_content=MagicMock(),
+                    function_invoke_attempt=function_invoke_attempt,
+                )
+            ]
+        yield [
+            StreamingChatMessageContent(
+                role=AuthorRole.ASSISTANT,
+                choice_index=0,
+                items=[FunctionCallContent(id="1", name="plugin-function", arguments="{}")],
+                function_invoke_attempt=function_invoke_attempt,
+            )
+        ]
+
+
+class FailingCache(InMemoryResponseCache):
+    async def get(self, key):
+        raise ConnectionError("down")
+
+    async def set(self, key, value):
+        raise ConnectionError("down")
+
+
+def _history(text="hello"):
+    history = ChatHistory()
+    history.add_user_message(text)
+    return history
+
+
+def _settings(temperature=0.0):
+    settings = PromptExecutionSettings(service_id="agent")
+    if temperature is not None:
+        settings.extension_data = {"temperature": temperature}
+    return settings
+
+
+@pytest.fixture
+def inner():
+    return FakeChatCompletion(service_id="agent", ai_model_id="gpt-4o")
+
+
+def _caching(inner, cache=None):
+    return CachingChatCompletion(
+        service_id=inner.service_id,
+        ai_model_id=inner.ai_model_id,
+        inner=inner,
+        cache=cache or InMemoryResponseCache(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_requests_are_answered_from_cache(inner):
+    chat_completion = _caching(inner)
+
+    first = await chat_completion.get_chat_message_contents(_history(), _settings())
+    second = await chat_completion.get_chat_message_contents(_history(), _settings())
+
+    assert inner.calls == 1
+    assert second[0].content == first[0].content == "answer 1"
+    assert second[0].inner_content is None
+
+
+@pytest.mark.asyncio
+async def test_different_history_is_not_answered_from_cache(inner):
+    chat_completion = _caching(inner)
+    await chat_completion.get_chat_message_contents(_history(), _settings())
+    response = await chat_completion.get_chat_message_contents(_history("bye"), _settings())
+
+    assert inner.calls == 2
+    assert response[0].content == "answer 2"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("temperature", [None, 0.7])
+async def test_sampled_requests_are_not_cached(inner, temperature):
+    chat_completion = _caching(inner)
+    await chat_completion.get_chat_message_contents(_history(), _settings(temperature))
+    await chat_completion.get_chat_message_contents(_history(), _settings(temperature))
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_streams_are_replayed_as_chunks(inner):
+    chat_completion = _caching(inner)
+
+    async def stream():
+        return [
+            chunk
+            async for chunk in chat_completion.get_streaming_chat_message_contents(
+                _history(), _settings()
+            )
+        ]
+
+    first = await stream()
+    second = await stream()
+
+    assert inner.calls == 1
+    assert [c[0].content for c in second] == [c[0].content for c in first] == ["ans", "wer", ""]
+    assert isinstance(second[2][0].items[0], FunctionCallContent)
+    assert second[0][0].inner_content is None
+    assert (second[0][0] + second[1][0]).content == "answer"
+
+
+@pytest.mark.asyncio
+async def test_cache_errors_are_ignored(inner):
+    chat_completion = _caching(inner, FailingCache())
+    response = await chat_completion.get_chat_message_contents(_history(), _settings())
+    assert response[0].content == "answer 1"
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryResponseCache(max_size=2)
+    await cache.set("a", "1")
+    await cache.set("b", "2")
+    await cache.get("a")
+    await cache.set("c", "3")
+
+    assert await cache.get("a") == "1"
+    assert await cache.get("b") is None
+    assert await cache.get("c") == "3"
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_expires_entries(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now)
+    cache = InMemoryResponseCache(ttl=10)
+    await cache.set("a", "1")
+
+    now = 111.0
+    assert await cache.get("a") is None
+
+
+def _app_config(**values):
+    values = {
+        "TA_LLM_CACHE_TTL": "3600",
+        "TA_LLM_CACHE_SIZE": "1024",
+        "TA_LLM_CACHE_MAX_TEMPERATURE": "0",
+        **values,
+    }
+    app_config = MagicMock()
+    app_config.get.side_effect = values.get
+    return app_config
+
+
+@pytest.fixture(autouse=True)
+def reset_response_cache(monkeypatch):
+    monkeypatch.setattr(response_cache, "_response_cache", None)
+
+
+def test_clients_are_not_wrapped_without_backend(inner):
+    assert with_response_cache(inner, _app_config()) is inner
+
+
+@pytest.mark.parametrize(
+    "agents, wrapped", [(None, True), ("other, agent", True), ("other", False)]
+)
+def test_clients_are_wrapped_for_enabled_agents(inner, agents, wrapped):
+    app_config = _app_config(TA_LLM_CACHE_BACKEND="in-memory", TA_LLM_CACHE_AGENTS=agents)
+    chat_completion = with_response_cache(inner, app_config)
+
+    assert isinstance(chat_completion, CachingChatCompletion) == wrapped
+    if wrapped:
+        assert chat_completion.service_id == "agent"
+        assert chat_completion.cache is with_response_cache(inner, app_config).cache
+
+
+def test_unknown_backend(inner):
+    with pytest.raises(ValueError):
+        with_response_cache(inner, _app_config(TA_LLM_CACHE_BACKEND="disk"))
@@ -0,0 +1,132 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sk_agents.a2a.response_classifier import (
+    A2AResponseClassification,
+    A2AResponseClassifier,
+    A2AResponseSignals,
+    A2AResponseStatus,
+)
+from sk_agents.extra_data_collector import ExtraData, ExtraDataElement
+from sk_agents.ska_types import InvokeResponse, TokenUsage
+
+
+@pytest.fixture
+def classifier():
+    app_config = MagicMock()
+    app_config.get.return_value = "2"
+    with patch.object(A2AResponseClassifier, "_build_agent"):
+        classifier = A2AResponseClassifier(app_config, MagicMock())
+    return classifier
+
+
+def _mock_llm(classifier, status):
+    async def invoke(messages):
+        yield MagicMock(content=f'{{"status": "{status}"}}')
+
+    classifier.agent.invoke = MagicMock(side_effect=invoke)
+
+
+def _response(**kwargs):
+    return InvokeResponse(
+        token_usage=TokenUsage(completion_tokens=0, prompt_tokens=0, total_tokens=0),
+        **kwargs,
+    )
+
+
+def test_signals_from_extra_data():
+    response = _response(
+        output_raw="Please log in",
+        extra_data=ExtraData(
+            items=[
+                ExtraDataElement(key="a2a_status", value="auth-required"),
+                ExtraDataElement(key="a2a_message", value="Token expired"),
+                ExtraDataElement(key="other", value="ignored"),
+            ]
+        ),
+    )
+    signals = A2AResponseSignals.from_response(response)
+    assert signals.status == A2AResponseStatus.auth_required
+    assert signals.message == "Token expired"
+    assert not signals.structured_output
+
+
+def test_signals_ignore_unknown_status():
+    response = _response(
+        output_raw="Done",
+        extra_data=ExtraData(items=[ExtraDataElement(key="a2a_status", value="bogus")]),
+    )
+    assert A2AResponseSignals.from_response(response).status is None
+
+
+@pytest.mark.asyncio
+async def test_signals_take_precedence(classifier):
+    _mock_llm(classifier, "failed")
+    classification = await classifier.classify_response(
+        "Could you please specify the date?", A2AResponseSignals(structured_output=True)
+    )
+    assert classification.status == A2AResponseStatus.completed
+    classifier.agent.invoke.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "response,status",
+    [
+        (
+            "I need more information. Which option do you prefer, daily or weekly totals?",
+            A2AResponseStatus.input_required,
+        ),
+        (
+            "I'm sorry, I cannot complete the request. Error code: 503.",
+            A2AResponseStatus.failed,
+        ),
+    ],
+)
+async def test_rules_classify_clear_responses(classifier, response, status):
+    _mock_llm(classifier, "failed")
+    classification = await classifier.classify_response(response)
+    assert classification.status == status
+    classifier.agent.invoke.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "response",
+    [
+        "Here is the summary of the report you asked for.",
+        "To sign in, open the portal and enter your email and password.",
+        "You need to sign in to access your profile.",
+        "The script encountered an error on line 3, here is the fix: close the file.",
+        "Your request failed to validate because the date was missing. Fixed it, "
+        "here is the report. Do you want me to email it?",
+        "I'm sorry, I cannot complete the request until you log in. Authentication "
+        "failed with invalid credentials.",
+    ],
+)
+async def test_unclear_responses_are_left_to_llm(classifier, response):
+    _mock_llm(classifier, "completed")
+    classification = await classifier.classify_response(response)
+    assert classification.status == A2AResponseStatus.completed
+    classifier.agent.invoke.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ambiguous_responses_use_llm_and_cache(classifier):
+    _mock_llm(classifier, "completed")
+    response = "Here are your results. Anything else?"
+
+    first = await classifier.classify_response(response)
+    second = await classifier.classify_response(response)
+
+    assert first == second == A2AResponseClassification(status=A2AResponseStatus.completed)
+    classifier.agent.invoke.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded(classifier):
+    _mock_llm(classifier, "completed")
+    for i in range(3):
+        await classifier.classify_response(f"Result {i}. Anything else?")
+    assert len(classifier._cache) == 2
@@ -2,7 +2,12 @@
 import pytest
 
 from sk_agents.exceptions import AgentInvokeException, InvalidConfigException
-from sk_agents.extra_data_collector import ExtraDataCollector
+from sk_agents.extra_data_collector import (
+    ExtraData,
+    ExtraDataCollector,
+    ExtraDataElement,
+    ExtraDataPartial,
+)
 from sk_agents.ska_types import BaseConfig, InvokeResponse, TokenUsage
 from sk_agents.skagents.kernel_builder import KernelBuilder
 from sk_agents.skagents.v1.config import AgentConfig
@@ -113,6 +118,9 @@ class MockMessage:
 class MockChatHistory:
     messages: list = [MockMessage(), MockMessage()]
 
+    def __init__(self, messages=None):
+        pass
+
 
 class MockSpan:
     def set_attribute(self, key, value):
@@ -177,6 +185,7 @@ async def test_sequential_invoke(
     mocker.patch(
         "sk_agents.skagents.v1.sequential.sequential_skagents.ChatHistory", new=MockChatHistory
     )
+    mocker.patch("sk_agents.skagents.v1.sequential.task_graph.ChatHistory", new=MockChatHistory)
 
     response = await skagents.invoke(inputs=test_input)
 
@@ -229,6 +238,7 @@ async def test_sequential_invoke_with_output_type(
     mocker.patch(
         "sk_agents.skagents.v1.sequential.sequential_skagents.ChatHistory", new=MockChatHistory
     )
+    mocker.patch("sk_agents.skagents.v1.sequential.task_graph.ChatHistory", new=MockChatHistory)
 
     await skagents.invoke(inputs=test_input)
 
@@ -297,5 +307,43 @@ async def test_sequential_invoke_exception_error(
     mocker.patch(
         "sk_agents.skagents.v1.sequential.sequential_skagents.ChatHistory", new=MockChatHistory
     )
+    mocker.patch("sk_agents.skagents.v1.sequential.task_graph.ChatHistory", new=MockChatHistory)
     with pytest.raises(AgentInvokeException):
         await skagents.invoke(inputs=test_input)
+
+
+@pytest.mark.asyncio
+async def test_sequential_invoke_stream_separates_extra_data(
+    config, mock_task_builder, mock_kernel_builder, task_invoke_response_mock, mocker
+) -> None:
+    """
+    Test:
+    Extra data from the final task is collected and streamed as is, while
+    model output is streamed without being parsed, even if it is JSON
+    """
+    mocker.patch(
+        "sk_agents.skagents.v1.sequential.sequential_skagents.get_telemetry",
+        return_value=MockTelemetry(),
+    )
+    mocker.patch(
+        "sk_agents.skagents.v1.sequential.sequential_skagents.get_token_usage_for_response",
+        return_value=TokenUsage(completion_tokens=0, prompt_tokens=0, total_tokens=0),
+    )
+    element = ExtraDataElement(key="k", value="v")
+    extra_data = ExtraDataPartial(extra_data=ExtraData(items=[element]))
+
+    async def mock_invoke_stream(*args, **kwargs):
+        yield mocker.Mock(content="{}")
+        yield extra_data
+
+    mocker.patch(
+        "sk_agents.skagents.v1.sequential.task.Task.invoke_stream", side_effect=mock_invoke_stream
+    )
+    skagents = SequentialSkagents(config, mock_kernel_builder, mock_task_builder)
+
+    responses = [r async for r in skagents.invoke_stream(inputs={"chat_history": []})]
+
+    assert responses[1].output_partial == "{}"
+    assert responses[2] is extra_data
+    assert responses[-1].output_raw == "{}"
+    assert responses[-1].extra_data.items[0].key == "k"
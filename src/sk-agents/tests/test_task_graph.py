@@ -0,0 +1,126 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from semantic_kernel.contents import AuthorRole, ChatMessageContent
+from semantic_kernel.contents.chat_history import ChatHistory
+
+from sk_agents.exceptions import InvalidConfigException
+from sk_agents.ska_types import InvokeResponse, TokenUsage
+from sk_agents.skagents.v1.sequential.config import TaskConfig
+from sk_agents.skagents.v1.sequential.task_graph import TaskGraphRun, get_task_dependencies
+
+
+def _config(name, task_no, instructions="Do it", depends_on=None):
+    return TaskConfig(
+        name=name,
+        task_no=task_no,
+        description=name,
+        instructions=instructions,
+        agent="default",
+        depends_on=depends_on,
+    )
+
+
+def test_tasks_without_depends_on_run_in_sequence():
+    dependencies = get_task_dependencies([_config("a", 1), _config("b", 2), _config("c", 3)])
+    assert dependencies == [frozenset(), frozenset({0}), frozenset({0, 1})]
+
+
+def test_dependencies_include_referenced_outputs_and_their_dependencies():
+    dependencies = get_task_dependencies(
+        [
+            _config("a", 1, depends_on=[]),
+            _config("b", 2, depends_on=["a"]),
+            _config("c", 3, depends_on=[]),
+            _config("d", 4, "Combine {{_b}} with {{_unknown}}", depends_on=[]),
+        ]
+    )
+    assert dependencies == [frozenset(), frozenset({0}), frozenset(), frozenset({0, 1})]
+
+
+@pytest.mark.parametrize("depends_on", [["missing"], ["b"]])
+def test_invalid_dependencies(depends_on):
+    with pytest.raises(InvalidConfigException):
+        get_task_dependencies([_config("a", 1, depends_on=depends_on), _config("b", 2)])
+
+
+class FakeTask:
+    def __init__(self, name, delay=0.0, error=None):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.seen = None
+
+    async def invoke(self, history, inputs):
+        self.seen = ([m.content for m in history.messages], dict(inputs))
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        history.add_message(ChatMessageContent(role=AuthorRole.ASSISTANT, content=self.name))
+        return InvokeResponse(
+            token_usage=TokenUsage(completion_tokens=0, prompt_tokens=0, total_tokens=0),
+            output_raw=f"{self.name} output",
+        )
+
+
+def _run(tasks, dependencies, max_concurrent_tasks=4):
+    history = ChatHistory()
+    history.add_user_message("request")
+    inputs = {"topic": "x", "embedded_image": MagicMock()}
+    return TaskGraphRun(tasks, dependencies, history, inputs, max_concurrent_tasks)
+
+
+@pytest.mark.asyncio
+async def test_independent_tasks_run_concurrently():
+    tasks = [FakeTask("a", 0.2), FakeTask("b", 0.2), FakeTask("c")]
+    run = _run(tasks, [frozenset(), frozenset(), frozenset({0, 1})])
+
+    start = asyncio.get_running_loop().time()
+    run.start(3)
+    await run.result(2)
+    assert asyncio.get_running_loop().time() - start < 0.35
+
+    history, inputs = tasks[2].seen
+    assert history == ["request", "a", "b"]
+    assert inputs["_a"] == "a output"
+    assert inputs["_b"] == "b output"
+    assert "embedded_image" in tasks[0].seen[1]
+    assert "embedded_image" not in inputs
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped():
+    tasks = [FakeTask("a", 0.1), FakeTask("b", 0.1)]
+    run = _run(tasks, [frozenset(), frozenset()], max_concurrent_tasks=1)
+
+    start = asyncio.get_running_loop().time()
+    run.start(2)
+    await run.result(1)
+    await run.result(0)
+    assert asyncio.get_running_loop().time() - start >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_tasks_only_see_their_dependencies():
+    tasks = [FakeTask("a"), FakeTask("b"), FakeTask("c")]
+    run = _run(tasks, [frozenset(), frozenset(), frozenset({1})])
+    run.start(3)
+    await run.result(2)
+
+    history, inputs = tasks[2].seen
+    assert history == ["request", "b"]
+    assert "_a" not in inputs
+
+
+@pytest.mark.asyncio
+async def test_failure_propagates_to_dependent_tasks():
+    tasks = [FakeTask("a", error=ValueError("boom")), FakeTask("b"), FakeTask("c", 10)]
+    run = _run(tasks, [frozenset(), frozenset({0}), frozenset()])
+    run.start(3)
+
+    with pytest.raises(ValueError):
+        await run.result(1)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run.result(2)
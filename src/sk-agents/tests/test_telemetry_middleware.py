@@ -0,0 +1,101 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from sk_agents.middleware import TelemetryMiddleware
+
+
+def _create_app(st):
+    app = FastAPI()
+
+    @app.get("/agent/sse")
+    async def sse():
+        async def events():
+            for i in range(3):
+                await asyncio.sleep(0.01)
+                yield f"data: {i}\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/agent/tasks/{task_id}")
+    async def task(task_id: str):
+        return {"task_id": task_id}
+
+    @app.get("/agent/openapi.json")
+    async def openapi():
+        return {}
+
+    app.add_middleware(TelemetryMiddleware, st=st)
+    return app
+
+
+def _telemetry(enabled=True):
+    st = MagicMock()
+    st.telemetry_enabled.return_value = enabled
+    return st
+
+
+def test_span_stays_open_until_stream_ends():
+    st = _telemetry()
+    span = st.tracer.start_as_current_span.return_value.__enter__.return_value
+    client = TestClient(_create_app(st))
+
+    response = client.get("/agent/sse")
+
+    assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+    st.tracer.start_as_current_span.assert_called_once()
+    assert st.tracer.start_as_current_span.call_args.args == ("GET /agent/sse",)
+    attributes = {call.args[0]: call.args[1] for call in span.set_attribute.call_args_list}
+    assert attributes["http.status_code"] == 200
+    assert attributes["http.duration_ms"] >= 30
+    assert attributes["http.duration_ms"] > attributes["http.time_to_first_byte_ms"]
+    route, status_code, ttfb_ms, duration_ms = st.metrics.record_http_response.call_args.args
+    assert (route, status_code) == ("/agent/sse", 200)
+    assert duration_ms == attributes["http.duration_ms"]
+    st.metrics.track_in_flight.assert_called_once_with()
+
+
+def test_metrics_use_route_template():
+    st = _telemetry()
+    span = st.tracer.start_as_current_span.return_value.__enter__.return_value
+    client = TestClient(_create_app(st))
+
+    assert client.get("/agent/tasks/abc123").status_code == 200
+
+    route, status_code, _, _ = st.metrics.record_http_response.call_args.args
+    assert (route, status_code) == ("/agent/tasks/{task_id}", 200)
+    span.update_name.assert_called_once_with("GET /agent/tasks/{task_id}")
+
+
+def test_unmatched_paths_share_one_route():
+    st = _telemetry()
+    span = st.tracer.start_as_current_span.return_value.__enter__.return_value
+    client = TestClient(_create_app(st))
+
+    assert client.get("/agent/unknown/abc123").status_code == 404
+
+    route, status_code, _, _ = st.metrics.record_http_response.call_args.args
+    assert (route, status_code) == ("unmatched", 404)
+    span.update_name.assert_not_called()
+
+
+def test_excluded_paths_are_not_traced():
+    st = _telemetry()
+    client = TestClient(_create_app(st))
+
+    response = client.get("/agent/openapi.json")
+
+    assert response.status_code == 200
+    st.tracer.start_as_current_span.assert_not_called()
+    st.metrics.record_http_response.assert_called_once()
+
+
+def test_telemetry_disabled():
+    st = _telemetry(enabled=False)
+    client = TestClient(_create_app(st))
+
+    assert client.get("/agent/sse").status_code == 200
+    st.tracer.start_as_current_span.assert_not_called()
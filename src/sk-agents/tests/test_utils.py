@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 import pytest
 
+from sk_agents.extra_data_collector import ExtraData, ExtraDataElement, ExtraDataPartial
 from sk_agents.ska_types import IntermediateTaskResponse, InvokeResponse, PartialResponse
 from sk_agents.utils import (
     docstring_parameter,
@@ -130,6 +131,14 @@ def test_get_sse_event_known_responses(dummy_response_objects):
             assert str(getattr(response, key, "")) in data_json or key in data_json
 
 
+def test_get_sse_event_for_extra_data():
+    extra_data = ExtraDataPartial(
+        extra_data=ExtraData(items=[ExtraDataElement(key="k", value="v")])
+    )
+    result = get_sse_event_for_response(extra_data)
+    assert result == f"event: extra-data\ndata: {extra_data.model_dump_json()}\n\n"
+
+
 def test_get_sse_event_logs_exception(monkeypatch, dummy_response_objects):
     intermediate_resp, _, _ = dummy_response_objects  # Unpack just the IntermediateTaskResponse
 